@@ -4,14 +4,21 @@
 リフレッシュトークンを使用したアクセストークンの取得・更新を実装します。
 """
 
+import asyncio
+import contextlib
+import hashlib
 import json
 import logging
 import os
-from datetime import datetime, timedelta
+import re
+import tempfile
+import time
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
+from urllib.parse import urlencode
 
 import httpx
+import orjson
 
 from .config import GoogleCalendarConfig
 from .exceptions import (
@@ -23,6 +30,50 @@ from .exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# 有効期限の何秒前に期限切れとみなすか（安全マージン: 5分）
+_TOKEN_EXPIRY_MARGIN_SECONDS = 300
+
+# トークン寿命のどの時点でバックグラウンド更新を行うか（寿命の80%経過時）
+_BACKGROUND_REFRESH_RATIO = 0.8
+
+# .envファイルのKEY=VALUE行にマッチする正規表現（行頭の空白と"="前後の空白を許容）
+_ENV_KEY_RE = re.compile(rb"^[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*=", re.MULTILINE)
+
+# トークンエンドポイント用の共有HTTPクライアント（プロセス内で1つ）
+# インスタンスごとにコネクションプールを作らず、TLS接続を使い回す
+_shared_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_shared_client() -> httpx.AsyncClient:
+    """トークンエンドポイント用の共有HTTPクライアントを取得.
+
+    初回呼び出し時（またはクローズ後）にクライアントを生成します。
+    生成処理にawaitを含まないため、asyncioの協調スケジューリング下では
+    ロックなしで二重生成は起きません。
+
+    Returns:
+        httpx.AsyncClient: 共有HTTPクライアント
+    """
+    global _shared_client
+    if _shared_client is None or _shared_client.is_closed:
+        _shared_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(60.0),
+            limits=httpx.Limits(max_keepalive_connections=20, keepalive_expiry=300),
+            http2=True,
+        )
+    return _shared_client
+
+
+async def close_shared_client() -> None:
+    """共有HTTPクライアントを閉じる.
+
+    プロセス終了時に一度だけ呼び出します。
+    """
+    global _shared_client
+    if _shared_client is not None:
+        await _shared_client.aclose()
+        _shared_client = None
+
 
 def _mask_token(token: str, visible_chars: int = 4) -> str:
     """トークンをマスキングして安全に表示.
@@ -39,11 +90,99 @@ def _mask_token(token: str, visible_chars: int = 4) -> str:
     return f"****{token[-visible_chars:]}"
 
 
+def _refresh_token_fingerprint(refresh_token: str) -> str:
+    """トークンキャッシュの照合に使うリフレッシュトークンの指紋を計算.
+
+    リフレッシュトークン自体はキャッシュファイルに書き込まず、
+    SHA-256ハッシュのみを保存します。
+
+    Args:
+        refresh_token: リフレッシュトークン
+
+    Returns:
+        str: SHA-256ハッシュ（16進文字列）
+    """
+    return hashlib.sha256(refresh_token.encode("utf-8")).hexdigest()
+
+
+def _load_token_cache(cache_path: Path) -> Optional[dict[str, Any]]:
+    """アクセストークンのキャッシュファイルを読み込む.
+
+    Args:
+        cache_path: キャッシュファイルのパス
+
+    Returns:
+        Optional[dict[str, Any]]: キャッシュ内容。存在しない・読み込めない場合はNone
+    """
+    try:
+        with open(cache_path, "rb") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning(
+            "トークンキャッシュの読み込みに失敗しました: %s",
+            e,
+            extra={"extra_fields": {"cache_path": str(cache_path)}},
+        )
+        return None
+
+    return data if isinstance(data, dict) else None
+
+
+def _write_token_cache(cache_path: Path, data: dict[str, Any]) -> None:
+    """アクセストークンをキャッシュファイルに書き込む.
+
+    一時ファイルに書き込んでからos.replaceで置き換えるため、
+    書き込み途中でプロセスが停止してもキャッシュが壊れません。
+
+    Args:
+        cache_path: キャッシュファイルのパス
+        data: 書き込む内容（access_token, expires_atなど）
+
+    Note:
+        - ファイルパーミッションは600（所有者のみ読み書き可能）に設定されます
+        - 一時ファイルは作成時点で600のため、トークンが他ユーザーに見える瞬間はありません
+        - 一時ファイル名は書き込みごとに一意のため、複数プロセスが同時に書き込んでも競合しません
+        - 書き込み失敗時はログを出力して続行（アプリは停止させない）
+    """
+    tmp_path: Optional[Path] = None
+    try:
+        # キャッシュディレクトリは所有者のみアクセス可能にする
+        cache_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w",
+            encoding="utf-8",
+            dir=cache_path.parent,
+            prefix=f".{cache_path.name}.",
+            delete=False,
+        ) as tmp:
+            tmp_path = Path(tmp.name)
+            json.dump(data, tmp)
+        os.replace(tmp_path, cache_path)
+    except Exception as e:
+        if tmp_path is not None:
+            tmp_path.unlink(missing_ok=True)
+        # エラーが発生してもアプリは停止させない
+        logger.error(
+            "トークンキャッシュの更新に失敗しました: %s",
+            e,
+            extra={
+                "extra_fields": {
+                    "cache_path": str(cache_path),
+                    "error_type": type(e).__name__,
+                }
+            },
+        )
+
+
 def _update_env_file(env_file_path: Path, updates: dict[str, str]) -> None:
     """環境変数ファイル(.env)を更新.
 
-    既存のファイルを読み込み、指定されたキーの値を更新します。
+    既存のファイルをバイト列として一度だけ読み込み、正規表現で
+    KEY=VALUE行を走査して指定されたキーの行だけを差し替えます。
     ファイルが存在しない場合は新規作成します。
+    値に変更がない場合はファイルを書き換えません。
 
     Args:
         env_file_path: .envファイルのパス
@@ -51,59 +190,68 @@ def _update_env_file(env_file_path: Path, updates: dict[str, str]) -> None:
 
     Note:
         - ファイルパーミッションは600（所有者のみ読み書き可能）に設定されます
+        - 同じディレクトリの一時ファイルに書き込んでからos.replaceで置き換えるため、
+          書き込み途中の状態が残ることはありません
         - 書き込み失敗時はログを出力して続行（アプリは停止させない）
+        - ブロッキングI/Oのため、非同期コードからはasyncio.to_threadで呼び出します
     """
+    tmp_path: Optional[Path] = None
     try:
-        # 既存の.envファイルを読み込み
-        if env_file_path.exists():
-            with open(env_file_path, "r", encoding="utf-8") as f:
-                lines = f.readlines()
-        else:
-            lines = []
-            logger.info(f".envファイルが存在しないため新規作成します: {env_file_path}")
+        try:
+            content = env_file_path.read_bytes()
+        except FileNotFoundError:
+            content = b""
+            logger.info(".envファイルが存在しないため新規作成します: %s", env_file_path)
 
-        # 更新する行のインデックスを記録
+        # 更新対象のキーの行だけを新しい値に差し替える（コメント・空行はそのまま）
+        chunks: list[bytes] = []
         updated_keys = set()
-        new_lines = []
-
-        for line in lines:
-            stripped = line.strip()
-            # コメント行または空行はそのまま保持
-            if not stripped or stripped.startswith("#"):
-                new_lines.append(line)
+        pos = 0
+        for match in _ENV_KEY_RE.finditer(content):
+            key = match.group(1).decode("ascii")
+            if key not in updates:
                 continue
-
-            # KEY=VALUE形式をパース
-            if "=" in stripped:
-                key = stripped.split("=", 1)[0].strip()
-                if key in updates:
-                    # 更新対象のキーの場合は新しい値に置き換え
-                    new_lines.append(f"{key}={updates[key]}\n")
-                    updated_keys.add(key)
-                else:
-                    # それ以外はそのまま保持
-                    new_lines.append(line)
-            else:
-                new_lines.append(line)
+            line_end = content.find(b"\n", match.end())
+            line_end = len(content) if line_end == -1 else line_end + 1
+            chunks.append(content[pos : match.start()])
+            chunks.append(f"{key}={updates[key]}\n".encode())
+            updated_keys.add(key)
+            pos = line_end
+        chunks.append(content[pos:])
 
         # まだ追加されていないキーを末尾に追加
+        if content and not content.endswith(b"\n") and len(updated_keys) < len(updates):
+            chunks.append(b"\n")
         for key, value in updates.items():
             if key not in updated_keys:
-                new_lines.append(f"{key}={value}\n")
+                chunks.append(f"{key}={value}\n".encode())
+
+        new_content = b"".join(chunks)
+        if new_content == content:
+            # 値に変更がない場合は書き換えない
+            return
 
-        # ファイルに書き込み
-        with open(env_file_path, "w", encoding="utf-8") as f:
-            f.writelines(new_lines)
+        with tempfile.NamedTemporaryFile(
+            dir=env_file_path.parent,
+            prefix=f".{env_file_path.name}.",
+            delete=False,
+        ) as tmp:
+            tmp_path = Path(tmp.name)
+            tmp.write(new_content)
 
         # ファイルパーミッションを600に設定（所有者のみ読み書き可能）
-        os.chmod(env_file_path, 0o600)
+        os.chmod(tmp_path, 0o600)
+        os.replace(tmp_path, env_file_path)
 
-        logger.info(f".envファイルを更新しました: {env_file_path}")
+        logger.info(".envファイルを更新しました: %s", env_file_path)
 
     except Exception as e:
+        if tmp_path is not None:
+            tmp_path.unlink(missing_ok=True)
         # エラーが発生してもアプリは停止させない
         logger.error(
-            f".envファイルの更新に失敗しました: {e}",
+            ".envファイルの更新に失敗しました: %s",
+            e,
             extra={
                 "extra_fields": {
                     "env_file_path": str(env_file_path),
@@ -128,6 +276,19 @@ class GoogleCalendarAuth:
         >>> access_token = await auth.get_access_token()
     """
 
+    # セッションごとに生成されても軽量なよう、インスタンス辞書を持たせない
+    __slots__ = (
+        "config",
+        "_access_token",
+        "_expiry_monotonic",
+        "_refresh_lock",
+        "_token_post_headers",
+        "_cached_token_body",
+        "_cached_token_body_key",
+        "_refresh_handle",
+        "_refresh_task",
+    )
+
     def __init__(self, config: GoogleCalendarConfig) -> None:
         """GoogleCalendarAuthを初期化.
 
@@ -136,15 +297,141 @@ class GoogleCalendarAuth:
         """
         self.config = config
         self._access_token: Optional[str] = config.google_access_token or None
-        self._token_expiry: Optional[datetime] = None
-        self._client = httpx.AsyncClient(timeout=60.0)
+        # 期限切れとみなす時刻（time.monotonic()基準、安全マージン込み）
+        self._expiry_monotonic: float = 0.0
+        self._load_cached_token()
+        # 並行するコルーチンからの同時リフレッシュを1回にまとめるためのロック
+        self._refresh_lock = asyncio.Lock()
+        # トークンエンドポイントへのリクエストヘッダーとエンコード済みボディ
+        # （ボディは認証情報が変わったときだけ作り直す）
+        self._token_post_headers = {"Content-Type": "application/x-www-form-urlencoded"}
+        self._cached_token_body: Optional[bytes] = None
+        self._cached_token_body_key: Optional[tuple[str, str, str]] = None
+        # 有効期限前に先回りしてトークンを更新するためのタイマーとタスク
+        self._refresh_handle: Optional[asyncio.TimerHandle] = None
+        self._refresh_task: Optional[asyncio.Task[None]] = None
+
+    def _load_cached_token(self) -> None:
+        """キャッシュファイルから有効なアクセストークンを復元.
+
+        前回起動時に取得したトークンがまだ有効であれば、
+        起動直後のトークン更新リクエストを省略できます。
+        キャッシュファイルは複数の設定（.env）から共有されうるため、
+        クライアントIDとリフレッシュトークンの両方が一致する場合のみ使用します。
+        """
+        cached = _load_token_cache(self.config.get_token_cache_path())
+        if (
+            not cached
+            or cached.get("client_id") != self.config.google_client_id
+            or cached.get("refresh_token_sha256")
+            != _refresh_token_fingerprint(self.config.google_refresh_token)
+        ):
+            return
+
+        access_token = cached.get("access_token")
+        expires_at = cached.get("expires_at")
+        if not access_token or not isinstance(expires_at, (int, float)):
+            return
+
+        remaining = expires_at - time.time()
+        if remaining <= _TOKEN_EXPIRY_MARGIN_SECONDS:
+            return
+
+        self._access_token = access_token
+        self._expiry_monotonic = (
+            time.monotonic() + remaining - _TOKEN_EXPIRY_MARGIN_SECONDS
+        )
+        logger.info(
+            "Loaded cached access token: %s. Expires in %d seconds.",
+            _mask_token(access_token),
+            remaining,
+        )
 
     async def close(self) -> None:
-        """HTTPクライアントを閉じる.
+        """リソースを解放する.
+
+        予約済みのバックグラウンド更新をキャンセルします。
+        HTTPクライアントはプロセス内で共有しているため、ここでは閉じません。
+        共有クライアントはclose_shared_client()で閉じます。
+        """
+        if self._refresh_handle is not None:
+            self._refresh_handle.cancel()
+            self._refresh_handle = None
+
+        task = self._refresh_task
+        self._refresh_task = None
+        if task is not None and not task.done() and task is not asyncio.current_task():
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    def start_background_refresh(self) -> None:
+        """起動時にトークンのバックグラウンド更新を開始.
+
+        イベントループ上で1回だけ呼び出します。キャッシュから復元した有効なトークンが
+        ある場合は期限切れとみなされる時刻に更新を予約し、ない場合は直ちに
+        バックグラウンドで取得を始めます。これにより最初のツール呼び出しや
+        有効期限の切り替わり時に、リクエストがトークン更新を待たされにくくなります。
+        """
+        if self._refresh_handle is not None or self._refresh_task is not None:
+            return
+
+        remaining = self._expiry_monotonic - time.monotonic()
+        if self._access_token and remaining > 0:
+            loop = asyncio.get_running_loop()
+            self._refresh_handle = loop.call_later(
+                remaining, self._start_background_refresh
+            )
+        else:
+            self._start_background_refresh()
+
+    def _schedule_background_refresh(self, expires_in: float) -> None:
+        """トークン寿命の一定割合が経過した時点でのバックグラウンド更新を予約.
+
+        呼び出し元がOAuthの往復を待たされないよう、期限切れになる前に
+        トークンを先回りして更新します。既存の予約は置き換えられます。
+
+        Args:
+            expires_in: 取得したトークンの有効期間（秒）
+        """
+        if self._refresh_handle is not None:
+            self._refresh_handle.cancel()
+
+        loop = asyncio.get_running_loop()
+        self._refresh_handle = loop.call_later(
+            expires_in * _BACKGROUND_REFRESH_RATIO, self._start_background_refresh
+        )
+
+    def _start_background_refresh(self) -> None:
+        """予約時刻にバックグラウンド更新タスクを起動（call_laterのコールバック）."""
+        self._refresh_handle = None
+        self._refresh_task = asyncio.create_task(self._background_refresh())
+
+    async def _background_refresh(self) -> None:
+        """バックグラウンドでトークンを更新.
+
+        失敗してもプロセスは停止させず、ログに記録するのみとします。
+        その場合は次回のget_access_token()呼び出し時に通常の更新が行われます。
+        """
+        try:
+            async with self._refresh_lock:
+                await self.refresh_access_token()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(
+                "Background token refresh failed: %s",
+                e,
+                extra={"extra_fields": {"error_type": type(e).__name__}},
+            )
 
-        リソースを解放するために、使用後に呼び出す必要があります。
+    async def _get_client(self) -> httpx.AsyncClient:
+        """トークン更新に使用するHTTPクライアントを取得.
+
+        Returns:
+            httpx.AsyncClient: 共有HTTPクライアント
         """
-        await self._client.aclose()
+        return _get_shared_client()
 
     async def __aenter__(self) -> "GoogleCalendarAuth":
         """コンテキストマネージャーの開始（async with用）.
@@ -170,17 +457,29 @@ class GoogleCalendarAuth:
         Returns:
             bool: トークンが期限切れまたは存在しない場合はTrue
         """
-        if not self._access_token or not self._token_expiry:
-            return True
+        # 安全マージンは_expiry_monotonicの計算時に織り込み済み
+        return not self._access_token or time.monotonic() >= self._expiry_monotonic
 
-        # 有効期限の5分前に期限切れと判定（安全マージン）
-        return datetime.utcnow() >= self._token_expiry - timedelta(minutes=5)
+    def peek_access_token(self) -> Optional[str]:
+        """有効なアクセストークンがあれば更新せずに返す.
+
+        awaitを伴わずに現在のトークンを参照するための高速パスです。
+
+        Returns:
+            Optional[str]: 有効なアクセストークン（期限切れまたは未取得の場合はNone）
+        """
+        token = self._access_token
+        if token and time.monotonic() < self._expiry_monotonic:
+            return token
+        return None
 
     async def get_access_token(self) -> str:
         """有効なアクセストークンを取得（必要に応じて更新）.
 
         トークンが期限切れの場合、リフレッシュトークンを使用して
         新しいアクセストークンを取得します。
+        複数のコルーチンが同時に呼び出した場合でも、リフレッシュは1回だけ実行され、
+        他の呼び出し元は更新後のトークンを共有します（ダブルチェックロッキング）。
 
         Returns:
             str: アクセストークン
@@ -189,9 +488,16 @@ class GoogleCalendarAuth:
             GoogleAuthenticationError: 認証に失敗した場合
             NetworkError: ネットワークエラーが発生した場合
         """
-        if self.is_token_expired():
-            logger.info("Access token expired or missing. Refreshing token...")
-            await self.refresh_access_token()
+        # 高速パス: 有効なトークンがあればメソッド呼び出しなしで即座に返す
+        token = self._access_token
+        if token and time.monotonic() < self._expiry_monotonic:
+            return token
+
+        async with self._refresh_lock:
+            # ロック待機中に他のコルーチンが更新済みの場合はスキップ
+            if self.is_token_expired():
+                logger.info("Access token expired or missing. Refreshing token...")
+                await self.refresh_access_token()
 
         if not self._access_token:
             raise GoogleAuthenticationError(
@@ -232,23 +538,17 @@ class GoogleCalendarAuth:
                 config_key="GOOGLE_REFRESH_TOKEN",
             )
 
-        # リクエストボディの構築
-        request_data = {
-            "client_id": self.config.google_client_id,
-            "client_secret": self.config.google_client_secret,
-            "refresh_token": self.config.google_refresh_token,
-            "grant_type": "refresh_token",
-        }
+        # リクエストボディの構築（認証情報が変わらない限りキャッシュを再利用）
+        request_body = self._build_token_body()
 
-        logger.debug(
-            f"Requesting new access token from {self.config.google_token_uri}"
-        )
+        logger.debug("Requesting new access token from %s", self.config.google_token_uri)
 
         try:
-            response = await self._client.post(
+            client = await self._get_client()
+            response = await client.post(
                 self.config.google_token_uri,
-                data=request_data,
-                headers={"Content-Type": "application/x-www-form-urlencoded"},
+                content=request_body,
+                headers=self._token_post_headers,
             )
 
             # エラーレスポンスのハンドリング
@@ -256,7 +556,7 @@ class GoogleCalendarAuth:
                 self._handle_token_error_response(response)
 
             # レスポンスのパース
-            token_data = response.json()
+            token_data = orjson.loads(response.content)
 
             # アクセストークンの取得
             access_token = token_data.get("access_token")
@@ -267,35 +567,49 @@ class GoogleCalendarAuth:
                 )
 
             # トークンの有効期限を計算（デフォルト: 3600秒）
+            # 有効期限の5分前に期限切れと判定する（安全マージン）
             expires_in = token_data.get("expires_in", 3600)
-            self._token_expiry = datetime.utcnow() + timedelta(seconds=expires_in)
+            self._expiry_monotonic = (
+                time.monotonic() + expires_in - _TOKEN_EXPIRY_MARGIN_SECONDS
+            )
 
-            # トークンを保存
+            # トークンを保存し、期限切れ前のバックグラウンド更新を予約
             self._access_token = access_token
+            self._schedule_background_refresh(expires_in)
 
-            # 新しいリフレッシュトークンが返された場合は更新
+            # アクセストークンをキャッシュファイルに永続化（イベントループを止めない）
+            # 別アカウントのリフレッシュトークンから読み込まれないよう指紋も保存する
+            # （新しいリフレッシュトークンが返された場合はそちらの指紋）
             new_refresh_token = token_data.get("refresh_token")
+            await asyncio.to_thread(
+                _write_token_cache,
+                self.config.get_token_cache_path(),
+                {
+                    "client_id": self.config.google_client_id,
+                    "refresh_token_sha256": _refresh_token_fingerprint(
+                        new_refresh_token or self.config.google_refresh_token
+                    ),
+                    "access_token": access_token,
+                    "expires_at": time.time() + expires_in,
+                },
+            )
 
-            # .envファイルにトークンを永続化
-            env_updates = {
-                "GOOGLE_ACCESS_TOKEN": access_token,
-            }
-
+            # 新しいリフレッシュトークンが返された場合のみ.envファイルを更新
             if new_refresh_token:
-                # 新しいリフレッシュトークンが含まれている場合は更新
-                env_updates["GOOGLE_REFRESH_TOKEN"] = new_refresh_token
                 self.config.google_refresh_token = new_refresh_token
                 logger.info(
-                    f"New refresh token received: {_mask_token(new_refresh_token)}"
+                    "New refresh token received: %s", _mask_token(new_refresh_token)
+                )
+                await asyncio.to_thread(
+                    _update_env_file,
+                    self.config.get_env_file_path(),
+                    {"GOOGLE_REFRESH_TOKEN": new_refresh_token},
                 )
-
-            # .envファイルを更新
-            env_file_path = self.config.get_env_file_path()
-            _update_env_file(env_file_path, env_updates)
 
             logger.info(
-                f"Successfully refreshed access token: {_mask_token(access_token)}. "
-                f"Expires in {expires_in} seconds."
+                "Successfully refreshed access token: %s. Expires in %s seconds.",
+                _mask_token(access_token),
+                expires_in,
             )
 
             return access_token
@@ -312,13 +626,40 @@ class GoogleCalendarAuth:
                 details={"token_uri": self.config.google_token_uri},
                 original_error=e,
             )
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             raise GoogleAuthenticationError(
                 message="トークンレスポンスのパースに失敗しました",
                 details={"response_text": response.text[:200]},
                 original_error=e,
             )
 
+    def _build_token_body(self) -> bytes:
+        """トークン更新リクエストのボディ（URLエンコード済み）を取得.
+
+        client_id・client_secret・refresh_tokenの組が前回と同じ場合は
+        キャッシュしたバイト列を返します。リフレッシュトークンが
+        ローテーションされた場合は自動的に作り直されます。
+
+        Returns:
+            bytes: application/x-www-form-urlencoded形式のボディ
+        """
+        key = (
+            self.config.google_client_id,
+            self.config.google_client_secret,
+            self.config.google_refresh_token,
+        )
+        if self._cached_token_body is None or self._cached_token_body_key != key:
+            self._cached_token_body = urlencode(
+                {
+                    "client_id": key[0],
+                    "client_secret": key[1],
+                    "refresh_token": key[2],
+                    "grant_type": "refresh_token",
+                }
+            ).encode("ascii")
+            self._cached_token_body_key = key
+        return self._cached_token_body
+
     def _handle_token_error_response(self, response: httpx.Response) -> None:
         """トークン取得エラーレスポンスを処理.
 
@@ -328,16 +669,19 @@ class GoogleCalendarAuth:
         Raises:
             GoogleAuthenticationError: 認証エラー
         """
+        # 同じエラーコード（invalid_grantなど）でも原因はerror_descriptionにしか
+        # 含まれないため、エラー時は常にJSONをパースしてGoogleの説明文を残す
         try:
-            error_data = response.json()
+            error_data = orjson.loads(response.content)
             error_message = error_data.get("error_description", error_data.get("error", "Unknown error"))
             error_code = error_data.get("error", "unknown_error")
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             error_message = f"HTTP {response.status_code}: {response.text[:200]}"
             error_code = "parse_error"
 
         logger.error(
-            f"Token refresh failed: {error_message}",
+            "Token refresh failed: %s",
+            error_message,
             extra={
                 "extra_fields": {
                     "status_code": response.status_code,
@@ -4,17 +4,29 @@
 レート制限、エラーハンドリング、リトライ処理を含みます。
 """
 
+import asyncio
 import logging
+import random
+import time
+import uuid
+import warnings
+from collections.abc import AsyncIterator, Sequence
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Optional
+from urllib.parse import urlencode
 
 import httpx
+import orjson
+from pydantic import TypeAdapter, ValidationError
 
 from .auth import GoogleCalendarAuth
 from .config import GoogleCalendarConfig
 from .exceptions import (
     DataParsingError,
     GoogleAuthenticationError,
+    GoogleCalendarAPIError,
+    GoogleCalendarMCPError,
     GoogleNotFoundError,
     GooglePermissionError,
     GoogleRateLimitError,
@@ -28,6 +40,254 @@ from .rate_limiter import RateLimiter
 
 logger = logging.getLogger(__name__)
 
+# Calendar APIは単一ホスト（www.googleapis.com）宛てなので、
+# コネクションを長めに保持してTLSハンドシェイクを使い回す
+_API_POOL_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=50,
+    keepalive_expiry=60.0,
+)
+
+# イベントリストを1回の呼び出しでまとめてバリデーションするためのアダプター
+_EVENT_LIST_ADAPTER = TypeAdapter(list[CalendarEvent])
+
+# カレンダー一覧キャッシュの有効期間（秒）
+# 期間内はAPIを呼ばずにキャッシュを返し、経過後はETagで再検証する
+_CALENDAR_LIST_TTL_SECONDS = 300.0
+
+# バッチリクエスト1回あたりに含めるサブリクエストの上限
+# https://developers.google.com/calendar/api/guides/batch
+_BATCH_MAX_REQUESTS = 50
+
+# リトライ時の指数バックオフの初期値と上限（秒）
+_RETRY_BASE_DELAY = 0.1
+_RETRY_MAX_DELAY = 30.0
+
+# Retry-Afterに加えるジッターの幅（±20%）
+_RETRY_AFTER_JITTER = 0.2
+
+
+@lru_cache(maxsize=32)
+def _encode_events_query(max_results: int, single_events: bool, order_by: str) -> str:
+    """イベント一覧取得の固定部分のクエリ文字列をエンコード.
+
+    同じ組み合わせのクエリは毎回エンコードせずにキャッシュから返します。
+
+    Args:
+        max_results: 1ページあたりの取得件数
+        single_events: 定期イベントを個別のインスタンスに展開するか
+        order_by: ソート順
+
+    Returns:
+        str: URLエンコード済みのクエリ文字列
+    """
+    # 真偽値はhttpxのパラメータエンコードと同じく小文字で送る
+    params = {
+        "maxResults": str(max_results),
+        "singleEvents": "true" if single_events else "false",
+    }
+    if single_events and order_by:
+        params["orderBy"] = order_by
+    return urlencode(params)
+
+
+def _encode_range_query(
+    time_min: Optional[datetime], time_max: Optional[datetime], fields: Optional[str]
+) -> str:
+    """イベント一覧取得の期間指定・取得フィールドのクエリ文字列をエンコード.
+
+    Args:
+        time_min: 開始時刻の下限
+        time_max: 開始時刻の上限
+        fields: 取得するフィールド（部分レスポンス、Noneの場合は全フィールド）
+
+    Returns:
+        str: "&"で始まるURLエンコード済みのクエリ文字列（指定がない場合は空文字列）
+    """
+    params: dict[str, str] = {}
+    if time_min:
+        params["timeMin"] = time_min.isoformat()
+    if time_max:
+        params["timeMax"] = time_max.isoformat()
+    if fields:
+        params["fields"] = fields
+    return f"&{urlencode(params)}" if params else ""
+
+
+def _build_batch_body(boundary: str, paths: Sequence[str]) -> bytes:
+    """バッチリクエスト（multipart/mixed）のボディを構築.
+
+    Args:
+        boundary: マルチパートの境界文字列
+        paths: 各サブリクエストのGETパス（"/calendar/v3/..."形式）
+
+    Returns:
+        bytes: バッチリクエストのボディ
+    """
+    parts = [
+        f"--{boundary}\r\n"
+        "Content-Type: application/http\r\n"
+        f"Content-ID: <item{index}>\r\n"
+        "\r\n"
+        f"GET {path}\r\n"
+        "\r\n"
+        for index, path in enumerate(paths)
+    ]
+    parts.append(f"--{boundary}--\r\n")
+    return "".join(parts).encode("utf-8")
+
+
+def _parse_batch_response(response: httpx.Response) -> dict[int, httpx.Response]:
+    """バッチレスポンス（multipart/mixed）をサブレスポンスに分解.
+
+    Args:
+        response: バッチリクエストのレスポンス
+
+    Returns:
+        dict[int, httpx.Response]: サブリクエストの番号 → サブレスポンス
+
+    Raises:
+        DataParsingError: レスポンスの形式が不正な場合
+    """
+    content_type = response.headers.get("Content-Type", "")
+    boundary = ""
+    for param in content_type.split(";")[1:]:
+        key, _, value = param.strip().partition("=")
+        if key.lower() == "boundary":
+            boundary = value.strip('"')
+    if not boundary:
+        raise DataParsingError(
+            message="バッチレスポンスの境界文字列が見つかりません",
+            details={"content_type": content_type},
+        )
+
+    results: dict[int, httpx.Response] = {}
+    # 先頭（プリアンブル）と末尾（"--"で終わるエピローグ）以外がサブレスポンス
+    for part in response.content.split(b"--" + boundary.encode("ascii"))[1:]:
+        if part.startswith(b"--"):
+            break
+        mime_headers, _, http_response = part.strip(b"\r\n").partition(b"\r\n\r\n")
+        head, _, body = http_response.partition(b"\r\n\r\n")
+        status_line, *header_lines = head.split(b"\r\n")
+
+        try:
+            # Content-ID: <response-item{番号}> からサブリクエストの番号を取得
+            index: Optional[int] = None
+            for line in mime_headers.split(b"\r\n"):
+                name, _, value = line.partition(b":")
+                if name.strip().lower() == b"content-id":
+                    marker = value.strip().strip(b"<>")
+                    index = int(marker.rpartition(b"item")[2])
+            status_code = int(status_line.split()[1])
+        except (ValueError, IndexError) as e:
+            raise DataParsingError(
+                message="バッチレスポンスのパースに失敗しました",
+                details={"part": part[:200].decode("utf-8", errors="replace")},
+                original_error=e,
+            )
+        if index is None:
+            raise DataParsingError(
+                message="バッチレスポンスのパースに失敗しました",
+                details={"part": part[:200].decode("utf-8", errors="replace")},
+            )
+
+        # Retry-Afterなどを参照できるようヘッダーも引き継ぐ
+        # （ボディは分解済みのバイト列を渡すため、長さと圧縮のヘッダーは除く）
+        headers = [
+            (name.strip(), value.strip())
+            for name, _, value in (line.partition(b":") for line in header_lines)
+            if name.strip().lower() not in (b"content-length", b"content-encoding")
+        ]
+        results[index] = httpx.Response(status_code, headers=headers, content=body.strip())
+    return results
+
+
+# プロセス内で共有するCalendar API用HTTPクライアント
+# （複数のGoogleCalendarClientでコネクションプールを共有する）
+_shared_http_client: Optional[httpx.AsyncClient] = None
+
+
+def _create_http_client() -> httpx.AsyncClient:
+    """Calendar API用に調整したHTTPクライアントを生成.
+
+    HTTP/2で1コネクション上に並行リクエストを多重化します。
+    リトライは_send_requestで制御するため、トランスポート側では行いません。
+
+    Returns:
+        httpx.AsyncClient: HTTPクライアント
+    """
+    return httpx.AsyncClient(
+        timeout=60.0,
+        transport=httpx.AsyncHTTPTransport(
+            http2=True,
+            retries=0,
+            limits=_API_POOL_LIMITS,
+        ),
+    )
+
+
+def get_shared_http_client() -> httpx.AsyncClient:
+    """プロセス内で共有するCalendar API用HTTPクライアントを取得.
+
+    初回呼び出し時（またはクローズ後）にクライアントを生成します。
+    GoogleCalendarClientのhttp_client引数に渡して使用します。
+
+    Returns:
+        httpx.AsyncClient: 共有HTTPクライアント
+    """
+    global _shared_http_client
+    if _shared_http_client is None or _shared_http_client.is_closed:
+        _shared_http_client = _create_http_client()
+    return _shared_http_client
+
+
+async def close_shared_http_client() -> None:
+    """共有HTTPクライアントを閉じる.
+
+    アプリケーション終了時に呼び出します。
+    """
+    global _shared_http_client
+    if _shared_http_client is not None:
+        await _shared_http_client.aclose()
+        _shared_http_client = None
+
+
+def _backoff_delay(attempt: int) -> float:
+    """ジッター付き指数バックオフの待機時間を計算.
+
+    並行する呼び出し元が同じタイミングで一斉にリトライしないよう、
+    指数バックオフの値を50〜100%の範囲でランダムに散らします。
+
+    Args:
+        attempt: 試行回数（0始まり）
+
+    Returns:
+        float: 待機時間（秒）
+    """
+    delay = min(_RETRY_MAX_DELAY, _RETRY_BASE_DELAY * 2**attempt)
+    return delay * (0.5 + random.random() * 0.5)
+
+
+def _retry_after_delay(response: httpx.Response, attempt: int) -> float:
+    """429レスポンスのRetry-Afterヘッダーから待機時間を計算.
+
+    Retry-Afterが秒数で指定されていればその値に±20%のジッターを加え、
+    ない場合（またはHTTP日付形式の場合）は指数バックオフの値を使います。
+
+    Args:
+        response: 429レスポンス
+        attempt: 試行回数（0始まり）
+
+    Returns:
+        float: 待機時間（秒）
+    """
+    try:
+        retry_after = float(response.headers["Retry-After"])
+    except (KeyError, ValueError):
+        return _backoff_delay(attempt)
+    jitter = 1.0 + random.uniform(-_RETRY_AFTER_JITTER, _RETRY_AFTER_JITTER)
+    return max(0.0, retry_after * jitter)
+
 
 class GoogleCalendarClient:
     """Google Calendar APIクライアント.
@@ -39,6 +299,7 @@ class GoogleCalendarClient:
         config: Google Calendar設定
         auth: 認証マネージャー（Noneの場合は自動作成）
         rate_limiter: レート制限（Noneの場合は自動作成）
+        http_client: 共有するHTTPクライアント（Noneの場合は専用のクライアントを作成）
 
     Example:
         >>> config = GoogleCalendarConfig()
@@ -46,11 +307,21 @@ class GoogleCalendarClient:
         ...     events = await client.list_events()
     """
 
+    # ステータスコード → (例外クラス, メッセージの接頭辞)
+    # 429と5xx/その他は追加情報が必要なため個別に処理する
+    _ERROR_MAP: dict[int, tuple[type[GoogleCalendarAPIError], str]] = {
+        400: (GoogleValidationError, "バリデーションエラー"),
+        401: (GoogleAuthenticationError, "認証エラー"),
+        403: (GooglePermissionError, "権限エラー"),
+        404: (GoogleNotFoundError, "リソースが見つかりません"),
+    }
+
     def __init__(
         self,
         config: GoogleCalendarConfig,
         auth: Optional[GoogleCalendarAuth] = None,
         rate_limiter: Optional[RateLimiter] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
     ) -> None:
         """GoogleCalendarClientを初期化.
 
@@ -58,7 +329,12 @@ class GoogleCalendarClient:
             config: Google Calendar設定
             auth: 認証マネージャー（Noneの場合は設定から自動作成）
             rate_limiter: レート制限（Noneの場合は設定から自動作成）
+            http_client: 共有するHTTPクライアント（Noneの場合は専用のクライアントを作成）。
+                渡されたクライアントはclose()で閉じません。
         """
+        # close()済みかどうか（__del__での閉じ忘れ検出に使用）
+        self._closed = False
+
         self.config = config
         self.auth = auth or GoogleCalendarAuth(config)
         self.rate_limiter = rate_limiter or RateLimiter(
@@ -66,21 +342,58 @@ class GoogleCalendarClient:
             capacity=config.rate_limit_burst,
         )
 
+        # 認証ヘッダーのキャッシュ（アクセストークンが変わったときだけ作り直す）
+        self._cached_headers: Optional[dict[str, str]] = None
+        self._cached_headers_token: Optional[str] = None
+
+        # カレンダーIDごとのイベントエンドポイント（"calendars/{id}/events"）
+        self._events_endpoints: dict[str, str] = {}
+
+        # カレンダー一覧のキャッシュ（取得時刻, ETag, カレンダーリスト）
+        # ETagで再検証し、変更がなければ（304）キャッシュを返す
+        self._calendars_cache: Optional[tuple[float, Optional[str], list[Calendar]]] = None
+
         # ベースURL: https://www.googleapis.com/calendar/v3
         self.base_url = f"https://www.googleapis.com/{config.google_api_service_name}/{config.google_api_version}"
 
-        self.client = httpx.AsyncClient(
-            base_url=self.base_url,
-            timeout=60.0,
-        )
+        # 外部から渡されたクライアントは共有し、自分では閉じない
+        # コネクションプールを持つクライアントは、途中で失敗しても
+        # リークしないよう__init__の最後に生成する
+        self._owns_client = http_client is None
+        self.client = http_client if http_client is not None else _create_http_client()
 
     async def close(self) -> None:
         """HTTPクライアントと認証マネージャーを閉じる.
 
         リソースを解放するために、使用後に呼び出す必要があります。
+        外部から渡された共有HTTPクライアントは閉じません。
+        HTTPクライアントのクローズに失敗した場合でも、認証マネージャーは必ず閉じます。
+        """
+        self._closed = True
+        try:
+            if self._owns_client:
+                await self.client.aclose()
+        finally:
+            await self.auth.close()
+
+    def __del__(self) -> None:
+        """close()されないまま破棄された場合に警告を出す.
+
+        長時間動作するプロセスでのコネクションプールのリークを早期に検出するためのものです。
         """
-        await self.client.aclose()
-        await self.auth.close()
+        client = getattr(self, "client", None)
+        if (
+            client is not None
+            and getattr(self, "_owns_client", False)
+            and not getattr(self, "_closed", True)
+            and not client.is_closed
+        ):
+            warnings.warn(
+                f"{type(self).__name__} was garbage collected without close(). "
+                "Use 'async with GoogleCalendarClient(...)' or call close().",
+                ResourceWarning,
+                stacklevel=2,
+            )
 
     async def __aenter__(self) -> "GoogleCalendarClient":
         """コンテキストマネージャーの開始（async with用）.
@@ -103,15 +416,40 @@ class GoogleCalendarClient:
     async def _get_headers(self) -> dict[str, str]:
         """APIリクエスト用のヘッダーを取得.
 
+        トークンが有効な間は認証マネージャーへのawaitを省略し、
+        同じトークンに対しては構築済みのヘッダー辞書を再利用します。
+
         Returns:
             dict[str, str]: HTTPヘッダー（認証トークンを含む）
         """
-        access_token = await self.auth.get_access_token()
-        return {
-            "Authorization": f"Bearer {access_token}",
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-        }
+        access_token = self.auth.peek_access_token()
+        if access_token is None:
+            access_token = await self.auth.get_access_token()
+
+        if self._cached_headers is None or self._cached_headers_token != access_token:
+            self._cached_headers = {
+                "Authorization": f"Bearer {access_token}",
+                "Content-Type": "application/json",
+                "Accept": "application/json",
+            }
+            self._cached_headers_token = access_token
+        return self._cached_headers
+
+    def _events_endpoint(self, calendar_id: str) -> str:
+        """カレンダーIDに対応するイベントエンドポイントを取得.
+
+        同じカレンダーIDに対しては構築済みの文字列を再利用します。
+
+        Args:
+            calendar_id: カレンダーID
+
+        Returns:
+            str: イベントエンドポイント（"calendars/{calendar_id}/events"）
+        """
+        endpoint = self._events_endpoints.get(calendar_id)
+        if endpoint is None:
+            endpoint = self._events_endpoints[calendar_id] = f"calendars/{calendar_id}/events"
+        return endpoint
 
     async def _request(
         self,
@@ -121,19 +459,71 @@ class GoogleCalendarClient:
         params: Optional[dict[str, Any]] = None,
         max_retries: int = 5,
     ) -> dict[str, Any]:
-        """Google Calendar APIへのリクエストを実行.
+        """Google Calendar APIへのリクエストを実行し、JSONレスポンスを返す.
+
+        Args:
+            method: HTTPメソッド（GET、POST、PATCHなど）
+            endpoint: APIエンドポイント（ベースURLからの相対パス）
+            json_data: リクエストボディ（JSON）
+            params: クエリパラメータ
+            max_retries: 最大リトライ回数
+
+        Returns:
+            dict[str, Any]: APIレスポンス（JSON）
+
+        Raises:
+            DataParsingError: レスポンスのJSONパースに失敗した場合
+            その他: _send_requestと同じ例外
+        """
+        response = await self._send_request(
+            method, endpoint, json_data=json_data, params=params, max_retries=max_retries
+        )
+
+        # 204 No Content の場合は空辞書を返す
+        if response.status_code == 204:
+            return {}
+
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError as e:
+            raise DataParsingError(
+                message="レスポンスのJSONパースに失敗しました",
+                details={
+                    "status_code": response.status_code,
+                    "response_text": response.text[:200],
+                },
+                original_error=e,
+            )
+
+    async def _send_request(
+        self,
+        method: str,
+        endpoint: str,
+        json_data: Optional[dict[str, Any]] = None,
+        content: Optional[bytes] = None,
+        params: Optional[dict[str, Any]] = None,
+        max_retries: int = 5,
+        extra_headers: Optional[dict[str, str]] = None,
+        rate_limit_tokens: int = 1,
+    ) -> httpx.Response:
+        """Google Calendar APIへのリクエストを実行し、成功レスポンスをそのまま返す.
 
         レート制限、エラーハンドリング、リトライ処理（指数バックオフ）を含みます。
+        レスポンスボディのパースは呼び出し元に任せます。
 
         Args:
             method: HTTPメソッド（GET、POST、PATCHなど）
             endpoint: APIエンドポイント（ベースURLからの相対パス）
             json_data: リクエストボディ（JSON）
+            content: シリアライズ済みのリクエストボディ（JSONバイト列）
             params: クエリパラメータ
             max_retries: 最大リトライ回数
+            extra_headers: 追加のリクエストヘッダー（If-None-Matchなど）
+            rate_limit_tokens: 1回の送信で消費するレート制限トークン数
+                （バッチリクエストではサブリクエストの件数）
 
         Returns:
-            dict[str, Any]: APIレスポンス（JSON）
+            httpx.Response: 成功（2xx）または304 Not Modifiedレスポンス
 
         Raises:
             GoogleAuthenticationError: 認証エラー（401）
@@ -144,57 +534,79 @@ class GoogleCalendarClient:
             GoogleServerError: サーバーエラー（5xx）
             NetworkError: ネットワークエラー
         """
+        # DEBUGログが無効な場合はログ用の文字列や辞書を組み立てない
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+
+        # 共有クライアントはbase_urlを持たないため絶対URLで指定する
+        url = endpoint if endpoint.startswith("https://") else f"{self.base_url}/{endpoint}"
+
+        # JSONボディはリトライをまたいで使い回せるよう1回だけシリアライズする
+        if json_data is not None:
+            content = orjson.dumps(json_data)
+
         for attempt in range(max_retries):
             try:
+                # バッチリクエストはサブリクエストごとにクォータを消費するため、
+                # 残りの件数分のトークンも先に取得する
+                if rate_limit_tokens > 1:
+                    await self.rate_limiter.acquire(rate_limit_tokens - 1)
+
                 # レート制限を適用
                 async with self.rate_limiter:
-                    # 認証ヘッダーを取得
+                    # 認証ヘッダーを取得（キャッシュされた辞書は書き換えない）
                     headers = await self._get_headers()
+                    if extra_headers:
+                        headers = {**headers, **extra_headers}
 
                     # リクエストログ
-                    full_url = f"{self.base_url}/{endpoint}"
-                    logger.debug(
-                        f"Request: {method} {full_url}",
-                        extra={
-                            "extra_fields": {
-                                "method": method,
-                                "endpoint": endpoint,
-                                "params": params,
-                                "attempt": attempt + 1,
-                            }
-                        },
-                    )
+                    if debug_enabled:
+                        logger.debug(
+                            "Request: %s %s",
+                            method,
+                            url,
+                            extra={
+                                "extra_fields": {
+                                    "method": method,
+                                    "endpoint": endpoint,
+                                    "params": params,
+                                    "attempt": attempt + 1,
+                                }
+                            },
+                        )
 
                     response = await self.client.request(
                         method=method,
-                        url=endpoint,
-                        json=json_data,
+                        url=url,
+                        content=content,
                         params=params,
                         headers=headers,
                     )
 
                     # レスポンスログ
-                    logger.debug(
-                        f"Response: {response.status_code}",
-                        extra={
-                            "extra_fields": {
-                                "status_code": response.status_code,
-                                "attempt": attempt + 1,
-                            }
-                        },
-                    )
+                    if debug_enabled:
+                        logger.debug(
+                            "Response: %s",
+                            response.status_code,
+                            extra={
+                                "extra_fields": {
+                                    "status_code": response.status_code,
+                                    "attempt": attempt + 1,
+                                }
+                            },
+                        )
 
                     # レート制限エラー（429）のハンドリング
                     if response.status_code == 429:
                         if attempt < max_retries - 1:
-                            # 指数バックオフ
-                            wait_time = 2**attempt
-                            retry_after = int(response.headers.get("Retry-After", wait_time))
+                            # Retry-Afterを尊重しつつジッターで再試行時刻を分散
+                            wait_time = _retry_after_delay(response, attempt)
                             logger.warning(
-                                f"Rate limited. Retrying after {retry_after} seconds... "
-                                f"(attempt {attempt + 1}/{max_retries})"
+                                "Rate limited. Retrying after %.2f seconds... (attempt %d/%d)",
+                                wait_time,
+                                attempt + 1,
+                                max_retries,
                             )
-                            await self.rate_limiter.acquire()  # トークンを待機
+                            await asyncio.sleep(wait_time)
                             continue
                         else:
                             self._handle_error_response(response)
@@ -202,12 +614,15 @@ class GoogleCalendarClient:
                     # サーバーエラー（5xx）のハンドリング
                     if response.status_code >= 500:
                         if attempt < max_retries - 1:
-                            wait_time = 2**attempt
+                            wait_time = _backoff_delay(attempt)
                             logger.warning(
-                                f"Server error ({response.status_code}). "
-                                f"Retrying in {wait_time} seconds... "
-                                f"(attempt {attempt + 1}/{max_retries})"
+                                "Server error (%s). Retrying in %.2f seconds... (attempt %d/%d)",
+                                response.status_code,
+                                wait_time,
+                                attempt + 1,
+                                max_retries,
                             )
+                            await asyncio.sleep(wait_time)
                             continue
                         else:
                             self._handle_error_response(response)
@@ -217,50 +632,41 @@ class GoogleCalendarClient:
                         self._handle_error_response(response)
 
                     # 成功レスポンス（2xx）
-                    # 204 No Content の場合は空辞書を返す
-                    if response.status_code == 204:
-                        return {}
-
-                    try:
-                        return response.json()
-                    except ValueError as e:
-                        raise DataParsingError(
-                            message="レスポンスのJSONパースに失敗しました",
-                            details={
-                                "status_code": response.status_code,
-                                "response_text": response.text[:200],
-                            },
-                            original_error=e,
-                        )
+                    return response
 
             except httpx.TimeoutException as e:
-                if attempt < max_retries - 1:
-                    wait_time = 2**attempt
-                    logger.warning(
-                        f"Timeout error. Retrying in {wait_time} seconds... "
-                        f"(attempt {attempt + 1}/{max_retries})"
-                    )
-                    continue
-                else:
+                if attempt == max_retries - 1:
                     raise TimeoutError(
                         message="Google Calendar APIへのリクエストがタイムアウトしました",
                         timeout_seconds=60.0,
                         original_error=e,
                     )
+                wait_time = _backoff_delay(attempt)
+                logger.warning(
+                    "Timeout error. Retrying in %.2f seconds... (attempt %d/%d)",
+                    wait_time,
+                    attempt + 1,
+                    max_retries,
+                )
             except httpx.RequestError as e:
-                if attempt < max_retries - 1:
-                    wait_time = 2**attempt
-                    logger.warning(
-                        f"Request error: {e}. Retrying in {wait_time} seconds... "
-                        f"(attempt {attempt + 1}/{max_retries})"
-                    )
-                    continue
-                else:
+                if attempt == max_retries - 1:
                     raise NetworkError(
                         message="Google Calendar APIへのネットワーク接続に失敗しました",
                         details={"endpoint": endpoint, "method": method},
                         original_error=e,
                     )
+                wait_time = _backoff_delay(attempt)
+                logger.warning(
+                    "Request error: %s. Retrying in %.2f seconds... (attempt %d/%d)",
+                    e,
+                    wait_time,
+                    attempt + 1,
+                    max_retries,
+                )
+
+            # 例外ハンドラーの外で待機し、捕捉した例外とトレースバック（フレーム）を
+            # 待機中に保持しない（待機中の例外に暗黙の__context__も連鎖させない）
+            await asyncio.sleep(wait_time)
 
         raise NetworkError(
             message=f"最大リトライ回数（{max_retries}）を超過しました",
@@ -281,66 +687,53 @@ class GoogleCalendarClient:
             GoogleValidationError: バリデーションエラー（400）
             GoogleServerError: サーバーエラー（5xx）
         """
+        # ボディはバイト列のまま1回だけ参照し、パースと失敗時の表示の両方に使う
+        raw = response.content
         try:
-            error_data = response.json()
+            error_data = orjson.loads(raw)
             # Google Calendar APIのエラー形式: {"error": {"code": 404, "message": "...", ...}}
             error_info = error_data.get("error", {})
             status_code = error_info.get("code", response.status_code)
             message = error_info.get("message", "An unknown error occurred")
             errors = error_info.get("errors", [])
-        except ValueError:
-            # JSONパースエラーの場合
+        except orjson.JSONDecodeError:
+            # JSONパースエラーの場合（プロキシのHTMLエラーページなど）
             raise DataParsingError(
-                message=f"エラーレスポンスのパースに失敗しました: {response.text[:200]}",
+                message=(
+                    "エラーレスポンスのパースに失敗しました: "
+                    f"{raw[:200].decode('utf-8', errors='replace')}"
+                ),
                 details={"status_code": response.status_code},
             )
 
         # ステータスコードに応じて適切な例外を発生させる
-        if status_code == 401:
-            raise GoogleAuthenticationError(
-                message=f"認証エラー: {message}",
-                details={"errors": errors},
-            )
-        elif status_code == 403:
-            raise GooglePermissionError(
-                message=f"権限エラー: {message}",
+        mapped = self._ERROR_MAP.get(status_code)
+        if mapped is not None:
+            exc_cls, label = mapped
+            raise exc_cls(
+                message=f"{label}: {message}",
                 details={"errors": errors},
             )
-        elif status_code == 404:
-            raise GoogleNotFoundError(
-                message=f"リソースが見つかりません: {message}",
-                details={"errors": errors},
-            )
-        elif status_code == 429:
+        if status_code == 429:
             retry_after = int(response.headers.get("Retry-After", 5))
             raise GoogleRateLimitError(
                 message=f"レート制限エラー: {message}",
                 retry_after=retry_after,
                 details={"errors": errors},
             )
-        elif status_code == 400:
-            raise GoogleValidationError(
-                message=f"バリデーションエラー: {message}",
-                details={"errors": errors},
-            )
-        elif status_code >= 500:
-            raise GoogleServerError(
-                message=f"サーバーエラー: {message}",
-                status_code=status_code,
-                details={"errors": errors},
-            )
-        else:
-            # その他のエラー
-            raise GoogleServerError(
-                message=f"APIエラー: {message}",
-                status_code=status_code,
-                details={"errors": errors},
-            )
+        label = "サーバーエラー" if status_code >= 500 else "APIエラー"
+        raise GoogleServerError(
+            message=f"{label}: {message}",
+            status_code=status_code,
+            details={"errors": errors},
+        )
 
     async def list_calendars(self) -> list[Calendar]:
         """カレンダー一覧を取得.
 
         ユーザーがアクセス可能なカレンダーの一覧を取得します。
+        取得結果は一定時間APIを呼ばずに再利用し、有効期間の経過後は
+        ETag（If-None-Match）で再検証します。エラー時はキャッシュを破棄します。
 
         Returns:
             list[Calendar]: カレンダーのリスト
@@ -359,7 +752,38 @@ class GoogleCalendarClient:
 
         logger.info("Listing calendars")
 
-        response_data = await self._request("GET", endpoint)
+        # TTL内のキャッシュがあればAPIを呼ばずに返す
+        cache = self._calendars_cache
+        if cache is not None and time.monotonic() - cache[0] < _CALENDAR_LIST_TTL_SECONDS:
+            logger.info("Returning %d cached calendars", len(cache[2]))
+            return list(cache[2])
+
+        # TTL経過後はETagがあれば再検証する
+        extra_headers = {"If-None-Match": cache[1]} if cache is not None and cache[1] else None
+
+        try:
+            response = await self._send_request("GET", endpoint, extra_headers=extra_headers)
+        except GoogleCalendarAPIError:
+            # エラー時はキャッシュを破棄する
+            self._calendars_cache = None
+            raise
+
+        if response.status_code == 304 and cache is not None:
+            logger.info("Calendar list not modified. Returning %d cached calendars", len(cache[2]))
+            self._calendars_cache = (time.monotonic(), cache[1], cache[2])
+            return list(cache[2])
+
+        try:
+            response_data = orjson.loads(response.content)
+        except orjson.JSONDecodeError as e:
+            raise DataParsingError(
+                message="レスポンスのJSONパースに失敗しました",
+                details={
+                    "status_code": response.status_code,
+                    "response_text": response.text[:200],
+                },
+                original_error=e,
+            )
 
         # カレンダーリストの取得
         items = response_data.get("items", [])
@@ -370,10 +794,12 @@ class GoogleCalendarClient:
             try:
                 calendar = Calendar(**item)
                 calendars.append(calendar)
-            except Exception as e:
+            except ValidationError as e:
                 # パースエラーの場合は警告を出力してスキップ
                 logger.warning(
-                    f"Failed to parse calendar {item.get('id', 'unknown')}: {e}",
+                    "Failed to parse calendar %s: %s",
+                    item.get("id", "unknown"),
+                    e,
                     extra={
                         "extra_fields": {
                             "calendar_id": item.get("id"),
@@ -383,7 +809,12 @@ class GoogleCalendarClient:
                 )
                 continue
 
-        logger.info(f"Retrieved {len(calendars)} calendars")
+        # ETagがあれば一緒にキャッシュして、TTL経過後の再検証に使う
+        etag = response.headers.get("ETag") or response_data.get("etag")
+        self._calendars_cache = (time.monotonic(), etag, calendars)
+        calendars = list(calendars)
+
+        logger.info("Retrieved %d calendars", len(calendars))
         return calendars
 
     async def list_events(
@@ -394,6 +825,7 @@ class GoogleCalendarClient:
         max_results: int = 10,
         single_events: bool = True,
         order_by: str = "startTime",
+        fields: Optional[str] = None,
     ) -> list[CalendarEvent]:
         """イベント一覧を取得.
 
@@ -404,6 +836,9 @@ class GoogleCalendarClient:
             max_results: 最大取得件数（デフォルト: 10）
             single_events: 定期イベントを個別のインスタンスに展開するか（デフォルト: True）
             order_by: ソート順（"startTime" または "updated"）
+            fields: 取得するフィールド（部分レスポンス、Noneの場合は全フィールド）
+                CalendarEventの必須項目（id, start, end, status, htmlLink, created, updated）を
+                含める必要があります
 
         Returns:
             list[CalendarEvent]: イベントのリスト
@@ -415,8 +850,8 @@ class GoogleCalendarClient:
             GoogleRateLimitError: レート制限エラー
 
         Example:
-            >>> from datetime import datetime, timedelta
-            >>> now = datetime.utcnow()
+            >>> from datetime import datetime, timedelta, timezone
+            >>> now = datetime.now(timezone.utc)
             >>> end = now + timedelta(days=7)
             >>> events = await client.list_events(
             ...     time_min=now,
@@ -424,25 +859,72 @@ class GoogleCalendarClient:
             ...     max_results=20
             ... )
         """
-        endpoint = f"calendars/{calendar_id}/events"
+        events = [
+            event
+            async for event in self.iter_events(
+                calendar_id=calendar_id,
+                time_min=time_min,
+                time_max=time_max,
+                max_results=max_results,
+                single_events=single_events,
+                order_by=order_by,
+                fields=fields,
+            )
+        ]
+
+        logger.info("Retrieved %d events", len(events))
+        return events
+
+    async def iter_events(
+        self,
+        calendar_id: str = "primary",
+        time_min: Optional[datetime] = None,
+        time_max: Optional[datetime] = None,
+        max_results: Optional[int] = None,
+        single_events: bool = True,
+        order_by: str = "startTime",
+        page_size: int = 250,
+        page_token: Optional[str] = None,
+        fields: Optional[str] = None,
+    ) -> AsyncIterator[CalendarEvent]:
+        """イベントをページ単位で取得しながら1件ずつ返す.
+
+        nextPageTokenに従って必要な分だけページを取得します。
+        呼び出し元がループを途中で抜けた場合、残りのページは取得しません。
+
+        Args:
+            calendar_id: カレンダーID（デフォルト: "primary"）
+            time_min: 開始時刻の下限（ISO 8601形式）
+            time_max: 開始時刻の上限（ISO 8601形式）
+            max_results: 最大取得件数（Noneの場合は全件）
+            single_events: 定期イベントを個別のインスタンスに展開するか（デフォルト: True）
+            order_by: ソート順（"startTime" または "updated"）
+            page_size: 1ページあたりの取得件数（デフォルト: 250）
+            page_token: 取得を開始するページのトークン（Noneの場合は先頭から）
+            fields: 取得するフィールド（部分レスポンス、Noneの場合は全フィールド）
 
-        # クエリパラメータの構築
-        params: dict[str, Any] = {
-            "maxResults": max_results,
-            "singleEvents": single_events,
-        }
+        Yields:
+            CalendarEvent: イベント
 
-        if time_min:
-            params["timeMin"] = time_min.isoformat()
+        Raises:
+            GoogleAuthenticationError: 認証エラー
+            GooglePermissionError: 権限エラー
+            GoogleNotFoundError: カレンダーが見つからない
+            GoogleRateLimitError: レート制限エラー
 
-        if time_max:
-            params["timeMax"] = time_max.isoformat()
+        Example:
+            >>> async for event in client.iter_events(time_min=now):
+            ...     if event.location:
+            ...         break
+        """
+        endpoint = self._events_endpoint(calendar_id)
 
-        if single_events and order_by:
-            params["orderBy"] = order_by
+        # 期間指定・取得フィールドのクエリはページをまたいで同じなので1回だけエンコードする
+        range_query = _encode_range_query(time_min, time_max, fields)
 
         logger.info(
-            f"Listing events from calendar '{calendar_id}'",
+            "Listing events from calendar '%s'",
+            calendar_id,
             extra={
                 "extra_fields": {
                     "calendar_id": calendar_id,
@@ -453,12 +935,63 @@ class GoogleCalendarClient:
             },
         )
 
-        response_data = await self._request("GET", endpoint, params=params)
+        if max_results is not None and max_results <= 0:
+            return
 
-        # イベントリストの取得
-        items = response_data.get("items", [])
+        yielded = 0
+        while True:
+            # 残り件数を超えない範囲でページサイズを決める
+            if max_results is not None:
+                page_max = min(page_size, max_results - yielded)
+            else:
+                page_max = page_size
+
+            # エンコード済みのクエリをURLに直接付与する（httpxの再エンコードを省略）
+            query = _encode_events_query(page_max, single_events, order_by) + range_query
+            if page_token:
+                query += f"&{urlencode({'pageToken': page_token})}"
+
+            response_data = await self._request("GET", f"{endpoint}?{query}")
+
+            events = self._parse_event_items(response_data.get("items", []))
+            for event in events:
+                yield event
+                yielded += 1
+                if max_results is not None and yielded >= max_results:
+                    return
+
+            page_token = response_data.get("nextPageToken")
+            if not page_token:
+                return
+
+    def _parse_event_items(self, items: list[dict[str, Any]]) -> list[CalendarEvent]:
+        """イベント一覧レスポンスのitemsをCalendarEventモデルに変換.
+
+        まずはページ全体を一括でバリデーションし、不正なイベントが含まれる場合のみ
+        1件ずつ変換して該当イベントをスキップします。
 
-        # CalendarEventモデルに変換
+        Args:
+            items: Google Calendar APIのイベントデータのリスト
+
+        Returns:
+            list[CalendarEvent]: 変換できたイベントのリスト
+        """
+        try:
+            return _EVENT_LIST_ADAPTER.validate_python(items)
+        except ValidationError:
+            return self._parse_events_individually(items)
+
+    def _parse_events_individually(self, items: list[dict[str, Any]]) -> list[CalendarEvent]:
+        """イベントデータを1件ずつCalendarEventモデルに変換.
+
+        パースできないイベントは警告を出力してスキップします。
+
+        Args:
+            items: Google Calendar APIのイベントデータのリスト
+
+        Returns:
+            list[CalendarEvent]: 変換できたイベントのリスト
+        """
         events: list[CalendarEvent] = []
         for item in items:
             try:
@@ -466,7 +999,9 @@ class GoogleCalendarClient:
                 events.append(event)
             except DataParsingError as e:
                 logger.warning(
-                    f"Failed to parse event {item.get('id', 'unknown')}: {e}",
+                    "Failed to parse event %s: %s",
+                    item.get("id", "unknown"),
+                    e,
                     extra={
                         "extra_fields": {
                             "event_id": item.get("id"),
@@ -476,9 +1011,81 @@ class GoogleCalendarClient:
                 )
                 continue
 
-        logger.info(f"Retrieved {len(events)} events")
         return events
 
+    async def _send_batch(
+        self, paths: Sequence[str], max_retries: int = 5
+    ) -> list[Optional[httpx.Response]]:
+        """GETサブリクエストをバッチエンドポイントにまとめて送信.
+
+        Google Calendar APIはバッチ内のサブリクエストを1件ずつクォータに計上するため、
+        サブリクエストの件数分のレート制限トークンを消費します。
+        1回のバッチに含める件数は、バッチの上限（50件）とバケット容量の小さい方です。
+        レート制限（429）やサーバーエラー（5xx）のサブレスポンスは、
+        待機後にそのサブリクエストだけを再送します。
+
+        Args:
+            paths: 各サブリクエストのGETパス（"/calendar/v3/..."形式）
+            max_retries: サブリクエストごとの最大試行回数
+
+        Returns:
+            list[Optional[httpx.Response]]: サブレスポンスのリスト（指定順）。
+                バッチレスポンスに含まれなかったサブリクエストはNone
+
+        Raises:
+            DataParsingError: バッチレスポンスのパースに失敗した場合
+            その他: _send_requestと同じ例外
+        """
+        batch_url = (
+            f"https://www.googleapis.com/batch/"
+            f"{self.config.google_api_service_name}/{self.config.google_api_version}"
+        )
+        chunk_size = min(_BATCH_MAX_REQUESTS, self.rate_limiter.capacity)
+
+        results: list[Optional[httpx.Response]] = [None] * len(paths)
+        for start in range(0, len(paths), chunk_size):
+            pending = list(range(start, min(start + chunk_size, len(paths))))
+            for attempt in range(max_retries):
+                boundary = f"batch_{uuid.uuid4().hex}"
+                response = await self._send_request(
+                    "POST",
+                    batch_url,
+                    content=_build_batch_body(boundary, [paths[i] for i in pending]),
+                    extra_headers={"Content-Type": f"multipart/mixed; boundary={boundary}"},
+                    rate_limit_tokens=len(pending),
+                )
+                sub_responses = _parse_batch_response(response)
+
+                retry: list[int] = []
+                wait_time = 0.0
+                for position, index in enumerate(pending):
+                    sub_response = results[index] = sub_responses.get(position)
+                    if sub_response is None or attempt == max_retries - 1:
+                        continue
+                    if sub_response.status_code == 429:
+                        wait_time = max(wait_time, _retry_after_delay(sub_response, attempt))
+                    elif sub_response.status_code >= 500:
+                        wait_time = max(wait_time, _backoff_delay(attempt))
+                    else:
+                        continue
+                    retry.append(index)
+
+                if not retry:
+                    break
+                logger.warning(
+                    "%d of %d batch sub-requests failed. Retrying in %.2f seconds... "
+                    "(attempt %d/%d)",
+                    len(retry),
+                    len(pending),
+                    wait_time,
+                    attempt + 1,
+                    max_retries,
+                )
+                await asyncio.sleep(wait_time)
+                pending = retry
+
+        return results
+
     async def get_event(
         self, event_id: str, calendar_id: str = "primary"
     ) -> CalendarEvent:
@@ -496,10 +1103,12 @@ class GoogleCalendarClient:
             GooglePermissionError: 権限エラー
             GoogleNotFoundError: イベントが見つからない
         """
-        endpoint = f"calendars/{calendar_id}/events/{event_id}"
+        endpoint = f"{self._events_endpoint(calendar_id)}/{event_id}"
 
         logger.info(
-            f"Getting event '{event_id}' from calendar '{calendar_id}'",
+            "Getting event '%s' from calendar '%s'",
+            event_id,
+            calendar_id,
             extra={
                 "extra_fields": {
                     "calendar_id": calendar_id,
@@ -508,8 +1117,185 @@ class GoogleCalendarClient:
             },
         )
 
-        response_data = await self._request("GET", endpoint)
-        return self._parse_event(response_data)
+        response = await self._send_request("GET", endpoint)
+        return self._parse_event_json(response.content)
+
+    async def get_events(
+        self, event_ids: Sequence[tuple[str, str]]
+    ) -> list[CalendarEvent]:
+        """複数のイベント詳細をバッチリクエストでまとめて取得.
+
+        Google Calendar APIのバッチエンドポイントを使用し、
+        最大50件ずつ1回のHTTPリクエストにまとめて取得します。
+        レート制限（429）やサーバーエラー（5xx）のイベントは個別に再送し、
+        見つからないイベントは警告を出力してスキップします。
+
+        Args:
+            event_ids: (カレンダーID, イベントID) のシーケンス
+
+        Returns:
+            list[CalendarEvent]: 取得できたイベントのリスト（指定順）
+
+        Raises:
+            GoogleAuthenticationError: 認証エラー
+            GooglePermissionError: 権限エラー
+            GoogleRateLimitError: 再送してもレート制限が解除されない場合
+            GoogleServerError: 再送してもサーバーエラーが続く場合
+            DataParsingError: バッチレスポンスのパースに失敗した場合
+                （サブレスポンスが欠けている場合を含む）
+
+        Example:
+            >>> events = await client.get_events(
+            ...     [("primary", "event123"), ("primary", "event456")]
+            ... )
+        """
+        api_path = httpx.URL(self.base_url).path
+        paths = [
+            f"{api_path}/{self._events_endpoint(calendar_id)}/{event_id}"
+            for calendar_id, event_id in event_ids
+        ]
+
+        logger.info("Getting %d events in batch", len(event_ids))
+
+        events: list[CalendarEvent] = []
+        for (calendar_id, event_id), sub_response in zip(
+            event_ids, await self._send_batch(paths), strict=True
+        ):
+            if sub_response is None:
+                raise DataParsingError(
+                    message="バッチレスポンスにサブレスポンスが含まれていません",
+                    details={"calendar_id": calendar_id, "event_id": event_id},
+                )
+            if sub_response.status_code == 404:
+                logger.warning(
+                    "Event %s not found in calendar %s",
+                    event_id,
+                    calendar_id,
+                    extra={"extra_fields": {"calendar_id": calendar_id, "event_id": event_id}},
+                )
+                continue
+            if not sub_response.is_success:
+                # サブレスポンスのエラーは単体リクエストと同じ例外に変換する
+                self._handle_error_response(sub_response)
+            events.append(self._parse_event_json(sub_response.content))
+
+        return events
+
+    async def batch_list_events(
+        self,
+        calendar_ids: Sequence[str],
+        time_min: Optional[datetime] = None,
+        time_max: Optional[datetime] = None,
+        max_results: int = 10,
+        fields: Optional[str] = None,
+    ) -> list[tuple[str, list[CalendarEvent], Optional[GoogleCalendarMCPError]]]:
+        """複数カレンダーのイベント一覧をバッチリクエストでまとめて取得.
+
+        各カレンダーの先頭ページをGoogle Calendar APIのバッチエンドポイントで
+        最大50件ずつ1回のHTTPリクエストにまとめて取得します。
+        レート制限（429）やサーバーエラー（5xx）のカレンダーは個別に再送します。
+        max_resultsに満たないまま次のページがあるカレンダーのみ、
+        残りを通常のリクエストで取得します。
+
+        カレンダーごとのエラーは例外を送出せず、結果のタプルに含めて返します。
+
+        Args:
+            calendar_ids: カレンダーIDのシーケンス
+            time_min: 開始時刻の下限
+            time_max: 開始時刻の上限
+            max_results: カレンダーごとの最大取得件数（デフォルト: 10）
+            fields: 取得するフィールド（部分レスポンス、Noneの場合は全フィールド）
+
+        Returns:
+            list[tuple[str, list[CalendarEvent], Optional[GoogleCalendarMCPError]]]:
+                (カレンダーID, イベントリスト, エラー) のリスト（指定順）
+
+        Raises:
+            GoogleAuthenticationError: バッチリクエスト自体の認証エラー
+            NetworkError: バッチリクエスト自体の通信エラー
+            DataParsingError: バッチレスポンスのパースに失敗した場合
+
+        Example:
+            >>> results = await client.batch_list_events(
+            ...     ["primary", "team@group.calendar.google.com"], time_min=now
+            ... )
+            >>> for calendar_id, events, error in results:
+            ...     print(calendar_id, len(events), error)
+        """
+        api_path = httpx.URL(self.base_url).path
+
+        # 全カレンダーで共通のクエリは1回だけエンコードする
+        query = _encode_events_query(min(max_results, 250), True, "startTime") + (
+            _encode_range_query(time_min, time_max, fields)
+        )
+
+        logger.info("Listing events from %d calendars in batch", len(calendar_ids))
+
+        if max_results <= 0:
+            return [(calendar_id, [], None) for calendar_id in calendar_ids]
+
+        sub_responses = await self._send_batch(
+            [
+                f"{api_path}/{self._events_endpoint(calendar_id)}?{query}"
+                for calendar_id in calendar_ids
+            ]
+        )
+
+        results: list[tuple[str, list[CalendarEvent], Optional[GoogleCalendarMCPError]]] = []
+        for calendar_id, sub_response in zip(calendar_ids, sub_responses, strict=True):
+            try:
+                if sub_response is None:
+                    raise DataParsingError(
+                        message="バッチレスポンスにサブレスポンスが含まれていません",
+                        details={"calendar_id": calendar_id},
+                    )
+                if not sub_response.is_success:
+                    # サブレスポンスのエラーは単体リクエストと同じ例外に変換する
+                    self._handle_error_response(sub_response)
+                try:
+                    response_data = orjson.loads(sub_response.content)
+                except orjson.JSONDecodeError as e:
+                    raise DataParsingError(
+                        message="レスポンスのJSONパースに失敗しました",
+                        details={
+                            "status_code": sub_response.status_code,
+                            "response_text": sub_response.text[:200],
+                        },
+                        original_error=e,
+                    )
+
+                events = self._parse_event_items(response_data.get("items", []))
+                del events[max_results:]
+
+                # 先頭ページで足りない場合のみ、残りのページを個別に取得する
+                page_token = response_data.get("nextPageToken")
+                if page_token and len(events) < max_results:
+                    events.extend(
+                        [
+                            event
+                            async for event in self.iter_events(
+                                calendar_id=calendar_id,
+                                time_min=time_min,
+                                time_max=time_max,
+                                max_results=max_results - len(events),
+                                page_token=page_token,
+                                fields=fields,
+                            )
+                        ]
+                    )
+            except GoogleCalendarMCPError as e:
+                logger.warning(
+                    "Failed to get events from calendar '%s': %s",
+                    calendar_id,
+                    e,
+                    extra={"extra_fields": {"calendar_id": calendar_id, "error": str(e)}},
+                )
+                results.append((calendar_id, [], e))
+                continue
+
+            results.append((calendar_id, events, None))
+
+        return results
 
     async def create_event(
         self, event: CalendarEvent, calendar_id: str = "primary"
@@ -528,13 +1314,15 @@ class GoogleCalendarClient:
             GooglePermissionError: 権限エラー
             GoogleValidationError: バリデーションエラー
         """
-        endpoint = f"calendars/{calendar_id}/events"
+        endpoint = self._events_endpoint(calendar_id)
 
-        # イベントデータをGoogle Calendar API形式に変換
-        event_data = self._event_to_api_format(event)
+        # イベントデータをGoogle Calendar API形式のJSONに直接シリアライズ
+        event_json = self._event_to_api_json(event)
 
         logger.info(
-            f"Creating event '{event.summary}' in calendar '{calendar_id}'",
+            "Creating event '%s' in calendar '%s'",
+            event.summary,
+            calendar_id,
             extra={
                 "extra_fields": {
                     "calendar_id": calendar_id,
@@ -543,8 +1331,8 @@ class GoogleCalendarClient:
             },
         )
 
-        response_data = await self._request("POST", endpoint, json_data=event_data)
-        return self._parse_event(response_data)
+        response = await self._send_request("POST", endpoint, content=event_json)
+        return self._parse_event_json(response.content)
 
     async def update_event(
         self, event_id: str, updates: dict[str, Any], calendar_id: str = "primary"
@@ -571,10 +1359,12 @@ class GoogleCalendarClient:
             ...     updates={"summary": "新しいタイトル", "location": "新しい場所"}
             ... )
         """
-        endpoint = f"calendars/{calendar_id}/events/{event_id}"
+        endpoint = f"{self._events_endpoint(calendar_id)}/{event_id}"
 
         logger.info(
-            f"Updating event '{event_id}' in calendar '{calendar_id}'",
+            "Updating event '%s' in calendar '%s'",
+            event_id,
+            calendar_id,
             extra={
                 "extra_fields": {
                     "calendar_id": calendar_id,
@@ -584,8 +1374,8 @@ class GoogleCalendarClient:
             },
         )
 
-        response_data = await self._request("PATCH", endpoint, json_data=updates)
-        return self._parse_event(response_data)
+        response = await self._send_request("PATCH", endpoint, json_data=updates)
+        return self._parse_event_json(response.content)
 
     def _parse_event(self, event_data: dict[str, Any]) -> CalendarEvent:
         """APIレスポンスをCalendarEventモデルに変換.
@@ -604,7 +1394,7 @@ class GoogleCalendarClient:
             # Google Calendar APIのフィールド名はcamelCase、
             # モデル側でエイリアス設定により自動変換される
             return CalendarEvent(**event_data)
-        except Exception as e:
+        except ValidationError as e:
             raise DataParsingError(
                 message="イベントデータのパースに失敗しました",
                 details={
@@ -614,6 +1404,32 @@ class GoogleCalendarClient:
                 original_error=e,
             )
 
+    def _parse_event_json(self, content: bytes) -> CalendarEvent:
+        """APIレスポンスのJSONバイト列をCalendarEventモデルに変換.
+
+        JSONのデコードとバリデーションをpydantic-coreの1パスで行います。
+
+        Args:
+            content: Google Calendar APIのイベントデータ（JSONバイト列）
+
+        Returns:
+            CalendarEvent: イベントモデル
+
+        Raises:
+            DataParsingError: パースに失敗した場合
+        """
+        try:
+            return CalendarEvent.model_validate_json(content)
+        except ValidationError as e:
+            raise DataParsingError(
+                message="イベントデータのパースに失敗しました",
+                details={
+                    "response_text": content[:200].decode("utf-8", errors="replace"),
+                    "error": str(e),
+                },
+                original_error=e,
+            )
+
     def _event_to_api_format(self, event: CalendarEvent) -> dict[str, Any]:
         """CalendarEventモデルをGoogle Calendar API形式に変換.
 
@@ -635,3 +1451,22 @@ class GoogleCalendarClient:
         event_dict.pop("id", None)
 
         return event_dict
+
+    def _event_to_api_json(self, event: CalendarEvent) -> bytes:
+        """CalendarEventモデルをGoogle Calendar API形式のJSONバイト列に変換.
+
+        _event_to_api_formatと同じ内容を、辞書を経由せずに直接シリアライズします。
+
+        Args:
+            event: イベントモデル
+
+        Returns:
+            bytes: API形式のイベントデータ（JSON）
+        """
+        # IDフィールドは作成時には不要なので除外
+        return event.model_dump_json(
+            by_alias=True,
+            exclude_none=True,
+            exclude_unset=True,
+            exclude={"id"},
+        ).encode("utf-8")
@@ -5,10 +5,14 @@
 """
 
 import os
+from functools import lru_cache
 from pathlib import Path
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# 読み込む.envファイル（HISHO_ENV_FILE環境変数で上書き可能、インポート時に1回だけ解決）
+_ENV_FILE = os.environ.get("HISHO_ENV_FILE", ".env")
+
 
 class GoogleCalendarConfig(BaseSettings):
     """Google Calendar MCP Serverの設定.
@@ -24,7 +28,9 @@ class GoogleCalendarConfig(BaseSettings):
     google_calendar_id: str = "primary"  # デフォルトはプライマリカレンダー
     google_calendar_timezone: str = "Asia/Tokyo"  # デフォルトタイムゾーン
     mcp_log_level: str = "INFO"
-    env_file_path: str = ".env"  # .envファイルのパス
+    env_file_path: str = _ENV_FILE  # .envファイルのパス（読み込み元と同じファイルを更新する）
+    # アクセストークンのキャッシュファイル（再起動時に有効なトークンを再利用）
+    google_token_cache_path: str = "~/.cache/hisho/google_token.json"
 
     # Google Calendar APIの基本設定
     google_api_service_name: str = "calendar"
@@ -39,7 +45,7 @@ class GoogleCalendarConfig(BaseSettings):
     rate_limit_burst: int = 10  # バースト許容数
 
     model_config = SettingsConfigDict(
-        env_file=".env",
+        env_file=_ENV_FILE,
         env_file_encoding="utf-8",
         case_sensitive=False,
         extra="ignore",
@@ -57,6 +63,17 @@ class GoogleCalendarConfig(BaseSettings):
             env_path = Path.cwd() / env_path
         return env_path
 
+    def get_token_cache_path(self) -> Path:
+        """アクセストークンのキャッシュファイルのパスを取得.
+
+        Returns:
+            Path: キャッシュファイルの絶対パス（~はホームディレクトリに展開）
+        """
+        cache_path = Path(self.google_token_cache_path).expanduser()
+        if not cache_path.is_absolute():
+            cache_path = Path.cwd() / cache_path
+        return cache_path
+
     def get_credentials_dict(self) -> dict[str, str]:
         """Google OAuth2認証情報を辞書形式で返す.
 
@@ -69,3 +86,19 @@ class GoogleCalendarConfig(BaseSettings):
             "refresh_token": self.google_refresh_token,
             "token_uri": self.google_token_uri,
         }
+
+
+@lru_cache(maxsize=1)
+def get_config() -> GoogleCalendarConfig:
+    """プロセス内で共有する設定インスタンスを取得.
+
+    初回呼び出し時のみ環境変数と.envファイルを読み込み、
+    以降は同じインスタンスを返します。
+
+    Returns:
+        GoogleCalendarConfig: 設定インスタンス
+
+    Raises:
+        pydantic.ValidationError: 必須の設定値が不足している場合
+    """
+    return GoogleCalendarConfig()
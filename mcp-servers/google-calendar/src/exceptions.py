@@ -20,6 +20,9 @@ class GoogleCalendarMCPError(Exception):
         original_error: 元の例外（ラップする場合）
     """
 
+    # インスタンスごとの__dict__を作らずに属性を保持する
+    __slots__ = ("message", "details", "original_error")
+
     def __init__(
         self,
         message: str,
@@ -34,10 +37,47 @@ class GoogleCalendarMCPError(Exception):
             original_error: 元の例外（存在する場合）
         """
         self.message = message
-        self.details = details or {}
+        # サブクラスは_build_detailsで新しい辞書を作って渡すため、ここではコピーしない
+        self.details = {} if details is None else details
         self.original_error = original_error
         super().__init__(message)
 
+    @staticmethod
+    def _build_details(base: Optional[dict[str, Any]], **kv: Any) -> dict[str, Any]:
+        """詳細情報の辞書を1回だけ生成.
+
+        呼び出し元から渡された辞書は変更せずにコピーし、
+        値が設定されている項目のみを追加します。
+
+        Args:
+            base: 呼び出し元から渡された詳細情報
+            **kv: 追加する項目（値が偽の場合は追加しない）
+
+        Returns:
+            dict[str, Any]: 新しく生成した詳細情報
+        """
+        d: dict[str, Any] = {} if base is None else dict(base)
+        for key, value in kv.items():
+            if value:
+                d[key] = value
+        return d
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """copy/pickle時にスロット属性も復元されるようにする.
+
+        BaseExceptionの標準実装は__dict__しか引き継がないため、
+        スロットに保持した属性を状態として追加します。
+
+        Returns:
+            tuple[Any, ...]: 再構築用のクラス、引数、状態
+        """
+        state = dict(getattr(self, "__dict__", None) or {})
+        for cls in type(self).__mro__:
+            for name in cls.__dict__.get("__slots__", ()):
+                if hasattr(self, name):
+                    state[name] = getattr(self, name)
+        return (type(self), self.args, state)
+
     def __str__(self) -> str:
         """エラーメッセージを文字列として返す.
 
@@ -46,7 +86,7 @@ class GoogleCalendarMCPError(Exception):
         """
         base_msg = self.message
         if self.details:
-            details_str = ", ".join(f"{k}={v}" for k, v in self.details.items())
+            details_str = ", ".join([f"{k}={v}" for k, v in self.details.items()])
             base_msg += f" ({details_str})"
         if self.original_error:
             base_msg += f" [Caused by: {type(self.original_error).__name__}: {self.original_error}]"
@@ -66,6 +106,8 @@ class GoogleCalendarAPIError(GoogleCalendarMCPError):
         error_code: Googleのエラーコード
     """
 
+    __slots__ = ("status_code", "error_code")
+
     def __init__(
         self,
         message: str,
@@ -73,6 +115,7 @@ class GoogleCalendarAPIError(GoogleCalendarMCPError):
         error_code: Optional[str] = None,
         details: Optional[dict[str, Any]] = None,
         original_error: Optional[Exception] = None,
+        **extra_details: Any,
     ) -> None:
         """GoogleCalendarAPIErrorを初期化.
 
@@ -82,15 +125,13 @@ class GoogleCalendarAPIError(GoogleCalendarMCPError):
             error_code: Googleのエラーコード
             details: 追加の詳細情報
             original_error: 元の例外
+            **extra_details: サブクラス固有の詳細情報（値が偽の場合は追加しない）
         """
         self.status_code = status_code
         self.error_code = error_code
-        if status_code:
-            details = details or {}
-            details["status_code"] = status_code
-        if error_code:
-            details = details or {}
-            details["error_code"] = error_code
+        details = self._build_details(
+            details, **extra_details, status_code=status_code, error_code=error_code
+        )
         super().__init__(message, details, original_error)
 
 
@@ -100,6 +141,8 @@ class GoogleAuthenticationError(GoogleCalendarAPIError):
     アクセストークンやリフレッシュトークンが無効または期限切れの場合に発生します。
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str = "Google Calendarの認証に失敗しました。認証情報を確認してください。",
@@ -128,6 +171,8 @@ class GooglePermissionError(GoogleCalendarAPIError):
     カレンダーやイベントへのアクセス権限がない場合に発生します。
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str = "Google Calendarリソースへのアクセス権限がありません。",
@@ -145,17 +190,14 @@ class GooglePermissionError(GoogleCalendarAPIError):
             details: 追加の詳細情報
             original_error: 元の例外
         """
-        details = details or {}
-        if resource_type:
-            details["resource_type"] = resource_type
-        if resource_id:
-            details["resource_id"] = resource_id
         super().__init__(
             message=message,
             status_code=403,
             error_code="forbidden",
             details=details,
             original_error=original_error,
+            resource_type=resource_type,
+            resource_id=resource_id,
         )
 
 
@@ -165,6 +207,8 @@ class GoogleNotFoundError(GoogleCalendarAPIError):
     指定されたカレンダーやイベントが存在しない場合に発生します。
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str = "指定されたGoogle Calendarリソースが見つかりません。",
@@ -182,17 +226,14 @@ class GoogleNotFoundError(GoogleCalendarAPIError):
             details: 追加の詳細情報
             original_error: 元の例外
         """
-        details = details or {}
-        if resource_type:
-            details["resource_type"] = resource_type
-        if resource_id:
-            details["resource_id"] = resource_id
         super().__init__(
             message=message,
             status_code=404,
             error_code="not_found",
             details=details,
             original_error=original_error,
+            resource_type=resource_type,
+            resource_id=resource_id,
         )
 
 
@@ -202,6 +243,8 @@ class GoogleRateLimitError(GoogleCalendarAPIError):
     API呼び出しレートが制限を超えた場合に発生します。
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str = "Google Calendar APIのレート制限に達しました。しばらくお待ちください。",
@@ -217,15 +260,13 @@ class GoogleRateLimitError(GoogleCalendarAPIError):
             details: 追加の詳細情報
             original_error: 元の例外
         """
-        details = details or {}
-        if retry_after:
-            details["retry_after"] = retry_after
         super().__init__(
             message=message,
             status_code=429,
             error_code="rate_limited",
             details=details,
             original_error=original_error,
+            retry_after=retry_after,
         )
 
 
@@ -235,6 +276,8 @@ class GoogleValidationError(GoogleCalendarAPIError):
     リクエストパラメータが不正な場合に発生します。
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str = "リクエストパラメータが不正です。",
@@ -250,15 +293,13 @@ class GoogleValidationError(GoogleCalendarAPIError):
             details: 追加の詳細情報
             original_error: 元の例外
         """
-        details = details or {}
-        if field:
-            details["field"] = field
         super().__init__(
             message=message,
             status_code=400,
             error_code="validation_error",
             details=details,
             original_error=original_error,
+            field=field,
         )
 
 
@@ -268,6 +309,8 @@ class GoogleServerError(GoogleCalendarAPIError):
     Google側のサーバーエラーが発生した場合に発生します。
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str = "Google Calendar APIでサーバーエラーが発生しました。時間をおいて再度お試しください。",
@@ -301,6 +344,8 @@ class NetworkError(GoogleCalendarMCPError):
     接続タイムアウト、DNS解決失敗などのネットワークレベルのエラーを表現します。
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str = "ネットワーク通信でエラーが発生しました。",
@@ -323,6 +368,8 @@ class TimeoutError(NetworkError):
     リクエストがタイムアウトした場合に発生します。
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str = "リクエストがタイムアウトしました。",
@@ -338,9 +385,7 @@ class TimeoutError(NetworkError):
             details: 追加の詳細情報
             original_error: 元の例外
         """
-        details = details or {}
-        if timeout_seconds:
-            details["timeout_seconds"] = timeout_seconds
+        details = self._build_details(details, timeout_seconds=timeout_seconds)
         super().__init__(message, details, original_error)
 
 
@@ -353,6 +398,8 @@ class DataParsingError(GoogleCalendarMCPError):
     Google Calendar APIのレスポンスをパースする際にエラーが発生した場合に発生します。
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str = "データのパースに失敗しました。",
@@ -372,11 +419,7 @@ class DataParsingError(GoogleCalendarMCPError):
             details: 追加の詳細情報
             original_error: 元の例外
         """
-        details = details or {}
-        if field:
-            details["field"] = field
-        if expected_type:
-            details["expected_type"] = expected_type
+        details = self._build_details(details, field=field, expected_type=expected_type)
         if actual_value is not None:
             details["actual_value"] = str(actual_value)[:100]  # 長すぎる値は切り詰め
         super().__init__(message, details, original_error)
@@ -391,6 +434,8 @@ class ConfigurationError(GoogleCalendarMCPError):
     環境変数や設定ファイルの読み込みに失敗した場合に発生します。
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str = "設定の読み込みに失敗しました。",
@@ -406,7 +451,5 @@ class ConfigurationError(GoogleCalendarMCPError):
             details: 追加の詳細情報
             original_error: 元の例外
         """
-        details = details or {}
-        if config_key:
-            details["config_key"] = config_key
+        details = self._build_details(details, config_key=config_key)
         super().__init__(message, details, original_error)
@@ -4,13 +4,31 @@
 サポートするロギング機能を提供します。
 """
 
-import json
 import logging
 import sys
 import time
-from datetime import datetime
+from functools import cache
 from typing import Any, Optional
 
+import orjson
+
+# 毎レコード呼び出す関数はモジュール属性の参照を省くため束縛しておく
+_json_dumps = orjson.dumps
+_JSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+# タイムスタンプの秒単位までの書式（ISO 8601、ローカル時刻）
+# strftimeはロケール処理を経由するため、struct_timeの先頭6要素を直接埋め込む
+_TIMESTAMP_FORMAT = "%04d-%02d-%02dT%02d:%02d:%02d"
+
+# HTTPステータスコードごとのレスポンスログのレベル（4xxはWARNING、5xxはERROR）
+_STATUS_LOG_LEVELS = tuple(
+    logging.ERROR if code >= 500 else logging.WARNING if code >= 400 else logging.DEBUG
+    for code in range(600)
+)
+
+# マスク対象のヘッダー名（小文字）
+_SENSITIVE_HEADER_KEYS = frozenset({"authorization", "api-key", "x-api-key", "x-goog-api-key"})
+
 
 class StructuredFormatter(logging.Formatter):
     """構造化ログ（JSON形式）のフォーマッター.
@@ -28,8 +46,35 @@ class StructuredFormatter(logging.Formatter):
             use_json: JSON形式で出力するか
         """
         self.use_json = use_json
+        # 直近に整形した秒とその文字列（同じ秒のログが続く場合に再利用する）
+        self._cached_timestamp: tuple[int, str] = (-1, "")
         super().__init__()
 
+    def _format_timestamp(self, created: float) -> str:
+        """ログレコードの作成時刻をISO 8601形式の文字列に変換.
+
+        datetimeオブジェクトを生成せず、秒単位までの文字列をキャッシュして
+        マイクロ秒部分のみを付け加えます。
+
+        Args:
+            created: ログレコードの作成時刻（エポック秒）
+
+        Returns:
+            str: ISO 8601形式のタイムスタンプ（マイクロ秒まで）
+        """
+        # datetime.fromtimestampと同じく小数部をマイクロ秒に丸める（偶数丸め）
+        seconds = int(created)
+        micros = round((created - seconds) * 1e6)
+        if micros >= 1_000_000:
+            seconds += 1
+            micros -= 1_000_000
+        cached_seconds, prefix = self._cached_timestamp
+        if seconds != cached_seconds:
+            prefix = _TIMESTAMP_FORMAT % time.localtime(seconds)[:6]
+            # 複数スレッドから使われても不整合にならないようタプルでまとめて更新
+            self._cached_timestamp = (seconds, prefix)
+        return f"{prefix}.{micros:06d}"
+
     def format(self, record: logging.LogRecord) -> str:
         """ログレコードをフォーマット.
 
@@ -46,6 +91,22 @@ class StructuredFormatter(logging.Formatter):
         # JSON形式（機械可読性重視）
         return self._format_json(record)
 
+    def _exception_text(self, record: logging.LogRecord) -> Optional[str]:
+        """ログレコードの例外情報を文字列で取得.
+
+        標準のFormatter.formatと同様にrecord.exc_textへキャッシュするため、
+        同じレコードを複数のハンドラーで出力してもトレースバックの整形は1回で済みます。
+
+        Args:
+            record: ログレコード
+
+        Returns:
+            Optional[str]: 整形済みの例外情報（例外がない場合はNone）
+        """
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        return record.exc_text
+
     def _format_plain(self, record: logging.LogRecord) -> str:
         """通常フォーマットでログを出力.
 
@@ -55,23 +116,25 @@ class StructuredFormatter(logging.Formatter):
         Returns:
             str: フォーマットされたログメッセージ
         """
-        timestamp = datetime.fromtimestamp(record.created).isoformat()
+        timestamp = self._format_timestamp(record.created)
         level = record.levelname
         name = record.name
-        message = record.getMessage()
+        # 引数がない場合は%演算子による整形を省略する
+        message = str(record.msg) if not record.args else record.getMessage()
 
         # 基本フォーマット
         log_line = f"{timestamp} - {name} - {level} - {message}"
 
-        # 追加のコンテキスト情報
-        if hasattr(record, "extra_fields"):
-            extra = record.extra_fields
-            extra_str = " | ".join(f"{k}={v}" for k, v in extra.items())
+        # 追加のコンテキスト情報（属性の有無確認と取得を1回の参照で行う）
+        extra = getattr(record, "extra_fields", None)
+        if extra:
+            extra_str = " | ".join([f"{k}={v}" for k, v in extra.items()])
             log_line += f" | {extra_str}"
 
-        # 例外情報
-        if record.exc_info:
-            log_line += "\n" + self.formatException(record.exc_info)
+        # 例外情報（整形済みの文字列をレコードにキャッシュし、他のハンドラーと共有する）
+        exc_text = self._exception_text(record)
+        if exc_text:
+            log_line += "\n" + exc_text
 
         return log_line
 
@@ -84,25 +147,31 @@ class StructuredFormatter(logging.Formatter):
         Returns:
             str: JSON形式のログメッセージ
         """
+        # 引数がない場合は%演算子による整形を省略する
+        message = str(record.msg) if not record.args else record.getMessage()
         log_data: dict[str, Any] = {
-            "timestamp": datetime.fromtimestamp(record.created).isoformat(),
+            "timestamp": self._format_timestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
-            "message": record.getMessage(),
+            "message": message,
             "module": record.module,
             "function": record.funcName,
             "line": record.lineno,
         }
 
-        # 追加のコンテキスト情報
-        if hasattr(record, "extra_fields"):
-            log_data.update(record.extra_fields)
+        # 追加のコンテキスト情報（属性の有無確認と取得を1回の参照で行う）
+        extra_fields = getattr(record, "extra_fields", None)
+        if extra_fields:
+            log_data.update(extra_fields)
 
-        # 例外情報
-        if record.exc_info:
-            log_data["exception"] = self.formatException(record.exc_info)
+        # 例外情報（整形済みの文字列をレコードにキャッシュし、他のハンドラーと共有する）
+        exc_text = self._exception_text(record)
+        if exc_text:
+            log_data["exception"] = exc_text
 
-        return json.dumps(log_data, ensure_ascii=False)
+        # orjsonは非ASCII文字をエスケープせずに出力する
+        # （シリアライズできない値はstr()で文字列化し、ログ出力自体は失敗させない）
+        return _json_dumps(log_data, default=str, option=_JSON_OPTIONS).decode()
 
 
 class ContextLogger(logging.LoggerAdapter):
@@ -110,6 +179,7 @@ class ContextLogger(logging.LoggerAdapter):
 
     リクエストID、ユーザーIDなどのコンテキスト情報を
     全てのログメッセージに自動的に付加します。
+    コンテキストの辞書はログレコード間で共有されるため、読み取り専用として扱います。
 
     Example:
         >>> logger = ContextLogger(base_logger, {"request_id": "req-123"})
@@ -128,9 +198,14 @@ class ContextLogger(logging.LoggerAdapter):
             tuple[str, Any]: 処理されたメッセージとキーワード引数
         """
         # extraフィールドにコンテキストを追加
-        extra = kwargs.get("extra", {})
-        extra["extra_fields"] = {**self.extra, **extra.get("extra_fields", {})}
-        kwargs["extra"] = extra
+        # 呼び出しごとの追加フィールドがない場合は、マージせずにself.extraをそのまま渡す
+        # （フォーマッターはextra_fieldsを読み取るだけなので共有しても安全）
+        extra = kwargs.get("extra")
+        if extra is None:
+            kwargs["extra"] = {"extra_fields": self.extra}
+        else:
+            fields = extra.get("extra_fields")
+            extra["extra_fields"] = {**self.extra, **fields} if fields else self.extra
         return msg, kwargs
 
 
@@ -169,6 +244,10 @@ class RequestLogger:
         """
         start_time = time.monotonic()
 
+        # DEBUGログが無効な場合はマスクや切り詰めを行わずに返す
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return start_time
+
         log_data = {
             "event": "http_request",
             "method": method,
@@ -184,7 +263,9 @@ class RequestLogger:
             log_data["body"] = self._truncate_body(body)
 
         self.logger.debug(
-            f"Request: {method} {url}",
+            "Request: %s %s",
+            method,
+            url,
             extra={"extra_fields": log_data},
         )
 
@@ -209,6 +290,18 @@ class RequestLogger:
         """
         elapsed = time.monotonic() - start_time
 
+        # ログレベルを決定（エラーコードや実行時間に基づく）
+        if error or status_code >= 600:
+            log_level = logging.ERROR
+        else:
+            log_level = _STATUS_LOG_LEVELS[status_code]
+            if log_level == logging.DEBUG and elapsed > 5.0:  # 5秒以上かかった場合
+                log_level = logging.WARNING
+
+        # 出力されないレベルの場合はログデータを組み立てない
+        if not self.logger.isEnabledFor(log_level):
+            return
+
         log_data = {
             "event": "http_response",
             "status_code": status_code,
@@ -227,19 +320,11 @@ class RequestLogger:
         if error:
             log_data["error"] = str(error)
 
-        # ログレベルを決定（エラーコードや実行時間に基づく）
-        if error or status_code >= 500:
-            log_level = logging.ERROR
-        elif status_code >= 400:
-            log_level = logging.WARNING
-        elif elapsed > 5.0:  # 5秒以上かかった場合
-            log_level = logging.WARNING
-        else:
-            log_level = logging.DEBUG
-
         self.logger.log(
             log_level,
-            f"Response: {status_code} ({elapsed*1000:.0f}ms)",
+            "Response: %s (%.0fms)",
+            status_code,
+            elapsed * 1000,
             extra={"extra_fields": log_data},
         )
 
@@ -265,17 +350,15 @@ class RequestLogger:
         Returns:
             dict[str, str]: マスクされたヘッダー
         """
-        sensitive_keys = {"authorization", "api-key", "x-api-key", "x-goog-api-key"}
-        masked_headers = {}
-
-        for key, value in headers.items():
-            if key.lower() in sensitive_keys:
-                # 最初の4文字のみ表示
-                masked_headers[key] = value[:4] + "..." if len(value) > 4 else "***"
-            else:
-                masked_headers[key] = value
-
-        return masked_headers
+        # 機密ヘッダーは最初の4文字のみ表示
+        return {
+            key: (
+                (value[:4] + "..." if len(value) > 4 else "***")
+                if key.lower() in _SENSITIVE_HEADER_KEYS
+                else value
+            )
+            for key, value in headers.items()
+        }
 
     def _truncate_body(self, body: Any, max_length: int = 500) -> Any:
         """ボディが長すぎる場合は切り詰め.
@@ -292,8 +375,14 @@ class RequestLogger:
                 return body[:max_length] + "..."
             return body
         elif isinstance(body, dict):
-            # JSON形式の場合
-            body_str = json.dumps(body, ensure_ascii=False)
+            # JSON形式の場合: orjsonでバイト列のままシリアライズし、
+            # 文字列化は切り詰めが必要な先頭部分だけに限定する
+            body_bytes = _json_dumps(body, default=str, option=_JSON_OPTIONS)
+            # バイト数が上限以下なら文字数も上限以下
+            if len(body_bytes) <= max_length:
+                return body
+            # UTF-8は1文字最大4バイトなので、(max_length + 1)文字分を含む範囲だけ復号する
+            body_str = body_bytes[: (max_length + 1) * 4].decode("utf-8", errors="ignore")
             if len(body_str) > max_length:
                 return body_str[:max_length] + "..."
             return body
@@ -301,6 +390,19 @@ class RequestLogger:
             return str(body)[:max_length]
 
 
+@cache
+def _get_formatter(use_json: bool) -> StructuredFormatter:
+    """出力形式ごとに共有するフォーマッターを取得.
+
+    Args:
+        use_json: JSON形式で出力するか
+
+    Returns:
+        StructuredFormatter: フォーマッター
+    """
+    return StructuredFormatter(use_json=use_json)
+
+
 def setup_logger(
     name: str,
     level: str = "INFO",
@@ -309,6 +411,9 @@ def setup_logger(
 ) -> logging.Logger:
     """ロガーをセットアップ.
 
+    同じ設定で繰り返し呼び出した場合は既存のハンドラーを再利用します。
+    利用者が追加したハンドラーは削除しません。
+
     Args:
         name: ロガー名
         level: ログレベル（DEBUG, INFO, WARNING, ERROR, CRITICAL）
@@ -324,22 +429,31 @@ def setup_logger(
     """
     logger = logging.getLogger(name)
 
-    # 既存のハンドラーをクリア（重複防止）
-    logger.handlers.clear()
-
     # ログレベル設定
     log_level = getattr(logging, level.upper(), logging.INFO)
     logger.setLevel(log_level)
 
-    # ハンドラー作成
-    handler = logging.StreamHandler(stream or sys.stderr)
-    handler.setLevel(log_level)
-
-    # フォーマッター設定
-    formatter = StructuredFormatter(use_json=use_json)
-    handler.setFormatter(formatter)
-
-    logger.addHandler(handler)
+    # このモジュールが追加したハンドラーのうち、同じ設定のものは再利用し、
+    # 設定が異なるものだけを取り除く（利用者が追加したハンドラーは残す）
+    target = stream or sys.stderr
+    handler_key = (log_level, use_json, id(target))
+    existing: Optional[logging.Handler] = None
+    for handler in list(logger.handlers):
+        key = getattr(handler, "_hisho_handler_key", None)
+        if key is None:
+            continue
+        if key == handler_key and existing is None:
+            existing = handler
+        else:
+            logger.removeHandler(handler)
+
+    if existing is None:
+        # ハンドラー作成
+        stream_handler = logging.StreamHandler(target)
+        stream_handler.setLevel(log_level)
+        stream_handler.setFormatter(_get_formatter(use_json))
+        stream_handler._hisho_handler_key = handler_key  # type: ignore[attr-defined]
+        logger.addHandler(stream_handler)
 
     # 伝播を無効化（ルートロガーとの重複を防ぐ）
     logger.propagate = False
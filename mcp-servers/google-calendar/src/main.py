@@ -7,19 +7,25 @@ Google Calendar連携のツールを公開します。
 import asyncio
 import logging
 import os
-from datetime import datetime, timedelta, timezone
-from typing import Any, Optional
+from bisect import bisect_left, bisect_right
+from collections.abc import Awaitable, Callable
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any, Optional
 
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import TextContent, Tool
 
-from .auth import GoogleCalendarAuth
-from .calendar_client import GoogleCalendarClient
-from .config import GoogleCalendarConfig
 from .exceptions import ConfigurationError, GoogleCalendarMCPError
 from .logger import setup_logger
-from .models import CalendarEvent, EventDateTime
+from .models import Calendar, CalendarEvent, EventDateTime
+
+if TYPE_CHECKING:
+    # 認証・APIクライアント・設定（httpx, pydantic-settings）はmain()内で読み込む
+    from .calendar_client import GoogleCalendarClient
+    from .config import GoogleCalendarConfig
 
 # ロギング設定（環境変数で制御）
 log_level = os.getenv("MCP_LOG_LEVEL", "INFO")
@@ -32,207 +38,237 @@ logger = setup_logger(
 )
 
 # グローバル変数
-config: GoogleCalendarConfig
-calendar_client: GoogleCalendarClient
+config: "GoogleCalendarConfig"
+calendar_client: "GoogleCalendarClient"
 server = Server("hisho-google-calendar-mcp")
 
+# デフォルトの取得期間・「今週」の範囲（timedeltaは不変なので共有する）
+_ONE_WEEK = timedelta(days=7)
 
-@server.list_tools()
-async def list_tools() -> list[Tool]:
-    """利用可能なツール一覧を返す.
+# 予定一覧の表示に必要なフィールドのみを取得する（部分レスポンス）
+# CalendarEventの必須項目と、一覧の整形で参照する項目を含める
+_EVENT_LIST_FIELDS = (
+    "items(id,summary,location,start,end,status,htmlLink,created,updated),nextPageToken"
+)
 
-    Returns:
-        list[Tool]: ツールのリスト
-    """
-    return [
-        Tool(
-            name="list_calendars",
-            description=(
-                "Google Calendarのカレンダー一覧を取得します。"
-                "アクセス可能なすべてのカレンダーの情報（ID、名前、アクセス権限など）を取得できます。"
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {},
-            },
+# アクセス権限の日本語表示
+_ACCESS_ROLE_LABELS = {
+    "owner": "オーナー",
+    "writer": "編集者",
+    "reader": "閲覧者",
+    "freeBusyReader": "空き時間情報のみ",
+}
+
+
+# 提供するツールの定義（静的なのでインポート時に1回だけ構築する）
+_TOOLS: list[Tool] = [
+    Tool(
+        name="list_calendars",
+        description=(
+            "Google Calendarのカレンダー一覧を取得します。"
+            "アクセス可能なすべてのカレンダーの情報（ID、名前、アクセス権限など）を取得できます。"
         ),
-        Tool(
-            name="get_events",
-            description=(
-                "Google Calendarから予定一覧を取得します。"
-                "期間を指定して、その期間内の予定を取得できます。"
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "calendar_id": {
-                        "type": "string",
-                        "description": (
-                            "カレンダーID。省略時はデフォルトカレンダーを使用します。"
-                        ),
-                    },
-                    "time_min": {
-                        "type": "string",
-                        "description": (
-                            "取得開始日時（ISO 8601形式、例: 2026-02-04T00:00:00+09:00）。"
-                            "省略時は現在時刻から取得します。"
-                        ),
-                    },
-                    "time_max": {
-                        "type": "string",
-                        "description": (
-                            "取得終了日時（ISO 8601形式）。"
-                            "省略時はtime_minから7日後まで取得します。"
-                        ),
-                    },
-                    "max_results": {
-                        "type": "integer",
-                        "description": "最大取得件数（デフォルト: 10）",
-                        "default": 10,
-                    },
+        inputSchema={
+            "type": "object",
+            "properties": {},
+        },
+    ),
+    Tool(
+        name="get_events",
+        description=(
+            "Google Calendarから予定一覧を取得します。"
+            "期間を指定して、その期間内の予定を取得できます。"
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "calendar_id": {
+                    "type": "string",
+                    "description": (
+                        "カレンダーID。省略時はデフォルトカレンダーを使用します。"
+                    ),
+                },
+                "time_min": {
+                    "type": "string",
+                    "description": (
+                        "取得開始日時（ISO 8601形式、例: 2026-02-04T00:00:00+09:00）。"
+                        "省略時は現在時刻から取得します。"
+                    ),
+                },
+                "time_max": {
+                    "type": "string",
+                    "description": (
+                        "取得終了日時（ISO 8601形式）。"
+                        "省略時はtime_minから7日後まで取得します。"
+                    ),
+                },
+                "max_results": {
+                    "type": "integer",
+                    "description": "最大取得件数（デフォルト: 10）",
+                    "default": 10,
                 },
             },
-        ),
-        Tool(
-            name="get_event",
-            description="指定したイベントの詳細情報を取得します。",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "event_id": {
-                        "type": "string",
-                        "description": "イベントID",
-                    },
-                    "calendar_id": {
-                        "type": "string",
-                        "description": (
-                            "カレンダーID。省略時はデフォルトカレンダーを使用します。"
-                        ),
-                    },
+        },
+    ),
+    Tool(
+        name="get_event",
+        description="指定したイベントの詳細情報を取得します。",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "event_id": {
+                    "type": "string",
+                    "description": "イベントID",
+                },
+                "calendar_id": {
+                    "type": "string",
+                    "description": (
+                        "カレンダーID。省略時はデフォルトカレンダーを使用します。"
+                    ),
                 },
-                "required": ["event_id"],
             },
+            "required": ["event_id"],
+        },
+    ),
+    Tool(
+        name="create_event",
+        description=(
+            "Google Calendarに新しい予定を作成します。"
+            "タイトル、開始・終了日時を指定して予定を作成できます。"
         ),
-        Tool(
-            name="create_event",
-            description=(
-                "Google Calendarに新しい予定を作成します。"
-                "タイトル、開始・終了日時を指定して予定を作成できます。"
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "summary": {
-                        "type": "string",
-                        "description": "予定のタイトル",
-                    },
-                    "start_time": {
-                        "type": "string",
-                        "description": (
-                            "開始日時（ISO 8601形式、例: 2026-02-05T14:00:00+09:00）"
-                        ),
-                    },
-                    "end_time": {
-                        "type": "string",
-                        "description": "終了日時（ISO 8601形式）",
-                    },
-                    "location": {
-                        "type": "string",
-                        "description": "場所（オプション）",
-                    },
-                    "description": {
-                        "type": "string",
-                        "description": "詳細説明（オプション）",
-                    },
-                    "calendar_id": {
-                        "type": "string",
-                        "description": (
-                            "カレンダーID。省略時はデフォルトカレンダーを使用します。"
-                        ),
-                    },
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "summary": {
+                    "type": "string",
+                    "description": "予定のタイトル",
+                },
+                "start_time": {
+                    "type": "string",
+                    "description": (
+                        "開始日時（ISO 8601形式、例: 2026-02-05T14:00:00+09:00）"
+                    ),
+                },
+                "end_time": {
+                    "type": "string",
+                    "description": "終了日時（ISO 8601形式）",
+                },
+                "location": {
+                    "type": "string",
+                    "description": "場所（オプション）",
+                },
+                "description": {
+                    "type": "string",
+                    "description": "詳細説明（オプション）",
+                },
+                "calendar_id": {
+                    "type": "string",
+                    "description": (
+                        "カレンダーID。省略時はデフォルトカレンダーを使用します。"
+                    ),
                 },
-                "required": ["summary", "start_time", "end_time"],
             },
-        ),
-        Tool(
-            name="update_event",
-            description="既存の予定を更新します。",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "event_id": {
-                        "type": "string",
-                        "description": "更新するイベントのID",
-                    },
-                    "summary": {
-                        "type": "string",
-                        "description": "新しいタイトル（オプション）",
-                    },
-                    "start_time": {
-                        "type": "string",
-                        "description": "新しい開始日時（ISO 8601形式）（オプション）",
-                    },
-                    "end_time": {
-                        "type": "string",
-                        "description": "新しい終了日時（ISO 8601形式）（オプション）",
-                    },
-                    "location": {
-                        "type": "string",
-                        "description": "新しい場所（オプション）",
-                    },
-                    "description": {
-                        "type": "string",
-                        "description": "新しい詳細説明（オプション）",
-                    },
-                    "calendar_id": {
-                        "type": "string",
-                        "description": (
-                            "カレンダーID。省略時はデフォルトカレンダーを使用します。"
-                        ),
-                    },
+            "required": ["summary", "start_time", "end_time"],
+        },
+    ),
+    Tool(
+        name="update_event",
+        description="既存の予定を更新します。",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "event_id": {
+                    "type": "string",
+                    "description": "更新するイベントのID",
+                },
+                "summary": {
+                    "type": "string",
+                    "description": "新しいタイトル（オプション）",
+                },
+                "start_time": {
+                    "type": "string",
+                    "description": "新しい開始日時（ISO 8601形式）（オプション）",
+                },
+                "end_time": {
+                    "type": "string",
+                    "description": "新しい終了日時（ISO 8601形式）（オプション）",
+                },
+                "location": {
+                    "type": "string",
+                    "description": "新しい場所（オプション）",
+                },
+                "description": {
+                    "type": "string",
+                    "description": "新しい詳細説明（オプション）",
+                },
+                "calendar_id": {
+                    "type": "string",
+                    "description": (
+                        "カレンダーID。省略時はデフォルトカレンダーを使用します。"
+                    ),
                 },
-                "required": ["event_id"],
             },
+            "required": ["event_id"],
+        },
+    ),
+    Tool(
+        name="get_events_from_multiple_calendars",
+        description=(
+            "複数のGoogle Calendarから予定を一括取得します。"
+            "複数のカレンダーの予定をまとめて時系列順に表示できます。"
         ),
-        Tool(
-            name="get_events_from_multiple_calendars",
-            description=(
-                "複数のGoogle Calendarから予定を一括取得します。"
-                "複数のカレンダーの予定をまとめて時系列順に表示できます。"
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "calendar_ids": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": (
-                            "カレンダーIDのリスト。省略時はすべてのカレンダーから取得します。"
-                        ),
-                    },
-                    "time_min": {
-                        "type": "string",
-                        "description": (
-                            "取得開始日時（ISO 8601形式、例: 2026-02-04T00:00:00+09:00）。"
-                            "省略時は現在時刻から取得します。"
-                        ),
-                    },
-                    "time_max": {
-                        "type": "string",
-                        "description": (
-                            "取得終了日時（ISO 8601形式）。"
-                            "省略時はtime_minから7日後まで取得します。"
-                        ),
-                    },
-                    "max_results_per_calendar": {
-                        "type": "integer",
-                        "description": "各カレンダーからの最大取得件数（デフォルト: 10）",
-                        "default": 10,
-                    },
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "calendar_ids": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": (
+                        "カレンダーIDのリスト。省略時はすべてのカレンダーから取得します。"
+                    ),
+                },
+                "time_min": {
+                    "type": "string",
+                    "description": (
+                        "取得開始日時（ISO 8601形式、例: 2026-02-04T00:00:00+09:00）。"
+                        "省略時は現在時刻から取得します。"
+                    ),
+                },
+                "time_max": {
+                    "type": "string",
+                    "description": (
+                        "取得終了日時（ISO 8601形式）。"
+                        "省略時はtime_minから7日後まで取得します。"
+                    ),
+                },
+                "max_results_per_calendar": {
+                    "type": "integer",
+                    "description": "各カレンダーからの最大取得件数（デフォルト: 10）",
+                    "default": 10,
+                },
+                "include_calendar_names": {
+                    "type": "boolean",
+                    "description": (
+                        "カレンダー名を表示するか（デフォルト: true）。"
+                        "calendar_ids指定時にfalseにすると、カレンダー一覧を取得せず"
+                        "カレンダーIDで表示します。"
+                    ),
+                    "default": True,
                 },
             },
-        ),
-    ]
+        },
+    ),
+]
+
+
+@server.list_tools()
+async def list_tools() -> list[Tool]:
+    """利用可能なツール一覧を返す.
+
+    Returns:
+        list[Tool]: ツールのリスト（呼び出し元が変更しても定義に影響しないようコピーを返す）
+    """
+    return list(_TOOLS)
 
 
 @server.call_tool()
@@ -249,20 +285,10 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
     Raises:
         ValueError: 未知のツール名が指定された場合
     """
-    if name == "list_calendars":
-        return await handle_list_calendars(arguments)
-    elif name == "get_events":
-        return await handle_get_events(arguments)
-    elif name == "get_event":
-        return await handle_get_event(arguments)
-    elif name == "create_event":
-        return await handle_create_event(arguments)
-    elif name == "update_event":
-        return await handle_update_event(arguments)
-    elif name == "get_events_from_multiple_calendars":
-        return await handle_get_events_from_multiple_calendars(arguments)
-    else:
+    handler = _HANDLERS.get(name)
+    if handler is None:
         raise ValueError(f"Unknown tool: {name}")
+    return await handler(arguments)
 
 
 async def handle_list_calendars(arguments: dict) -> list[TextContent]:
@@ -290,28 +316,29 @@ async def handle_list_calendars(arguments: dict) -> list[TextContent]:
         # 結果のフォーマット
         result_lines = [f"カレンダー一覧（全{len(calendars)}件）\n"]
 
-        # プライマリカレンダーを先頭に表示
-        primary_calendars = [cal for cal in calendars if cal.primary]
-        other_calendars = [cal for cal in calendars if not cal.primary]
+        # プライマリカレンダーを先頭に表示（1回の走査で振り分ける）
+        primary_calendars: list[Calendar] = []
+        other_calendars: list[Calendar] = []
+        for cal in calendars:
+            (primary_calendars if cal.primary else other_calendars).append(cal)
 
         # プライマリカレンダー
         if primary_calendars:
             result_lines.append("【プライマリカレンダー】")
-            for calendar in primary_calendars:
-                result_lines.append(format_calendar_summary(calendar))
+            result_lines.extend(map(format_calendar_summary, primary_calendars))
 
         # その他のカレンダー
         if other_calendars:
             if primary_calendars:
                 result_lines.append("\n【その他のカレンダー】")
-            for calendar in other_calendars:
-                result_lines.append(format_calendar_summary(calendar))
+            result_lines.extend(map(format_calendar_summary, other_calendars))
 
         return [TextContent(type="text", text="\n".join(result_lines))]
 
     except GoogleCalendarMCPError as e:
         logger.error(
-            f"Failed to list calendars: {e}",
+            "Failed to list calendars: %s",
+            e,
             extra={"extra_fields": {"error_type": type(e).__name__, "details": e.details}},
         )
         return [
@@ -357,7 +384,7 @@ async def handle_get_events(arguments: dict) -> list[TextContent]:
             time_max = parse_datetime(time_max_str)
         else:
             # デフォルト: time_minから7日後
-            time_max = time_min + timedelta(days=7)
+            time_max = time_min + _ONE_WEEK
 
         # イベントを取得
         events = await calendar_client.list_events(
@@ -365,6 +392,7 @@ async def handle_get_events(arguments: dict) -> list[TextContent]:
             time_min=time_min,
             time_max=time_max,
             max_results=max_results,
+            fields=_EVENT_LIST_FIELDS,
         )
 
         # イベントが0件の場合
@@ -377,22 +405,23 @@ async def handle_get_events(arguments: dict) -> list[TextContent]:
             ]
 
         # 今日と今週の判定用
-        today = datetime.now().date()
-        week_end = today + timedelta(days=7)
+        today = date.today()
+        week_end = today + _ONE_WEEK
 
-        # イベントを今日・今週・それ以降に分類
-        today_events = []
-        this_week_events = []
-        other_events = []
+        # イベントを今日・今週・それ以降に分類し、分類と同時に整形する
+        today_lines: list[str] = []
+        this_week_lines: list[str] = []
+        other_lines: list[str] = []
 
         for event in events:
             event_date = get_event_date(event)
             if event_date == today:
-                today_events.append(event)
+                bucket = today_lines
             elif today < event_date <= week_end:
-                this_week_events.append(event)
+                bucket = this_week_lines
             else:
-                other_events.append(event)
+                bucket = other_lines
+            bucket.append(format_event_summary(event))
 
         # 結果のフォーマット
         result_lines = []
@@ -404,22 +433,19 @@ async def handle_get_events(arguments: dict) -> list[TextContent]:
         result_lines.append(f"予定一覧（全{len(events)}件）\n")
 
         # 今日の予定
-        if today_events:
+        if today_lines:
             result_lines.append("【今日の予定】")
-            for event in today_events:
-                result_lines.append(format_event_summary(event))
+            result_lines.extend(today_lines)
 
         # 今週の予定
-        if this_week_events:
+        if this_week_lines:
             result_lines.append("\n【今週の予定】")
-            for event in this_week_events:
-                result_lines.append(format_event_summary(event))
+            result_lines.extend(this_week_lines)
 
         # その他の予定
-        if other_events:
+        if other_lines:
             result_lines.append("\n【それ以降の予定】")
-            for event in other_events:
-                result_lines.append(format_event_summary(event))
+            result_lines.extend(other_lines)
 
         return [TextContent(type="text", text="\n".join(result_lines))]
 
@@ -432,7 +458,8 @@ async def handle_get_events(arguments: dict) -> list[TextContent]:
         ]
     except GoogleCalendarMCPError as e:
         logger.error(
-            f"Failed to get events: {e}",
+            "Failed to get events: %s",
+            e,
             extra={"extra_fields": {"error_type": type(e).__name__, "details": e.details}},
         )
         return [
@@ -485,7 +512,8 @@ async def handle_get_event(arguments: dict) -> list[TextContent]:
 
     except GoogleCalendarMCPError as e:
         logger.error(
-            f"Failed to get event: {e}",
+            "Failed to get event: %s",
+            e,
             extra={"extra_fields": {"error_type": type(e).__name__, "event_id": event_id}},
         )
         return [
@@ -518,7 +546,10 @@ async def handle_create_event(arguments: dict) -> list[TextContent]:
     end_time_str = arguments.get("end_time")
     location = arguments.get("location")
     description = arguments.get("description")
-    calendar_id = arguments.get("calendar_id") or config.google_calendar_id
+    # 設定値は1回だけ参照してローカル変数で使い回す
+    default_calendar_id = config.google_calendar_id
+    time_zone = config.google_calendar_timezone
+    calendar_id = arguments.get("calendar_id") or default_calendar_id
 
     if not summary or not start_time_str or not end_time_str:
         return [
@@ -535,23 +566,24 @@ async def handle_create_event(arguments: dict) -> list[TextContent]:
 
         # イベントオブジェクトの構築
         # Note: IDはサーバー側で自動生成されるため、仮のIDを設定
+        now = datetime.now(timezone.utc)
         event = CalendarEvent(
             id="temp",  # 仮のID（作成時には使用されない）
             summary=summary,
             start=EventDateTime(
                 date_time=start_time,
-                time_zone=config.google_calendar_timezone,
+                time_zone=time_zone,
             ),
             end=EventDateTime(
                 date_time=end_time,
-                time_zone=config.google_calendar_timezone,
+                time_zone=time_zone,
             ),
             location=location,
             description=description,
             status="confirmed",
             html_link="",  # 仮のURL
-            created=datetime.utcnow(),
-            updated=datetime.utcnow(),
+            created=now,
+            updated=now,
         )
 
         # イベントを作成
@@ -564,7 +596,7 @@ async def handle_create_event(arguments: dict) -> list[TextContent]:
         result_lines = ["予定を作成しました。\n"]
 
         # カレンダー情報を追加（デフォルトカレンダーでない場合）
-        if calendar_id != config.google_calendar_id:
+        if calendar_id != default_calendar_id:
             result_lines.append(f"カレンダー: {calendar_id}")
 
         result_lines.extend([
@@ -576,14 +608,10 @@ async def handle_create_event(arguments: dict) -> list[TextContent]:
         if created_event.location:
             result_lines.append(f"場所: {created_event.location}")
 
-        if created_event.description:
+        description = created_event.description
+        if description:
             # 説明が長い場合は省略
-            desc_preview = (
-                created_event.description[:100] + "..."
-                if len(created_event.description) > 100
-                else created_event.description
-            )
-            result_lines.append(f"説明: {desc_preview}")
+            result_lines.append(f"説明: {_truncate_text(description, 100)}")
 
         result_lines.append(f"\nURL: {created_event.html_link}")
         result_lines.append(f"ID: {created_event.id}")
@@ -599,7 +627,8 @@ async def handle_create_event(arguments: dict) -> list[TextContent]:
         ]
     except GoogleCalendarMCPError as e:
         logger.error(
-            f"Failed to create event: {e}",
+            "Failed to create event: %s",
+            e,
             extra={"extra_fields": {"error_type": type(e).__name__, "summary": summary}},
         )
         return [
@@ -633,7 +662,10 @@ async def handle_update_event(arguments: dict) -> list[TextContent]:
     end_time_str = arguments.get("end_time")
     location = arguments.get("location")
     description = arguments.get("description")
-    calendar_id = arguments.get("calendar_id") or config.google_calendar_id
+    # 設定値は1回だけ参照してローカル変数で使い回す
+    default_calendar_id = config.google_calendar_id
+    time_zone = config.google_calendar_timezone
+    calendar_id = arguments.get("calendar_id") or default_calendar_id
 
     if not event_id:
         return [
@@ -645,30 +677,23 @@ async def handle_update_event(arguments: dict) -> list[TextContent]:
 
     try:
         # 更新データの構築
-        updates: dict[str, Any] = {}
-
-        if summary:
-            updates["summary"] = summary
-
-        if start_time_str:
-            start_time = parse_datetime(start_time_str)
-            updates["start"] = {
-                "dateTime": start_time.isoformat(),
-                "timeZone": config.google_calendar_timezone,
+        updates: dict[str, Any] = {"summary": summary} if summary else {}
+
+        for key, time_str in (("start", start_time_str), ("end", end_time_str)):
+            if time_str:
+                updates[key] = {
+                    "dateTime": parse_datetime(time_str).isoformat(),
+                    "timeZone": time_zone,
+                }
+
+        # 場所・説明は空文字列も許容（削除の場合）
+        updates.update(
+            {
+                key: value
+                for key, value in (("location", location), ("description", description))
+                if value is not None
             }
-
-        if end_time_str:
-            end_time = parse_datetime(end_time_str)
-            updates["end"] = {
-                "dateTime": end_time.isoformat(),
-                "timeZone": config.google_calendar_timezone,
-            }
-
-        if location is not None:  # 空文字列も許容（削除の場合）
-            updates["location"] = location
-
-        if description is not None:
-            updates["description"] = description
+        )
 
         # 更新内容がない場合
         if not updates:
@@ -690,7 +715,7 @@ async def handle_update_event(arguments: dict) -> list[TextContent]:
         result_lines = ["予定を更新しました。\n"]
 
         # カレンダー情報を追加（デフォルトカレンダーでない場合）
-        if calendar_id != config.google_calendar_id:
+        if calendar_id != default_calendar_id:
             result_lines.append(f"カレンダー: {calendar_id}")
 
         result_lines.extend([
@@ -715,7 +740,8 @@ async def handle_update_event(arguments: dict) -> list[TextContent]:
         ]
     except GoogleCalendarMCPError as e:
         logger.error(
-            f"Failed to update event: {e}",
+            "Failed to update event: %s",
+            e,
             extra={"extra_fields": {"error_type": type(e).__name__, "event_id": event_id}},
         )
         return [
@@ -749,6 +775,7 @@ async def handle_get_events_from_multiple_calendars(arguments: dict) -> list[Tex
     time_min_str = arguments.get("time_min")
     time_max_str = arguments.get("time_max")
     max_results_per_calendar = arguments.get("max_results_per_calendar", 10)
+    include_calendar_names = arguments.get("include_calendar_names", True)
 
     try:
         # 日時の解析
@@ -762,21 +789,20 @@ async def handle_get_events_from_multiple_calendars(arguments: dict) -> list[Tex
             time_max = parse_datetime(time_max_str)
         else:
             # デフォルト: time_minから7日後
-            time_max = time_min + timedelta(days=7)
+            time_max = time_min + _ONE_WEEK
 
-        # カレンダーIDリストの取得
-        # 省略時はすべてのカレンダーから取得
-        if calendar_ids_arg:
-            calendar_ids = calendar_ids_arg
-            # カレンダー名のマッピングを取得（表示用）
-            all_calendars = await calendar_client.list_calendars()
-            calendar_name_map = {cal.id: cal.summary for cal in all_calendars}
+        # カレンダー名のマッピングを取得（表示用、一覧はクライアント側でキャッシュされる）
+        # IDが指定され名前が不要な場合は一覧を取得しない（IDで表示する）
+        if calendar_ids_arg and not include_calendar_names:
+            calendar_name_map: dict[str, str] = {}
         else:
-            # すべてのカレンダーを取得
             all_calendars = await calendar_client.list_calendars()
-            calendar_ids = [cal.id for cal in all_calendars]
             calendar_name_map = {cal.id: cal.summary for cal in all_calendars}
 
+        # カレンダーIDリストの取得
+        # 省略時はすべてのカレンダーから取得
+        calendar_ids = calendar_ids_arg or list(calendar_name_map)
+
         # カレンダーが0件の場合
         if not calendar_ids:
             return [
@@ -786,59 +812,32 @@ async def handle_get_events_from_multiple_calendars(arguments: dict) -> list[Tex
                 )
             ]
 
-        # 各カレンダーから予定を並行取得
-        # エラーが発生しても他のカレンダーは継続して取得する
-        async def fetch_events_from_calendar(calendar_id: str) -> tuple[str, list[CalendarEvent], Optional[str]]:
-            """カレンダーから予定を取得（エラー処理込み）.
-
-            Args:
-                calendar_id: カレンダーID
-
-            Returns:
-                tuple[str, list[CalendarEvent], Optional[str]]:
-                    (カレンダーID, 予定リスト, エラーメッセージ)
-            """
-            try:
-                events = await calendar_client.list_events(
-                    calendar_id=calendar_id,
-                    time_min=time_min,
-                    time_max=time_max,
-                    max_results=max_results_per_calendar,
-                )
-                return (calendar_id, events, None)
-            except GoogleCalendarMCPError as e:
-                # エラーが発生しても他のカレンダーは継続
-                logger.warning(
-                    f"Failed to get events from calendar '{calendar_id}': {e}",
-                    extra={"extra_fields": {"calendar_id": calendar_id, "error": str(e)}},
-                )
-                return (calendar_id, [], f"{e.message}")
-            except Exception as e:
-                logger.warning(
-                    f"Unexpected error getting events from calendar '{calendar_id}': {e}",
-                    extra={"extra_fields": {"calendar_id": calendar_id, "error": str(e)}},
-                )
-                return (calendar_id, [], f"予期しないエラー: {str(e)}")
-
-        # 並行実行
-        results = await asyncio.gather(
-            *[fetch_events_from_calendar(cal_id) for cal_id in calendar_ids]
+        # 各カレンダーの予定をバッチリクエストでまとめて取得
+        # エラーが発生したカレンダーがあっても他のカレンダーの結果は返す
+        results = await calendar_client.batch_list_events(
+            calendar_ids,
+            time_min=time_min,
+            time_max=time_max,
+            max_results=max_results_per_calendar,
+            fields=_EVENT_LIST_FIELDS,
         )
 
         # 結果を集約
-        all_events: list[tuple[CalendarEvent, str, str]] = []  # (event, calendar_id, calendar_name)
+        # 日付は1回だけ求めて、ソートと分類の両方に使う
+        all_events: list[tuple[date, CalendarEvent, str]] = []  # (event_date, event, calendar_name)
         error_messages: list[str] = []
 
-        for calendar_id, events, error_msg in results:
+        for calendar_id, events, error in results:
             calendar_name = calendar_name_map.get(calendar_id, calendar_id)
 
-            if error_msg:
+            if error:
                 # エラーが発生したカレンダーを記録
-                error_messages.append(f"⚠️ {calendar_name}: {error_msg}")
+                error_messages.append(f"⚠️ {calendar_name}: {error.message}")
             else:
                 # 予定にカレンダー情報を付加
-                for event in events:
-                    all_events.append((event, calendar_id, calendar_name))
+                all_events.extend(
+                    [(get_event_date(event), event, calendar_name) for event in events]
+                )
 
         # 予定が0件の場合
         if not all_events:
@@ -849,26 +848,32 @@ async def handle_get_events_from_multiple_calendars(arguments: dict) -> list[Tex
             return [TextContent(type="text", text="\n".join(result_lines))]
 
         # 開始日時順にソート
-        all_events.sort(key=lambda item: get_event_date(item[0]))
+        all_events.sort(key=itemgetter(0))
 
         # 今日と今週の判定用
-        today = datetime.now().date()
-        week_end = today + timedelta(days=7)
-
-        # イベントを今日・今週・それ以降に分類
-        today_events = []
-        this_week_events = []
-        other_events = []
-
-        for event_tuple in all_events:
-            event, calendar_id, calendar_name = event_tuple
-            event_date = get_event_date(event)
-            if event_date == today:
-                today_events.append(event_tuple)
-            elif today < event_date <= week_end:
-                this_week_events.append(event_tuple)
-            else:
-                other_events.append(event_tuple)
+        today = date.today()
+        week_end = today + _ONE_WEEK
+
+        # 日付順にソート済みなので、今日・今週の予定はそれぞれ連続した範囲になる
+        # 二分探索で境界を求め、スライス単位で分類する
+        today_start = bisect_left(all_events, today, key=itemgetter(0))
+        today_end = bisect_right(all_events, today, lo=today_start, key=itemgetter(0))
+        week_end_index = bisect_right(all_events, week_end, lo=today_end, key=itemgetter(0))
+
+        today_lines = [
+            format_event_with_calendar(event, calendar_name)
+            for _event_date, event, calendar_name in all_events[today_start:today_end]
+        ]
+        this_week_lines = [
+            format_event_with_calendar(event, calendar_name)
+            for _event_date, event, calendar_name in all_events[today_end:week_end_index]
+        ]
+        other_lines = [
+            format_event_with_calendar(event, calendar_name)
+            for _event_date, event, calendar_name in (
+                all_events[:today_start] + all_events[week_end_index:]
+            )
+        ]
 
         # 結果のフォーマット
         result_lines = []
@@ -881,22 +886,19 @@ async def handle_get_events_from_multiple_calendars(arguments: dict) -> list[Tex
         )
 
         # 今日の予定
-        if today_events:
+        if today_lines:
             result_lines.append("【今日の予定】")
-            for event, calendar_id, calendar_name in today_events:
-                result_lines.append(format_event_with_calendar(event, calendar_name))
+            result_lines.extend(today_lines)
 
         # 今週の予定
-        if this_week_events:
+        if this_week_lines:
             result_lines.append("\n【今週の予定】")
-            for event, calendar_id, calendar_name in this_week_events:
-                result_lines.append(format_event_with_calendar(event, calendar_name))
+            result_lines.extend(this_week_lines)
 
         # その他の予定
-        if other_events:
+        if other_lines:
             result_lines.append("\n【それ以降の予定】")
-            for event, calendar_id, calendar_name in other_events:
-                result_lines.append(format_event_with_calendar(event, calendar_name))
+            result_lines.extend(other_lines)
 
         # エラーメッセージを追加
         if error_messages:
@@ -914,7 +916,8 @@ async def handle_get_events_from_multiple_calendars(arguments: dict) -> list[Tex
         ]
     except GoogleCalendarMCPError as e:
         logger.error(
-            f"Failed to get events from multiple calendars: {e}",
+            "Failed to get events from multiple calendars: %s",
+            e,
             extra={"extra_fields": {"error_type": type(e).__name__, "details": e.details}},
         )
         return [
@@ -933,12 +936,27 @@ async def handle_get_events_from_multiple_calendars(arguments: dict) -> list[Tex
         ]
 
 
+# ツール名とハンドラーの対応表（call_toolから参照する）
+_HANDLERS: dict[str, Callable[[dict], Awaitable[list[TextContent]]]] = {
+    "list_calendars": handle_list_calendars,
+    "get_events": handle_get_events,
+    "get_event": handle_get_event,
+    "create_event": handle_create_event,
+    "update_event": handle_update_event,
+    "get_events_from_multiple_calendars": handle_get_events_from_multiple_calendars,
+}
+
+
 # === ヘルパー関数 ===
 
 
+@lru_cache(maxsize=1024)
 def parse_datetime(datetime_str: str) -> datetime:
     """ISO 8601形式の文字列をdatetimeオブジェクトに変換.
 
+    同じ文字列が繰り返し指定されることが多いため、結果をキャッシュします
+    （datetimeは不変なので共有しても安全です）。
+
     Args:
         datetime_str: ISO 8601形式の日時文字列
 
@@ -951,31 +969,42 @@ def parse_datetime(datetime_str: str) -> datetime:
     try:
         # ISO 8601形式をパース
         # タイムゾーン情報を含む場合と含まない場合に対応
-        dt = datetime.fromisoformat(datetime_str.replace("Z", "+00:00"))
-        return dt
+        # （Python 3.11以降のfromisoformatは末尾の"Z"をUTCとして直接解釈できる）
+        return datetime.fromisoformat(datetime_str)
     except ValueError as e:
         raise ValueError(
             f"日時の形式が不正です。ISO 8601形式（例: 2026-02-04T10:00:00+09:00）で指定してください: {datetime_str}"
         ) from e
 
 
-def get_event_date(event: CalendarEvent) -> datetime.date:
+def _truncate_text(text: str, max_length: int) -> str:
+    """文字列が長すぎる場合は省略記号を付けて切り詰める.
+
+    Args:
+        text: 元の文字列
+        max_length: 最大長（文字数）
+
+    Returns:
+        str: 切り詰めた文字列（max_length以下の場合は元の文字列をそのまま返す）
+    """
+    return text[:max_length] + "..." if len(text) > max_length else text
+
+
+def get_event_date(event: CalendarEvent) -> date:
     """イベントの日付を取得.
 
     Args:
         event: カレンダーイベント
 
     Returns:
-        datetime.date: イベントの日付
+        date: イベントの日付
     """
-    if event.start.date_time:
-        return event.start.date_time.date()
-    elif event.start.date:
-        # 終日イベントの場合
-        return datetime.fromisoformat(event.start.date).date()
-    else:
-        # フォールバック: 今日の日付
-        return datetime.now().date()
+    # 開始日はモデル側でキャッシュされる（終日イベントの日付文字列のパースは1回だけ）
+    event_date = event.start_date
+    if event_date is None:
+        # フォールバック: 今日の日付（datetimeを経由せずに取得）
+        return date.today()
+    return event_date
 
 
 def format_event_time(event_dt: EventDateTime) -> str:
@@ -987,9 +1016,10 @@ def format_event_time(event_dt: EventDateTime) -> str:
     Returns:
         str: フォーマットされた日時文字列
     """
-    if event_dt.date_time:
+    date_time = event_dt.date_time
+    if date_time:
         # 時刻指定あり: YYYY-MM-DD HH:MM形式
-        return event_dt.date_time.strftime("%Y-%m-%d %H:%M")
+        return _format_date_time(date_time, date_time.utcoffset())
     elif event_dt.date:
         # 終日イベント: YYYY-MM-DD形式
         return event_dt.date
@@ -997,7 +1027,26 @@ def format_event_time(event_dt: EventDateTime) -> str:
         return "（日時不明）"
 
 
-def format_calendar_summary(calendar) -> str:
+@lru_cache(maxsize=4096)
+def _format_date_time(date_time: datetime, utc_offset: Optional[timedelta]) -> str:
+    """日時をYYYY-MM-DD HH:MM形式にフォーマット（結果をキャッシュ）.
+
+    同じ時刻でもUTCオフセットが異なるdatetimeは等価と判定されるため、
+    表示が混ざらないようオフセットもキャッシュキーに含めます。
+
+    Args:
+        date_time: 日時
+        utc_offset: date_timeのUTCオフセット（キャッシュキー用）
+
+    Returns:
+        str: フォーマットされた日時文字列
+    """
+    # strftimeの書式解釈を避け、isoformatの先頭（YYYY-MM-DD HH:MM）を切り出す
+    # （タイムゾーン付きの場合は末尾に付くUTCオフセットを除く）
+    return date_time.isoformat(sep=" ", timespec="minutes")[:16]
+
+
+def format_calendar_summary(calendar: Calendar) -> str:
     """カレンダーの概要をフォーマット.
 
     Args:
@@ -1006,37 +1055,26 @@ def format_calendar_summary(calendar) -> str:
     Returns:
         str: フォーマットされたカレンダー概要
     """
-    # アクセス権限の日本語表示
-    access_role_map = {
-        "owner": "オーナー",
-        "writer": "編集者",
-        "reader": "閲覧者",
-        "freeBusyReader": "空き時間情報のみ",
-    }
-    access_role_ja = access_role_map.get(calendar.access_role, calendar.access_role)
+    access_role_ja = _ACCESS_ROLE_LABELS.get(calendar.access_role, calendar.access_role)
 
     # プライマリカレンダーの場合は印をつける
     primary_mark = "⭐ " if calendar.primary else ""
+    time_zone_line = (
+        f"   - タイムゾーン: {calendar.time_zone}\n" if calendar.time_zone else ""
+    )
+    description = calendar.description
+    # 説明が長い場合は省略
+    description_line = (
+        f"   - 説明: {_truncate_text(description, 50)}\n" if description else ""
+    )
 
-    result = [
-        f"{primary_mark}📅 {calendar.summary}",
-        f"   - ID: {calendar.id}",
-        f"   - アクセス権限: {access_role_ja}",
-    ]
-
-    if calendar.time_zone:
-        result.append(f"   - タイムゾーン: {calendar.time_zone}")
-
-    if calendar.description:
-        # 説明が長い場合は省略
-        desc_preview = (
-            calendar.description[:50] + "..."
-            if len(calendar.description) > 50
-            else calendar.description
-        )
-        result.append(f"   - 説明: {desc_preview}")
-
-    return "\n".join(result) + "\n"
+    return (
+        f"{primary_mark}📅 {calendar.summary}\n"
+        f"   - ID: {calendar.id}\n"
+        f"   - アクセス権限: {access_role_ja}\n"
+        f"{time_zone_line}"
+        f"{description_line}"
+    )
 
 
 def format_event_summary(event: CalendarEvent) -> str:
@@ -1069,24 +1107,20 @@ def format_event_detail(event: CalendarEvent) -> str:
     Returns:
         str: フォーマットされたイベント詳細
     """
-    lines = [
-        f"# {event.summary or '（タイトルなし）'}\n",
-        f"- 開始: {format_event_time(event.start)}",
-        f"- 終了: {format_event_time(event.end)}",
-    ]
-
-    if event.location:
-        lines.append(f"- 場所: {event.location}")
-
-    lines.append(f"- ステータス: {event.status.value}")
-
-    if event.description:
-        lines.append(f"\n## 説明\n\n{event.description}")
-
-    lines.append(f"\n- URL: {event.html_link}")
-    lines.append(f"- ID: {event.id}")
+    title = event.summary or "（タイトルなし）"
+    location_line = f"- 場所: {event.location}\n" if event.location else ""
+    description_block = f"\n## 説明\n\n{event.description}\n" if event.description else ""
 
-    return "\n".join(lines)
+    return (
+        f"# {title}\n\n"
+        f"- 開始: {format_event_time(event.start)}\n"
+        f"- 終了: {format_event_time(event.end)}\n"
+        f"{location_line}"
+        f"- ステータス: {event.status.value}\n"
+        f"{description_block}"
+        f"\n- URL: {event.html_link}\n"
+        f"- ID: {event.id}"
+    )
 
 
 def format_event_with_calendar(event: CalendarEvent, calendar_name: str) -> str:
@@ -1115,16 +1149,27 @@ async def main() -> None:
     """MCPサーバーのメインエントリーポイント."""
     global config, calendar_client
 
+    # サーバー起動時にのみ必要なモジュールはここで読み込む
+    # （src.mainをインポートするだけのテストやツールではhttpx等を読み込まない）
+    from .auth import GoogleCalendarAuth, close_shared_client
+    from .calendar_client import (
+        GoogleCalendarClient,
+        close_shared_http_client,
+        get_shared_http_client,
+    )
+    from .config import get_config
+
     # 設定を読み込み
     try:
-        config = GoogleCalendarConfig()
+        config = get_config()
         logger.info(
             "Configuration loaded successfully",
             extra={"extra_fields": {"log_level": config.mcp_log_level}},
         )
     except Exception as e:
         logger.error(
-            f"Failed to load configuration: {e}",
+            "Failed to load configuration: %s",
+            e,
             extra={"extra_fields": {"error_type": type(e).__name__}},
         )
         raise ConfigurationError(
@@ -1135,17 +1180,22 @@ async def main() -> None:
     # Google Calendar認証を初期化
     try:
         auth = GoogleCalendarAuth(config)
+        # トークン更新をツール呼び出しの処理経路から外す
+        auth.start_background_refresh()
         logger.info("Google Calendar auth initialized")
     except Exception as e:
-        logger.error(f"Failed to initialize Google Calendar auth: {e}")
+        logger.error("Failed to initialize Google Calendar auth: %s", e)
         raise
 
     # Google Calendarクライアントを初期化
     try:
-        calendar_client = GoogleCalendarClient(config, auth)
+        # HTTPクライアントはプロセス内で共有し、サーバー終了時にまとめて閉じる
+        calendar_client = GoogleCalendarClient(
+            config, auth, http_client=get_shared_http_client()
+        )
         logger.info("Google Calendar client initialized")
     except Exception as e:
-        logger.error(f"Failed to initialize Google Calendar client: {e}")
+        logger.error("Failed to initialize Google Calendar client: %s", e)
         raise
 
     try:
@@ -1156,7 +1206,8 @@ async def main() -> None:
     except GoogleCalendarMCPError as e:
         # カスタム例外はログに記録して再発生
         logger.error(
-            f"MCP server error: {e}",
+            "MCP server error: %s",
+            e,
             extra={"extra_fields": {"error_type": type(e).__name__, "details": e.details}},
         )
         raise
@@ -1167,8 +1218,24 @@ async def main() -> None:
     finally:
         # クリーンアップ
         await calendar_client.close()
+        await close_shared_http_client()
+        await close_shared_client()
         logger.info("MCP server stopped")
 
 
+def run() -> None:
+    """イベントループを起動してMCPサーバーを実行.
+
+    uvloopが利用可能な環境（Linux/macOS）ではuvloopのイベントループを使用し、
+    利用できない環境（Windowsなど）では標準のasyncioイベントループにフォールバックします。
+    """
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
+
+
 if __name__ == "__main__":
-    asyncio.run(main())
+    run()
@@ -4,8 +4,9 @@
 Pydanticモデルを定義しています。
 """
 
-from datetime import datetime
+from datetime import date, datetime
 from enum import Enum
+from functools import cached_property
 from typing import Optional
 
 from pydantic import BaseModel, ConfigDict, Field
@@ -140,6 +141,23 @@ class CalendarEvent(BaseModel):
         use_enum_values=False,
     )
 
+    @cached_property
+    def start_date(self) -> Optional[date]:
+        """開始日を取得（初回アクセス時に計算してキャッシュ）.
+
+        分類や整形で繰り返し参照されるため、終日イベントの日付文字列の
+        パースは1回だけ行います。
+
+        Returns:
+            Optional[date]: 開始日（開始日時・日付のどちらもない場合はNone）
+        """
+        start = self.start
+        if start.date_time:
+            return start.date_time.date()
+        if start.date:
+            return date.fromisoformat(start.date)
+        return None
+
 
 class Calendar(BaseModel):
     """カレンダーを表すモデル.
@@ -48,6 +48,8 @@ class RateLimiter:
         self.tokens = float(capacity)  # 初期状態はフル
         self.last_update = time.monotonic()
         self._lock = asyncio.Lock()
+        # acquireでトークン取得を待っているコルーチンの数（ロック待ちを含む）
+        self._waiters = 0
 
     async def _refill_tokens(self) -> None:
         """経過時間に基づいてトークンを補充.
@@ -79,29 +81,52 @@ class RateLimiter:
                 f"Requested tokens ({tokens}) exceeds bucket capacity ({self.capacity})"
             )
 
-        async with self._lock:
-            while True:
-                # トークンを補充
-                await self._refill_tokens()
+        self._waiters += 1
+        try:
+            async with self._lock:
+                while True:
+                    # トークンを補充
+                    await self._refill_tokens()
 
-                # トークンが十分にある場合、消費して終了
-                if self.tokens >= tokens:
-                    self.tokens -= tokens
-                    return
+                    # トークンが十分にある場合、消費して終了
+                    if self.tokens >= tokens:
+                        self.tokens -= tokens
+                        return
 
-                # トークン不足の場合、必要なトークンが補充されるまでの時間を計算
-                tokens_needed = tokens - self.tokens
-                wait_time = tokens_needed / self.tokens_per_second
+                    # トークン不足の場合、必要なトークンが補充されるまでの時間を計算
+                    tokens_needed = tokens - self.tokens
+                    wait_time = tokens_needed / self.tokens_per_second
 
-                # 待機時間を考慮してトークンを補充
-                await asyncio.sleep(wait_time)
+                    # 待機時間を考慮してトークンを補充
+                    await asyncio.sleep(wait_time)
+        finally:
+            self._waiters -= 1
 
     async def __aenter__(self) -> "RateLimiter":
         """コンテキストマネージャーの開始（async with用）.
 
+        トークンが残っていて待機中のコルーチンもない場合は、
+        ロックや待機を経由せずにその場でトークンを消費します（高速パス）。
+        asyncioの協調スケジューリング下ではawaitを挟まない処理は
+        割り込まれないため、ロックなしでも状態は一貫します。
+
+        ロックの解放直後は、起こされた待機中のコルーチンがまだ実行されておらず
+        ロックも保持されていないため、ロックの状態だけでなく待機数も確認し、
+        待機中のコルーチンより先にトークンを取らないようにします。
+
         Returns:
             RateLimiter: 自身のインスタンス
         """
+        if not self._waiters and not self._lock.locked():
+            now = time.monotonic()
+            self.tokens = min(
+                self.capacity, self.tokens + (now - self.last_update) * self.tokens_per_second
+            )
+            self.last_update = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return self
+
         await self.acquire()
         return self
 
@@ -4,6 +4,7 @@
 """
 
 from datetime import datetime, timedelta
+from pathlib import Path
 
 import pytest
 
@@ -13,9 +14,12 @@ from src.rate_limiter import RateLimiter
 
 
 @pytest.fixture
-def mock_config() -> GoogleCalendarConfig:
+def mock_config(tmp_path: Path) -> GoogleCalendarConfig:
     """モックのGoogle Calendar設定を返す.
 
+    Args:
+        tmp_path: テストごとの一時ディレクトリ（トークンキャッシュの保存先）
+
     Returns:
         GoogleCalendarConfig: テスト用の設定
     """
@@ -29,6 +33,7 @@ def mock_config() -> GoogleCalendarConfig:
         google_calendar_id="primary",
         google_calendar_timezone="Asia/Tokyo",
         mcp_log_level="DEBUG",
+        google_token_cache_path=str(tmp_path / "google_token.json"),
     )
 
 
@@ -185,3 +190,33 @@ def mock_events_list_response(sample_event_dict: dict) -> dict:
         "defaultReminders": [],
         "items": [sample_event_dict],
     }
+
+
+@pytest.fixture
+def mock_calendar_list_response() -> dict:
+    """モックのカレンダー一覧レスポンスを返す.
+
+    Returns:
+        dict: Google Calendar APIのcalendarList.listレスポンス形式
+    """
+    return {
+        "kind": "calendar#calendarList",
+        "etag": "\"test-calendar-list-etag\"",
+        "items": [
+            {
+                "kind": "calendar#calendarListEntry",
+                "id": "primary@example.com",
+                "summary": "Primary Calendar",
+                "timeZone": "Asia/Tokyo",
+                "accessRole": "owner",
+                "primary": True,
+            },
+            {
+                "kind": "calendar#calendarListEntry",
+                "id": "team@group.calendar.google.com",
+                "summary": "Team Calendar",
+                "timeZone": "Asia/Tokyo",
+                "accessRole": "reader",
+            },
+        ],
+    }
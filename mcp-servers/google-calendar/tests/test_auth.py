@@ -3,13 +3,23 @@
 Google Calendar OAuth 2.0認証の動作をテストします。
 """
 
-from datetime import datetime, timedelta
+import asyncio
+import json
+import os
+import time
+from collections.abc import Iterator
+from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
 import pytest
 
-from src.auth import GoogleCalendarAuth
+from src.auth import (
+    GoogleCalendarAuth,
+    _refresh_token_fingerprint,
+    _update_env_file,
+    _write_token_cache,
+)
 from src.config import GoogleCalendarConfig
 from src.exceptions import (
     ConfigurationError,
@@ -19,6 +29,19 @@ from src.exceptions import (
 )
 
 
+@pytest.fixture
+def mock_http_client() -> Iterator[MagicMock]:
+    """トークンエンドポイント用の共有HTTPクライアントをモック.
+
+    Yields:
+        MagicMock: 共有HTTPクライアントの代わりに使用されるモック
+    """
+    client = MagicMock()
+    client.is_closed = False
+    with patch("src.auth._shared_client", client):
+        yield client
+
+
 class TestGoogleCalendarAuth:
     """GoogleCalendarAuthクラスのテスト."""
 
@@ -37,6 +60,21 @@ class TestGoogleCalendarAuth:
             assert auth is not None
             assert isinstance(auth, GoogleCalendarAuth)
 
+    @pytest.mark.asyncio
+    async def test_http_client_shared_between_instances(
+        self, mock_config: GoogleCalendarConfig
+    ) -> None:
+        """複数インスタンス間でHTTPクライアントが共有されることを確認."""
+        with patch("src.auth._shared_client", None):
+            auth1 = GoogleCalendarAuth(mock_config)
+            auth2 = GoogleCalendarAuth(mock_config)
+
+            client1 = await auth1._get_client()
+            client2 = await auth2._get_client()
+
+            assert client1 is client2
+            await client1.aclose()
+
     def test_is_token_expired_no_token(self, mock_config: GoogleCalendarConfig) -> None:
         """トークンがない場合は期限切れと判定されることを確認."""
         auth = GoogleCalendarAuth(mock_config)
@@ -47,7 +85,7 @@ class TestGoogleCalendarAuth:
         """有効期限がない場合は期限切れと判定されることを確認."""
         auth = GoogleCalendarAuth(mock_config)
         auth._access_token = "valid-token"
-        auth._token_expiry = None
+        auth._expiry_monotonic = 0.0
         assert auth.is_token_expired() is True
 
     def test_is_token_expired_expired(self, mock_config: GoogleCalendarConfig) -> None:
@@ -55,49 +93,201 @@ class TestGoogleCalendarAuth:
         auth = GoogleCalendarAuth(mock_config)
         auth._access_token = "valid-token"
         # 1時間前に期限切れ
-        auth._token_expiry = datetime.utcnow() - timedelta(hours=1)
+        auth._expiry_monotonic = time.monotonic() - 3600
         assert auth.is_token_expired() is True
 
     def test_is_token_expired_valid(self, mock_config: GoogleCalendarConfig) -> None:
         """有効期限内のトークンは有効と判定されることを確認（安全マージン考慮）."""
         auth = GoogleCalendarAuth(mock_config)
         auth._access_token = "valid-token"
-        # 10分後に期限切れ（5分マージンがあるため期限切れと判定される）
-        auth._token_expiry = datetime.utcnow() + timedelta(minutes=10)
+        # 10分後に期限切れ（5分マージン込みの判定時刻は5分後）
+        auth._expiry_monotonic = time.monotonic() + 5 * 60
         assert auth.is_token_expired() is False
 
     def test_is_token_expired_within_margin(self, mock_config: GoogleCalendarConfig) -> None:
         """安全マージン内のトークンは期限切れと判定されることを確認."""
         auth = GoogleCalendarAuth(mock_config)
         auth._access_token = "valid-token"
-        # 3分後に期限切れ（5分マージンがあるため期限切れと判定される）
-        auth._token_expiry = datetime.utcnow() + timedelta(minutes=3)
+        # 3分後に期限切れ（5分マージン込みの判定時刻は2分前）
+        auth._expiry_monotonic = time.monotonic() - 2 * 60
         assert auth.is_token_expired() is True
 
     @pytest.mark.asyncio
     async def test_refresh_access_token_success(
-        self, mock_config: GoogleCalendarConfig, mock_token_response: dict
+        self,
+        mock_config: GoogleCalendarConfig,
+        mock_token_response: dict,
+        mock_http_client: MagicMock,
     ) -> None:
         """トークン更新が成功することを確認."""
         auth = GoogleCalendarAuth(mock_config)
 
         # httpx.AsyncClientのpostメソッドをモック
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = mock_token_response
+        mock_response = httpx.Response(200, json=mock_token_response)
 
-        with patch.object(auth._client, "post", new_callable=AsyncMock) as mock_post:
+        with patch.object(mock_http_client, "post", new_callable=AsyncMock) as mock_post:
             mock_post.return_value = mock_response
 
             token = await auth.refresh_access_token()
 
             assert token == mock_token_response["access_token"]
             assert auth._access_token == mock_token_response["access_token"]
-            assert auth._token_expiry is not None
+            assert auth._expiry_monotonic > time.monotonic()
+            assert auth.is_token_expired() is False
+            mock_post.assert_called_once()
+            assert mock_post.call_args.kwargs["content"] == auth._build_token_body()
+
+        await auth.close()
+
+    @pytest.mark.asyncio
+    async def test_refresh_schedules_background_refresh(
+        self,
+        mock_config: GoogleCalendarConfig,
+        mock_token_response: dict,
+        mock_http_client: MagicMock,
+    ) -> None:
+        """トークン更新後にバックグラウンド更新が予約され、closeで取り消されることを確認."""
+        auth = GoogleCalendarAuth(mock_config)
+        mock_response = httpx.Response(200, json=mock_token_response)
+
+        with patch.object(mock_http_client, "post", new_callable=AsyncMock) as mock_post:
+            mock_post.return_value = mock_response
+            await auth.refresh_access_token()
+
+        handle = auth._refresh_handle
+        assert handle is not None
+        # 寿命（3600秒）の80%経過時点に予約されている
+        remaining = handle.when() - asyncio.get_running_loop().time()
+        assert 2870 < remaining <= 2880
+
+        await auth.close()
+        assert handle.cancelled()
+        assert auth._refresh_handle is None
+
+    @pytest.mark.asyncio
+    async def test_background_refresh_runs_and_reschedules(
+        self,
+        mock_config: GoogleCalendarConfig,
+        mock_token_response: dict,
+        mock_http_client: MagicMock,
+    ) -> None:
+        """予約時刻にバックグラウンドでトークンが更新されることを確認."""
+        auth = GoogleCalendarAuth(mock_config)
+        mock_response = httpx.Response(200, json=mock_token_response)
+
+        with patch.object(mock_http_client, "post", new_callable=AsyncMock) as mock_post:
+            mock_post.return_value = mock_response
+
+            auth._start_background_refresh()
+            assert auth._refresh_task is not None
+            await auth._refresh_task
+
+            mock_post.assert_called_once()
+            assert auth._access_token == mock_token_response["access_token"]
+            assert auth._refresh_handle is not None
+
+        await auth.close()
+
+    @pytest.mark.asyncio
+    async def test_start_background_refresh_with_valid_token(
+        self, mock_config: GoogleCalendarConfig
+    ) -> None:
+        """有効なトークンがある場合は期限切れ時刻に更新が予約されることを確認."""
+        auth = GoogleCalendarAuth(mock_config)
+        auth._access_token = "cached-token"
+        auth._expiry_monotonic = time.monotonic() + 1000
+
+        auth.start_background_refresh()
+
+        handle = auth._refresh_handle
+        assert handle is not None
+        assert auth._refresh_task is None
+        remaining = handle.when() - asyncio.get_running_loop().time()
+        assert 990 < remaining <= 1000
+
+        await auth.close()
+        assert handle.cancelled()
+
+    @pytest.mark.asyncio
+    async def test_start_background_refresh_without_token(
+        self,
+        mock_config: GoogleCalendarConfig,
+        mock_token_response: dict,
+        mock_http_client: MagicMock,
+    ) -> None:
+        """トークンがない場合は直ちにバックグラウンドで取得されることを確認."""
+        auth = GoogleCalendarAuth(mock_config)
+        auth._access_token = None
+        mock_response = httpx.Response(200, json=mock_token_response)
+
+        with patch.object(mock_http_client, "post", new_callable=AsyncMock) as mock_post:
+            mock_post.return_value = mock_response
+
+            auth.start_background_refresh()
+            assert auth._refresh_task is not None
+            await auth._refresh_task
+
             mock_post.assert_called_once()
+            assert auth.peek_access_token() == mock_token_response["access_token"]
+
+            # 2回目の呼び出しでは何もしない
+            handle = auth._refresh_handle
+            auth.start_background_refresh()
+            assert auth._refresh_handle is handle
 
         await auth.close()
 
+    @pytest.mark.asyncio
+    async def test_background_refresh_failure_is_logged(
+        self, mock_config: GoogleCalendarConfig, mock_http_client: MagicMock
+    ) -> None:
+        """バックグラウンド更新の失敗が例外を送出せずログに記録されることを確認."""
+        auth = GoogleCalendarAuth(mock_config)
+
+        with patch.object(
+            mock_http_client, "post", new_callable=AsyncMock
+        ) as mock_post, patch("src.auth.logger") as mock_logger:
+            mock_post.side_effect = httpx.ConnectError("Connection failed")
+
+            await auth._background_refresh()
+
+            mock_logger.warning.assert_called_once()
+
+        await auth.close()
+
+    def test_peek_access_token(self, mock_config: GoogleCalendarConfig) -> None:
+        """有効なトークンのみが更新なしで返されることを確認."""
+        auth = GoogleCalendarAuth(mock_config)
+        auth._access_token = "valid-token"
+        auth._expiry_monotonic = time.monotonic() + 3600
+        assert auth.peek_access_token() == "valid-token"
+
+        auth._expiry_monotonic = time.monotonic() - 1
+        assert auth.peek_access_token() is None
+
+    def test_no_instance_dict(self, mock_config: GoogleCalendarConfig) -> None:
+        """__slots__によりインスタンス辞書を持たないことを確認."""
+        auth = GoogleCalendarAuth(mock_config)
+
+        assert not hasattr(auth, "__dict__")
+        with pytest.raises(AttributeError):
+            auth.unknown_attribute = "value"  # type: ignore[attr-defined]
+
+    def test_build_token_body(self, mock_config: GoogleCalendarConfig) -> None:
+        """トークン更新リクエストのボディがキャッシュされ、認証情報の変更で作り直されることを確認."""
+        auth = GoogleCalendarAuth(mock_config)
+
+        body = auth._build_token_body()
+        assert b"grant_type=refresh_token" in body
+        assert b"refresh_token=test-refresh-token-xxxxxxxxxxxxxxxx" in body
+        assert auth._build_token_body() is body
+
+        # リフレッシュトークンがローテーションされた場合は作り直される
+        mock_config.google_refresh_token = "rotated-refresh-token"
+        rotated = auth._build_token_body()
+        assert rotated is not body
+        assert b"refresh_token=rotated-refresh-token" in rotated
+
     @pytest.mark.asyncio
     async def test_refresh_access_token_missing_client_id(
         self, mock_config: GoogleCalendarConfig
@@ -115,20 +305,21 @@ class TestGoogleCalendarAuth:
 
     @pytest.mark.asyncio
     async def test_refresh_access_token_http_error(
-        self, mock_config: GoogleCalendarConfig
+        self, mock_config: GoogleCalendarConfig, mock_http_client: MagicMock
     ) -> None:
         """HTTP エラーレスポンスが正しく処理されることを確認."""
         auth = GoogleCalendarAuth(mock_config)
 
         # 401エラーレスポンスをモック
-        mock_response = MagicMock()
-        mock_response.status_code = 401
-        mock_response.json.return_value = {
-            "error": "invalid_grant",
-            "error_description": "Token has been expired or revoked.",
-        }
-
-        with patch.object(auth._client, "post", new_callable=AsyncMock) as mock_post:
+        mock_response = httpx.Response(
+            401,
+            json={
+                "error": "invalid_grant",
+                "error_description": "Token has been expired or revoked.",
+            },
+        )
+
+        with patch.object(mock_http_client, "post", new_callable=AsyncMock) as mock_post:
             mock_post.return_value = mock_response
 
             with pytest.raises(GoogleAuthenticationError) as exc_info:
@@ -138,16 +329,75 @@ class TestGoogleCalendarAuth:
 
         await auth.close()
 
+    @pytest.mark.asyncio
+    async def test_refresh_access_token_uncommon_json_error(
+        self, mock_config: GoogleCalendarConfig, mock_http_client: MagicMock
+    ) -> None:
+        """頻出エラー以外はJSONのerror_descriptionが使われることを確認."""
+        auth = GoogleCalendarAuth(mock_config)
+        mock_response = httpx.Response(
+            400,
+            json={"error": "unsupported_grant_type", "error_description": "Invalid grant_type"},
+        )
+
+        with patch.object(mock_http_client, "post", new_callable=AsyncMock) as mock_post:
+            mock_post.return_value = mock_response
+
+            with pytest.raises(GoogleAuthenticationError) as exc_info:
+                await auth.refresh_access_token()
+
+        assert "Invalid grant_type" in str(exc_info.value)
+
+        await auth.close()
+
+    @pytest.mark.asyncio
+    async def test_refresh_access_token_non_json_error(
+        self, mock_config: GoogleCalendarConfig, mock_http_client: MagicMock
+    ) -> None:
+        """JSONでないエラーレスポンスでもステータスと本文が報告されることを確認."""
+        auth = GoogleCalendarAuth(mock_config)
+        mock_response = httpx.Response(502, content=b"<html>Bad Gateway</html>")
+
+        with patch.object(mock_http_client, "post", new_callable=AsyncMock) as mock_post:
+            mock_post.return_value = mock_response
+
+            with pytest.raises(GoogleAuthenticationError) as exc_info:
+                await auth.refresh_access_token()
+
+        assert "HTTP 502" in str(exc_info.value)
+        assert "Bad Gateway" in str(exc_info.value)
+
+        await auth.close()
+
+    @pytest.mark.asyncio
+    async def test_refresh_access_token_keeps_google_error_description(
+        self, mock_config: GoogleCalendarConfig, mock_http_client: MagicMock
+    ) -> None:
+        """invalid_grantでもGoogleのerror_descriptionがそのまま報告されることを確認."""
+        auth = GoogleCalendarAuth(mock_config)
+        mock_response = httpx.Response(
+            400,
+            content=b'{\n  "error": "invalid_grant",\n  "error_description": "Account has been deleted"\n}',
+        )
+
+        with patch.object(mock_http_client, "post", new_callable=AsyncMock) as mock_post:
+            mock_post.return_value = mock_response
+
+            with pytest.raises(GoogleAuthenticationError) as exc_info:
+                await auth.refresh_access_token()
+
+        assert "Account has been deleted" in str(exc_info.value)
+
+        await auth.close()
+
     @pytest.mark.asyncio
     async def test_refresh_access_token_timeout(
-        self, mock_config: GoogleCalendarConfig
+        self, mock_config: GoogleCalendarConfig, mock_http_client: MagicMock
     ) -> None:
         """タイムアウトが正しく処理されることを確認."""
         auth = GoogleCalendarAuth(mock_config)
 
-        with patch.object(
-            auth._client, "post", new_callable=AsyncMock
-        ) as mock_post:
+        with patch.object(mock_http_client, "post", new_callable=AsyncMock) as mock_post:
             mock_post.side_effect = httpx.TimeoutException("Request timeout")
 
             with pytest.raises(TimeoutError) as exc_info:
@@ -159,14 +409,12 @@ class TestGoogleCalendarAuth:
 
     @pytest.mark.asyncio
     async def test_refresh_access_token_network_error(
-        self, mock_config: GoogleCalendarConfig
+        self, mock_config: GoogleCalendarConfig, mock_http_client: MagicMock
     ) -> None:
         """ネットワークエラーが正しく処理されることを確認."""
         auth = GoogleCalendarAuth(mock_config)
 
-        with patch.object(
-            auth._client, "post", new_callable=AsyncMock
-        ) as mock_post:
+        with patch.object(mock_http_client, "post", new_callable=AsyncMock) as mock_post:
             mock_post.side_effect = httpx.RequestError("Network error")
 
             with pytest.raises(NetworkError) as exc_info:
@@ -181,7 +429,7 @@ class TestGoogleCalendarAuth:
         """有効なトークンが返されることを確認."""
         auth = GoogleCalendarAuth(mock_config)
         auth._access_token = "valid-token"
-        auth._token_expiry = datetime.utcnow() + timedelta(hours=1)
+        auth._expiry_monotonic = time.monotonic() + 3600
 
         token = await auth.get_access_token()
         assert token == "valid-token"
@@ -189,19 +437,20 @@ class TestGoogleCalendarAuth:
 
     @pytest.mark.asyncio
     async def test_get_access_token_refresh_when_expired(
-        self, mock_config: GoogleCalendarConfig, mock_token_response: dict
+        self,
+        mock_config: GoogleCalendarConfig,
+        mock_token_response: dict,
+        mock_http_client: MagicMock,
     ) -> None:
         """期限切れの場合に自動的にトークンが更新されることを確認."""
         auth = GoogleCalendarAuth(mock_config)
         auth._access_token = "old-token"
-        auth._token_expiry = datetime.utcnow() - timedelta(hours=1)  # 期限切れ
+        auth._expiry_monotonic = time.monotonic() - 3600  # 期限切れ
 
         # リフレッシュトークンのモック
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = mock_token_response
+        mock_response = httpx.Response(200, json=mock_token_response)
 
-        with patch.object(auth._client, "post", new_callable=AsyncMock) as mock_post:
+        with patch.object(mock_http_client, "post", new_callable=AsyncMock) as mock_post:
             mock_post.return_value = mock_response
 
             token = await auth.get_access_token()
@@ -212,6 +461,147 @@ class TestGoogleCalendarAuth:
 
         await auth.close()
 
+    @pytest.mark.asyncio
+    async def test_get_access_token_concurrent_refresh_once(
+        self,
+        mock_config: GoogleCalendarConfig,
+        mock_token_response: dict,
+        mock_http_client: MagicMock,
+    ) -> None:
+        """同時に呼び出されてもトークン更新は1回だけ実行されることを確認."""
+        auth = GoogleCalendarAuth(mock_config)
+        auth._access_token = None
+
+        mock_response = httpx.Response(200, json=mock_token_response)
+
+        async def slow_post(*args, **kwargs):
+            await asyncio.sleep(0.01)
+            return mock_response
+
+        with patch.object(mock_http_client, "post", new_callable=AsyncMock) as mock_post:
+            mock_post.side_effect = slow_post
+
+            tokens = await asyncio.gather(*[auth.get_access_token() for _ in range(5)])
+
+            assert tokens == [mock_token_response["access_token"]] * 5
+            mock_post.assert_called_once()
+
+        await auth.close()
+
+    def test_load_cached_token_on_init(self, mock_config: GoogleCalendarConfig) -> None:
+        """有効なキャッシュがあれば起動時にトークンを復元することを確認."""
+        cache_path = mock_config.get_token_cache_path()
+        cache_path.write_text(
+            json.dumps(
+                {
+                    "client_id": mock_config.google_client_id,
+                    "refresh_token_sha256": _refresh_token_fingerprint(
+                        mock_config.google_refresh_token
+                    ),
+                    "access_token": "cached-token",
+                    "expires_at": time.time() + 3600,
+                }
+            )
+        )
+
+        auth = GoogleCalendarAuth(mock_config)
+
+        assert auth._access_token == "cached-token"
+        assert auth.is_token_expired() is False
+
+    def test_ignore_expired_cached_token(self, mock_config: GoogleCalendarConfig) -> None:
+        """安全マージン内に期限切れとなるキャッシュは使用しないことを確認."""
+        cache_path = mock_config.get_token_cache_path()
+        cache_path.write_text(
+            json.dumps(
+                {
+                    "client_id": mock_config.google_client_id,
+                    "refresh_token_sha256": _refresh_token_fingerprint(
+                        mock_config.google_refresh_token
+                    ),
+                    "access_token": "cached-token",
+                    "expires_at": time.time() + 60,
+                }
+            )
+        )
+
+        auth = GoogleCalendarAuth(mock_config)
+
+        assert auth._access_token == mock_config.google_access_token
+        assert auth.is_token_expired() is True
+
+    def test_ignore_cached_token_for_other_client(
+        self, mock_config: GoogleCalendarConfig
+    ) -> None:
+        """別のクライアントIDで保存されたキャッシュは使用しないことを確認."""
+        cache_path = mock_config.get_token_cache_path()
+        cache_path.write_text(
+            json.dumps(
+                {
+                    "client_id": "other-client-id",
+                    "access_token": "cached-token",
+                    "expires_at": time.time() + 3600,
+                }
+            )
+        )
+
+        auth = GoogleCalendarAuth(mock_config)
+
+        assert auth._access_token == mock_config.google_access_token
+
+    def test_ignore_cached_token_for_other_refresh_token(
+        self, mock_config: GoogleCalendarConfig
+    ) -> None:
+        """別のリフレッシュトークン（別アカウント）で保存されたキャッシュは使用しないことを確認."""
+        cache_path = mock_config.get_token_cache_path()
+        cache_path.write_text(
+            json.dumps(
+                {
+                    "client_id": mock_config.google_client_id,
+                    "refresh_token_sha256": _refresh_token_fingerprint("refresh-token-a"),
+                    "access_token": "cached-token",
+                    "expires_at": time.time() + 3600,
+                }
+            )
+        )
+        mock_config.google_refresh_token = "refresh-token-b"
+
+        auth = GoogleCalendarAuth(mock_config)
+
+        assert auth._access_token == mock_config.google_access_token
+
+    @pytest.mark.asyncio
+    async def test_refresh_access_token_writes_cache(
+        self,
+        mock_config: GoogleCalendarConfig,
+        mock_token_response: dict,
+        mock_http_client: MagicMock,
+    ) -> None:
+        """トークン更新後にキャッシュファイルが書き込まれることを確認."""
+        auth = GoogleCalendarAuth(mock_config)
+
+        mock_response = httpx.Response(200, json=mock_token_response)
+
+        with patch.object(mock_http_client, "post", new_callable=AsyncMock) as mock_post:
+            mock_post.return_value = mock_response
+            await auth.refresh_access_token()
+
+        cache_path = mock_config.get_token_cache_path()
+        cached = json.loads(cache_path.read_text())
+        assert cached["access_token"] == mock_token_response["access_token"]
+        assert cached["client_id"] == mock_config.google_client_id
+        assert cached["refresh_token_sha256"] == _refresh_token_fingerprint(
+            mock_config.google_refresh_token
+        )
+        assert mock_config.google_refresh_token not in cache_path.read_text()
+        assert cached["expires_at"] > time.time()
+        assert os.stat(cache_path).st_mode & 0o777 == 0o600
+
+        # 再起動後のインスタンスはリクエストなしでトークンを再利用できる
+        restarted = GoogleCalendarAuth(mock_config)
+        assert restarted._access_token == mock_token_response["access_token"]
+        assert restarted.is_token_expired() is False
+
     def test_get_credentials_dict(self, mock_config: GoogleCalendarConfig) -> None:
         """認証情報が辞書形式で返されることを確認."""
         auth = GoogleCalendarAuth(mock_config)
@@ -224,3 +614,92 @@ class TestGoogleCalendarAuth:
         assert creds["refresh_token"] == mock_config.google_refresh_token
         assert creds["access_token"] == "current-access-token"
         assert creds["token_uri"] == mock_config.google_token_uri
+
+
+class TestUpdateEnvFile:
+    """_update_env_file関数のテスト."""
+
+    def test_update_existing_key(self, tmp_path: Path) -> None:
+        """既存のキーを更新し、他の行とコメントを保持することを確認."""
+        env_file = tmp_path / ".env"
+        env_file.write_text(
+            "# Google Calendar\n"
+            "# GOOGLE_REFRESH_TOKEN=commented-out\n"
+            "GOOGLE_CLIENT_ID=client-id\n"
+            "GOOGLE_REFRESH_TOKEN=old-token\n"
+        )
+
+        _update_env_file(env_file, {"GOOGLE_REFRESH_TOKEN": "new-token"})
+
+        assert env_file.read_text() == (
+            "# Google Calendar\n"
+            "# GOOGLE_REFRESH_TOKEN=commented-out\n"
+            "GOOGLE_CLIENT_ID=client-id\n"
+            "GOOGLE_REFRESH_TOKEN=new-token\n"
+        )
+        assert os.stat(env_file).st_mode & 0o777 == 0o600
+
+    def test_append_missing_key(self, tmp_path: Path) -> None:
+        """存在しないキーは末尾に追加されることを確認."""
+        env_file = tmp_path / ".env"
+        env_file.write_text("GOOGLE_CLIENT_ID=client-id\n")
+
+        _update_env_file(env_file, {"GOOGLE_REFRESH_TOKEN": "new-token"})
+
+        assert env_file.read_text() == (
+            "GOOGLE_CLIENT_ID=client-id\nGOOGLE_REFRESH_TOKEN=new-token\n"
+        )
+
+    def test_append_after_line_without_newline(self, tmp_path: Path) -> None:
+        """末尾に改行がないファイルでも行が連結されないことを確認."""
+        env_file = tmp_path / ".env"
+        env_file.write_text("GOOGLE_CLIENT_ID=client-id")
+
+        _update_env_file(env_file, {"GOOGLE_REFRESH_TOKEN": "new-token"})
+
+        assert env_file.read_text() == (
+            "GOOGLE_CLIENT_ID=client-id\nGOOGLE_REFRESH_TOKEN=new-token\n"
+        )
+
+    def test_create_new_file(self, tmp_path: Path) -> None:
+        """ファイルが存在しない場合は新規作成されることを確認."""
+        env_file = tmp_path / ".env"
+
+        _update_env_file(env_file, {"GOOGLE_REFRESH_TOKEN": "new-token"})
+
+        assert env_file.read_text() == "GOOGLE_REFRESH_TOKEN=new-token\n"
+
+    def test_skip_unchanged_values(self, tmp_path: Path) -> None:
+        """値に変更がない場合はファイルを書き換えないことを確認."""
+        env_file = tmp_path / ".env"
+        env_file.write_text("GOOGLE_REFRESH_TOKEN=same-token\n")
+        inode_before = os.stat(env_file).st_ino
+
+        _update_env_file(env_file, {"GOOGLE_REFRESH_TOKEN": "same-token"})
+
+        assert os.stat(env_file).st_ino == inode_before
+        assert list(tmp_path.iterdir()) == [env_file]
+
+
+class TestWriteTokenCache:
+    """_write_token_cache関数のテスト."""
+
+    def test_create_private_cache_dir(self, tmp_path: Path) -> None:
+        """キャッシュディレクトリとファイルが所有者のみアクセス可能で作成されることを確認."""
+        cache_path = tmp_path / "hisho" / "google_token.json"
+
+        _write_token_cache(cache_path, {"access_token": "token"})
+
+        assert json.loads(cache_path.read_text()) == {"access_token": "token"}
+        assert os.stat(cache_path).st_mode & 0o777 == 0o600
+        assert os.stat(cache_path.parent).st_mode & 0o777 == 0o700
+        assert list(cache_path.parent.iterdir()) == [cache_path]
+
+    def test_remove_temp_file_on_failure(self, tmp_path: Path) -> None:
+        """書き込みに失敗した場合に一時ファイルが残らないことを確認."""
+        cache_path = tmp_path / "google_token.json"
+
+        # JSONにシリアライズできない値で書き込みを失敗させる
+        _write_token_cache(cache_path, {"access_token": object()})
+
+        assert list(tmp_path.iterdir()) == []
@@ -3,14 +3,25 @@
 Google Calendar APIクライアントの動作をテストします。
 """
 
-from datetime import datetime, timedelta
-from unittest.mock import AsyncMock, MagicMock, patch
+import asyncio
+import json
+import sys
+import time
+import warnings
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, patch
 
 import httpx
 import pytest
 
 from src.auth import GoogleCalendarAuth
-from src.calendar_client import GoogleCalendarClient
+from src.calendar_client import (
+    GoogleCalendarClient,
+    _backoff_delay,
+    _retry_after_delay,
+    close_shared_http_client,
+    get_shared_http_client,
+)
 from src.config import GoogleCalendarConfig
 from src.exceptions import (
     DataParsingError,
@@ -24,6 +35,7 @@ from src.exceptions import (
     TimeoutError,
 )
 from src.models import CalendarEvent, EventDateTime
+from src.rate_limiter import RateLimiter
 
 
 class TestGoogleCalendarClient:
@@ -39,6 +51,103 @@ class TestGoogleCalendarClient:
         assert client.base_url == "https://www.googleapis.com/calendar/v3"
         await client.close()
 
+    @pytest.mark.asyncio
+    async def test_close_always_closes_auth(
+        self, mock_config: GoogleCalendarConfig, rate_limiter
+    ) -> None:
+        """HTTPクライアントのクローズに失敗しても認証マネージャーが閉じられることを確認."""
+        client = GoogleCalendarClient(mock_config, rate_limiter=rate_limiter)
+
+        with patch.object(
+            client.client, "aclose", new_callable=AsyncMock
+        ) as mock_aclose, patch.object(
+            GoogleCalendarAuth, "close", new_callable=AsyncMock
+        ) as mock_auth_close:
+            mock_aclose.side_effect = RuntimeError("aclose failed")
+
+            with pytest.raises(RuntimeError):
+                await client.close()
+
+            mock_auth_close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_unclosed_client_warns(
+        self, mock_config: GoogleCalendarConfig, rate_limiter
+    ) -> None:
+        """close()せずに破棄された場合にResourceWarningが出ることを確認."""
+        client = GoogleCalendarClient(mock_config, rate_limiter=rate_limiter)
+
+        with pytest.warns(ResourceWarning, match="without close"):
+            client.__del__()
+
+        await client.close()
+        # close()済みの場合は警告しない
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            client.__del__()
+
+    @pytest.mark.asyncio
+    async def test_injected_http_client_is_not_closed(
+        self, mock_config: GoogleCalendarConfig, rate_limiter
+    ) -> None:
+        """外部から渡されたHTTPクライアントはclose()で閉じられないことを確認."""
+        http_client = get_shared_http_client()
+        try:
+            client = GoogleCalendarClient(
+                mock_config, rate_limiter=rate_limiter, http_client=http_client
+            )
+            assert client.client is http_client
+
+            # 共有クライアントはclose()前に破棄されても警告しない
+            with warnings.catch_warnings():
+                warnings.simplefilter("error")
+                client.__del__()
+
+            await client.close()
+            assert not http_client.is_closed
+            assert get_shared_http_client() is http_client
+        finally:
+            await close_shared_http_client()
+
+        assert http_client.is_closed
+        # クローズ後は新しいクライアントが生成される
+        new_client = get_shared_http_client()
+        assert new_client is not http_client
+        await close_shared_http_client()
+
+    @pytest.mark.asyncio
+    async def test_request_uses_absolute_url(
+        self, mock_config: GoogleCalendarConfig, rate_limiter
+    ) -> None:
+        """base_urlを持たない共有クライアントでも絶対URLでリクエストされることを確認."""
+        client = GoogleCalendarClient(mock_config, rate_limiter=rate_limiter)
+
+        with patch.object(
+            client, "_get_headers", new_callable=AsyncMock, return_value={}
+        ), patch.object(client.client, "request", new_callable=AsyncMock) as mock_request:
+            mock_request.return_value = httpx.Response(200, json={})
+            await client._request("GET", "users/me/calendarList")
+
+        assert (
+            mock_request.call_args.kwargs["url"]
+            == "https://www.googleapis.com/calendar/v3/users/me/calendarList"
+        )
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_http_client_pool_settings(
+        self, mock_config: GoogleCalendarConfig, rate_limiter
+    ) -> None:
+        """HTTP/2とコネクションプールの設定がトランスポートに適用されることを確認."""
+        client = GoogleCalendarClient(mock_config, rate_limiter=rate_limiter)
+
+        pool = client.client._transport._pool
+        assert pool._http2 is True
+        assert pool._max_connections == 100
+        assert pool._max_keepalive_connections == 50
+        assert pool._keepalive_expiry == 60.0
+        await client.close()
+
     @pytest.mark.asyncio
     async def test_context_manager(self, mock_config: GoogleCalendarConfig) -> None:
         """コンテキストマネージャーとして使用できることを確認."""
@@ -54,8 +163,9 @@ class TestGoogleCalendarClient:
         client = GoogleCalendarClient(mock_config, rate_limiter=rate_limiter)
 
         # アクセストークンをモック
+        # GoogleCalendarAuthは__slots__を持つためクラス側をパッチする
         with patch.object(
-            client.auth, "get_access_token", new_callable=AsyncMock
+            GoogleCalendarAuth, "get_access_token", new_callable=AsyncMock
         ) as mock_get_token:
             mock_get_token.return_value = "test-access-token"
 
@@ -67,6 +177,158 @@ class TestGoogleCalendarClient:
 
         await client.close()
 
+    @pytest.mark.asyncio
+    async def test_get_headers_cached_while_token_valid(
+        self, mock_config: GoogleCalendarConfig, rate_limiter
+    ) -> None:
+        """トークンが有効な間はヘッダーが再利用され、トークン変更時に作り直されることを確認."""
+        client = GoogleCalendarClient(mock_config, rate_limiter=rate_limiter)
+        client.auth._access_token = "token-1"
+        client.auth._expiry_monotonic = time.monotonic() + 3600
+
+        with patch.object(
+            GoogleCalendarAuth, "get_access_token", new_callable=AsyncMock
+        ) as mock_get_token:
+            headers = await client._get_headers()
+            assert await client._get_headers() is headers
+            assert headers["Authorization"] == "Bearer token-1"
+            mock_get_token.assert_not_called()
+
+            client.auth._access_token = "token-2"
+            rotated = await client._get_headers()
+            assert rotated is not headers
+            assert rotated["Authorization"] == "Bearer token-2"
+
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_list_calendars_etag_revalidation(
+        self,
+        mock_config: GoogleCalendarConfig,
+        rate_limiter,
+        mock_calendar_list_response: dict,
+    ) -> None:
+        """TTL経過後はETagで再検証し、304ならキャッシュを返すことを確認."""
+        client = GoogleCalendarClient(mock_config, rate_limiter=rate_limiter)
+
+        with patch.object(
+            client, "_send_request", new_callable=AsyncMock
+        ) as mock_send:
+            mock_send.side_effect = [
+                httpx.Response(200, json=mock_calendar_list_response, headers={"ETag": '"v1"'}),
+                httpx.Response(304),
+            ]
+
+            first = await client.list_calendars()
+
+            # TTLを経過させる
+            fetched_at, etag, calendars = client._calendars_cache
+            client._calendars_cache = (fetched_at - 301, etag, calendars)
+            second = await client.list_calendars()
+
+            assert [c.id for c in second] == [c.id for c in first]
+            assert mock_send.call_args_list[0].kwargs["extra_headers"] is None
+            assert mock_send.call_args_list[1].kwargs["extra_headers"] == {"If-None-Match": '"v1"'}
+            # 再検証に成功したらキャッシュの有効期間を延長する
+            assert client._calendars_cache[0] > fetched_at - 301
+
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_list_calendars_skips_invalid_items(
+        self,
+        mock_config: GoogleCalendarConfig,
+        rate_limiter,
+        mock_calendar_list_response: dict,
+    ) -> None:
+        """バリデーションに失敗したカレンダーはスキップされることを確認."""
+        client = GoogleCalendarClient(mock_config, rate_limiter=rate_limiter)
+        mock_calendar_list_response["items"].append({"id": "broken-calendar"})
+
+        with patch.object(
+            client, "_send_request", new_callable=AsyncMock
+        ) as mock_send:
+            mock_send.return_value = httpx.Response(200, json=mock_calendar_list_response)
+
+            calendars = await client.list_calendars()
+
+            assert [c.id for c in calendars] == [
+                "primary@example.com",
+                "team@group.calendar.google.com",
+            ]
+
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_list_calendars_cache_expires_and_invalidates(
+        self,
+        mock_config: GoogleCalendarConfig,
+        rate_limiter,
+        mock_calendar_list_response: dict,
+    ) -> None:
+        """TTL内はAPIを呼ばず、エラー時はキャッシュを破棄することを確認."""
+        client = GoogleCalendarClient(mock_config, rate_limiter=rate_limiter)
+
+        with patch.object(
+            client, "_send_request", new_callable=AsyncMock
+        ) as mock_send:
+            # ETagがなくてもキャッシュする
+            mock_send.return_value = httpx.Response(200, json=mock_calendar_list_response)
+            first = await client.list_calendars()
+            second = await client.list_calendars()
+            assert [c.id for c in second] == [c.id for c in first]
+            mock_send.assert_called_once()
+
+            # TTLを経過させる（ETagがないので通常のリクエストになる）
+            fetched_at, etag, calendars = client._calendars_cache
+            client._calendars_cache = (fetched_at - 301, etag, calendars)
+            mock_send.side_effect = GooglePermissionError(message="権限エラー")
+            with pytest.raises(GooglePermissionError):
+                await client.list_calendars()
+            assert client._calendars_cache is None
+
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_refresh_token_once(
+        self, mock_config: GoogleCalendarConfig, rate_limiter
+    ) -> None:
+        """期限切れ時に並行リクエストがあってもトークン更新は1回だけ行われることを確認."""
+        client = GoogleCalendarClient(mock_config, rate_limiter=rate_limiter)
+        client.auth._access_token = None
+
+        async def slow_refresh(self: GoogleCalendarAuth) -> str:
+            await asyncio.sleep(0.01)
+            self._access_token = "fresh-token"
+            self._expiry_monotonic = time.monotonic() + 3000
+            return "fresh-token"
+
+        with patch.object(
+            GoogleCalendarAuth, "refresh_access_token", autospec=True
+        ) as mock_refresh:
+            mock_refresh.side_effect = slow_refresh
+
+            headers = await asyncio.gather(*[client._get_headers() for _ in range(10)])
+
+            mock_refresh.assert_called_once()
+            assert {h["Authorization"] for h in headers} == {"Bearer fresh-token"}
+
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_events_endpoint_cached(
+        self, mock_config: GoogleCalendarConfig, rate_limiter
+    ) -> None:
+        """カレンダーIDごとのイベントエンドポイントが再利用されることを確認."""
+        client = GoogleCalendarClient(mock_config, rate_limiter=rate_limiter)
+
+        endpoint = client._events_endpoint("primary")
+        assert endpoint == "calendars/primary/events"
+        assert client._events_endpoint("primary") is endpoint
+        assert client._events_endpoint("team@example.com") == "calendars/team@example.com/events"
+
+        await client.close()
+
     @pytest.mark.asyncio
     async def test_list_events_success(
         self,
@@ -83,10 +345,11 @@ class TestGoogleCalendarClient:
         ) as mock_request:
             mock_request.return_value = mock_events_list_response
 
+            now = datetime.now(timezone.utc)
             events = await client.list_events(
                 calendar_id="primary",
-                time_min=datetime.utcnow(),
-                time_max=datetime.utcnow() + timedelta(days=7),
+                time_min=now,
+                time_max=now + timedelta(days=7),
                 max_results=10,
             )
 
@@ -97,6 +360,141 @@ class TestGoogleCalendarClient:
 
         await client.close()
 
+    @pytest.mark.asyncio
+    async def test_list_events_skips_invalid_items(
+        self,
+        mock_config: GoogleCalendarConfig,
+        rate_limiter,
+        mock_events_list_response: dict,
+    ) -> None:
+        """一括バリデーションに失敗した場合は不正なイベントだけをスキップすることを確認."""
+        client = GoogleCalendarClient(mock_config, rate_limiter=rate_limiter)
+        mock_events_list_response["items"].append({"id": "broken-event"})
+
+        with patch.object(
+            client, "_request", new_callable=AsyncMock
+        ) as mock_request:
+            mock_request.return_value = mock_events_list_response
+
+            events = await client.list_events()
+
+            assert [event.id for event in events] == ["event123abc"]
+
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_list_events_follows_next_page_token(
+        self,
+        mock_config: GoogleCalendarConfig,
+        rate_limiter,
+        sample_event_dict: dict,
+    ) -> None:
+        """nextPageTokenに従って複数ページから件数分のイベントを取得することを確認."""
+        client = GoogleCalendarClient(mock_config, rate_limiter=rate_limiter)
+        second_event = {**sample_event_dict, "id": "event456def"}
+        third_event = {**sample_event_dict, "id": "event789ghi"}
+
+        with patch.object(
+            client, "_request", new_callable=AsyncMock
+        ) as mock_request:
+            mock_request.side_effect = [
+                {"items": [sample_event_dict], "nextPageToken": "page-2"},
+                {"items": [second_event, third_event], "nextPageToken": "page-3"},
+            ]
+
+            events = await client.list_events(max_results=2)
+
+            assert [event.id for event in events] == ["event123abc", "event456def"]
+            assert mock_request.call_count == 2
+            second_url = httpx.URL(mock_request.call_args_list[1].args[1])
+            assert second_url.params["pageToken"] == "page-2"
+            assert second_url.params["maxResults"] == "1"
+
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_list_events_query_encoding(
+        self,
+        mock_config: GoogleCalendarConfig,
+        rate_limiter,
+        mock_events_list_response: dict,
+    ) -> None:
+        """クエリ文字列がhttpxのparamsと同じ形式でエンコードされることを確認."""
+        client = GoogleCalendarClient(mock_config, rate_limiter=rate_limiter)
+        time_min = datetime(2026, 2, 5, 9, 0, 0)
+
+        with patch.object(
+            client, "_request", new_callable=AsyncMock
+        ) as mock_request:
+            mock_request.return_value = mock_events_list_response
+
+            await client.list_events(time_min=time_min, max_results=5)
+
+            url = httpx.URL(mock_request.call_args.args[1])
+            assert url.path == "calendars/primary/events"
+            assert dict(url.params) == {
+                "maxResults": "5",
+                "singleEvents": "true",
+                "orderBy": "startTime",
+                "timeMin": "2026-02-05T09:00:00",
+            }
+
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_list_events_partial_response(
+        self,
+        mock_config: GoogleCalendarConfig,
+        rate_limiter,
+        sample_event_dict: dict,
+    ) -> None:
+        """fields指定時はクエリに含まれ、必須項目のみのレスポンスをパースできることを確認."""
+        client = GoogleCalendarClient(mock_config, rate_limiter=rate_limiter)
+        fields = "items(id,summary,start,end,status,htmlLink,created,updated),nextPageToken"
+        keys = ("id", "summary", "start", "end", "status", "htmlLink", "created", "updated")
+        partial_item = {key: sample_event_dict[key] for key in keys}
+
+        with patch.object(
+            client, "_request", new_callable=AsyncMock
+        ) as mock_request:
+            mock_request.return_value = {"items": [partial_item]}
+
+            events = await client.list_events(max_results=5, fields=fields)
+
+            url = httpx.URL(mock_request.call_args.args[1])
+            assert url.params["fields"] == fields
+
+        assert [event.id for event in events] == ["event123abc"]
+        assert events[0].description is None
+
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_iter_events_stops_early(
+        self,
+        mock_config: GoogleCalendarConfig,
+        rate_limiter,
+        sample_event_dict: dict,
+    ) -> None:
+        """呼び出し元がループを抜けた場合は次のページを取得しないことを確認."""
+        client = GoogleCalendarClient(mock_config, rate_limiter=rate_limiter)
+
+        with patch.object(
+            client, "_request", new_callable=AsyncMock
+        ) as mock_request:
+            mock_request.return_value = {
+                "items": [sample_event_dict],
+                "nextPageToken": "page-2",
+            }
+
+            async for event in client.iter_events():
+                assert event.id == "event123abc"
+                break
+
+            mock_request.assert_called_once()
+
+        await client.close()
+
     @pytest.mark.asyncio
     async def test_list_events_empty_response(
         self, mock_config: GoogleCalendarConfig, rate_limiter
@@ -131,9 +529,9 @@ class TestGoogleCalendarClient:
         client = GoogleCalendarClient(mock_config, rate_limiter=rate_limiter)
 
         with patch.object(
-            client, "_request", new_callable=AsyncMock
+            client, "_send_request", new_callable=AsyncMock
         ) as mock_request:
-            mock_request.return_value = sample_event_dict
+            mock_request.return_value = httpx.Response(200, json=sample_event_dict)
 
             event = await client.get_event(event_id="event123abc")
 
@@ -144,6 +542,414 @@ class TestGoogleCalendarClient:
 
         await client.close()
 
+    @pytest.mark.asyncio
+    async def test_get_events_batch(
+        self,
+        mock_config: GoogleCalendarConfig,
+        rate_limiter,
+        sample_event_dict: dict,
+    ) -> None:
+        """複数イベントが1回のバッチリクエストで取得されることを確認."""
+        client = GoogleCalendarClient(mock_config, rate_limiter=rate_limiter)
+        second_event = {**sample_event_dict, "id": "event456def"}
+
+        def sub_response(index: int, status: str, body: dict) -> str:
+            return (
+                "--batch_resp\r\n"
+                "Content-Type: application/http\r\n"
+                f"Content-ID: <response-item{index}>\r\n"
+                "\r\n"
+                f"HTTP/1.1 {status}\r\n"
+                "Content-Type: application/json; charset=UTF-8\r\n"
+                "\r\n"
+                f"{json.dumps(body)}\r\n"
+            )
+
+        # サブレスポンスの順序はリクエスト順と異なってもよい
+        batch_body = (
+            sub_response(2, "200 OK", second_event)
+            + sub_response(1, "404 Not Found", {"error": {"code": 404, "message": "Not Found"}})
+            + sub_response(0, "200 OK", sample_event_dict)
+            + "--batch_resp--\r\n"
+        ).encode()
+
+        with patch.object(
+            client, "_send_request", new_callable=AsyncMock
+        ) as mock_send:
+            mock_send.return_value = httpx.Response(
+                200,
+                content=batch_body,
+                headers={"Content-Type": "multipart/mixed; boundary=batch_resp"},
+            )
+
+            events = await client.get_events(
+                [("primary", "event123abc"), ("primary", "deleted"), ("primary", "event456def")]
+            )
+
+            assert [event.id for event in events] == ["event123abc", "event456def"]
+            mock_send.assert_called_once()
+            args, kwargs = mock_send.call_args
+            assert args == ("POST", "https://www.googleapis.com/batch/calendar/v3")
+            assert b"GET /calendar/v3/calendars/primary/events/deleted\r\n" in kwargs["content"]
+            assert kwargs["extra_headers"]["Content-Type"].startswith("multipart/mixed; boundary=")
+
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_get_events_batch_permission_error(
+        self, mock_config: GoogleCalendarConfig, rate_limiter
+    ) -> None:
+        """サブレスポンスのエラーが単体リクエストと同じ例外になることを確認."""
+        client = GoogleCalendarClient(mock_config, rate_limiter=rate_limiter)
+        batch_body = (
+            b"--b\r\nContent-Type: application/http\r\nContent-ID: <response-item0>\r\n\r\n"
+            b"HTTP/1.1 403 Forbidden\r\nContent-Type: application/json\r\n\r\n"
+            b'{"error": {"code": 403, "message": "Forbidden"}}\r\n--b--\r\n'
+        )
+
+        with patch.object(
+            client, "_send_request", new_callable=AsyncMock
+        ) as mock_send:
+            mock_send.return_value = httpx.Response(
+                200, content=batch_body, headers={"Content-Type": 'multipart/mixed; boundary="b"'}
+            )
+
+            with pytest.raises(GooglePermissionError):
+                await client.get_events([("primary", "private-event")])
+
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_get_events_batch_retries_transient_sub_responses(
+        self,
+        mock_config: GoogleCalendarConfig,
+        rate_limiter,
+        sample_event_dict: dict,
+    ) -> None:
+        """5xxのサブレスポンスだけが再送され、取得済みのイベントが保持されることを確認."""
+        client = GoogleCalendarClient(mock_config, rate_limiter=rate_limiter)
+        second_event = {**sample_event_dict, "id": "event456def"}
+        first_body = (
+            "--b\r\nContent-Type: application/http\r\nContent-ID: <response-item0>\r\n\r\n"
+            "HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n\r\n"
+            f"{json.dumps(sample_event_dict)}\r\n"
+            "--b\r\nContent-Type: application/http\r\nContent-ID: <response-item1>\r\n\r\n"
+            "HTTP/1.1 503 Service Unavailable\r\nContent-Type: application/json\r\n\r\n"
+            '{"error": {"code": 503, "message": "Backend Error"}}\r\n--b--\r\n'
+        ).encode()
+        retry_body = (
+            "--b\r\nContent-Type: application/http\r\nContent-ID: <response-item0>\r\n\r\n"
+            "HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n\r\n"
+            f"{json.dumps(second_event)}\r\n--b--\r\n"
+        ).encode()
+        headers = {"Content-Type": "multipart/mixed; boundary=b"}
+
+        with patch.object(
+            client, "_send_request", new_callable=AsyncMock
+        ) as mock_send, patch(
+            "src.calendar_client.asyncio.sleep", new_callable=AsyncMock
+        ) as mock_sleep:
+            mock_send.side_effect = [
+                httpx.Response(200, content=first_body, headers=headers),
+                httpx.Response(200, content=retry_body, headers=headers),
+            ]
+
+            events = await client.get_events(
+                [("primary", "event123abc"), ("primary", "event456def")]
+            )
+
+            assert [event.id for event in events] == ["event123abc", "event456def"]
+            mock_sleep.assert_awaited_once()
+            first_call, retry_call = mock_send.call_args_list
+            assert first_call.kwargs["rate_limit_tokens"] == 2
+            # 再送は失敗したサブリクエストのみ
+            assert retry_call.kwargs["rate_limit_tokens"] == 1
+            assert b"/events/event456def\r\n" in retry_call.kwargs["content"]
+            assert b"/events/event123abc\r\n" not in retry_call.kwargs["content"]
+
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_get_events_batch_chunks_by_rate_limit_capacity(
+        self, mock_config: GoogleCalendarConfig, sample_event_dict: dict
+    ) -> None:
+        """1回のバッチの件数がレート制限のバケット容量に抑えられることを確認."""
+        client = GoogleCalendarClient(
+            mock_config, rate_limiter=RateLimiter(tokens_per_second=100.0, capacity=2)
+        )
+
+        def batch_response(count: int) -> httpx.Response:
+            body = "".join(
+                "--b\r\nContent-Type: application/http\r\n"
+                f"Content-ID: <response-item{index}>\r\n\r\n"
+                "HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n\r\n"
+                f"{json.dumps(sample_event_dict)}\r\n"
+                for index in range(count)
+            )
+            return httpx.Response(
+                200,
+                content=f"{body}--b--\r\n".encode(),
+                headers={"Content-Type": "multipart/mixed; boundary=b"},
+            )
+
+        with patch.object(
+            client, "_send_request", new_callable=AsyncMock
+        ) as mock_send:
+            mock_send.side_effect = [batch_response(2), batch_response(1)]
+
+            events = await client.get_events([("primary", f"event{i}") for i in range(3)])
+
+            assert len(events) == 3
+            assert [
+                call.kwargs["rate_limit_tokens"] for call in mock_send.call_args_list
+            ] == [2, 1]
+
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_send_request_acquires_token_per_sub_request(
+        self, mock_config: GoogleCalendarConfig
+    ) -> None:
+        """バッチ送信時にサブリクエストの件数分のトークンが消費されることを確認."""
+        limiter = RateLimiter(tokens_per_second=0.001, capacity=10)
+        client = GoogleCalendarClient(mock_config, rate_limiter=limiter)
+
+        with patch.object(
+            client, "_get_headers", new_callable=AsyncMock, return_value={}
+        ), patch.object(
+            client.client, "request", new_callable=AsyncMock
+        ) as mock_request:
+            mock_request.return_value = httpx.Response(200)
+
+            await client._send_request("POST", "batch", content=b"", rate_limit_tokens=4)
+
+        assert limiter.get_available_tokens() == pytest.approx(6, abs=0.01)
+
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_get_events_batch_missing_sub_response(
+        self, mock_config: GoogleCalendarConfig, rate_limiter, sample_event_dict: dict
+    ) -> None:
+        """バッチレスポンスに含まれないサブレスポンスがDataParsingErrorになることを確認."""
+        client = GoogleCalendarClient(mock_config, rate_limiter=rate_limiter)
+        batch_body = (
+            "--b\r\nContent-Type: application/http\r\nContent-ID: <response-item0>\r\n\r\n"
+            "HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n\r\n"
+            f"{json.dumps(sample_event_dict)}\r\n--b--\r\n"
+        ).encode()
+
+        with patch.object(
+            client, "_send_request", new_callable=AsyncMock
+        ) as mock_send:
+            mock_send.return_value = httpx.Response(
+                200, content=batch_body, headers={"Content-Type": "multipart/mixed; boundary=b"}
+            )
+
+            with pytest.raises(DataParsingError):
+                await client.get_events([("primary", "event123abc"), ("primary", "lost")])
+
+        await client.close()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("content_id", "status_line"),
+        [("<response-itemX>", "HTTP/1.1 200 OK"), ("<response-item0>", "HTTP/1.1 OK")],
+    )
+    async def test_get_events_batch_malformed_part(
+        self, mock_config: GoogleCalendarConfig, rate_limiter, content_id: str, status_line: str
+    ) -> None:
+        """不正なContent-IDやステータス行がDataParsingErrorになることを確認."""
+        client = GoogleCalendarClient(mock_config, rate_limiter=rate_limiter)
+        batch_body = (
+            f"--b\r\nContent-Type: application/http\r\nContent-ID: {content_id}\r\n\r\n"
+            f"{status_line}\r\nContent-Type: application/json\r\n\r\n{{}}\r\n--b--\r\n"
+        ).encode()
+
+        with patch.object(
+            client, "_send_request", new_callable=AsyncMock
+        ) as mock_send:
+            mock_send.return_value = httpx.Response(
+                200, content=batch_body, headers={"Content-Type": "multipart/mixed; boundary=b"}
+            )
+
+            with pytest.raises(DataParsingError):
+                await client.get_events([("primary", "event123abc")])
+
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_batch_list_events(
+        self,
+        mock_config: GoogleCalendarConfig,
+        rate_limiter,
+        sample_event_dict: dict,
+    ) -> None:
+        """複数カレンダーの予定が1回のバッチリクエストで取得され、エラーは個別に返ることを確認."""
+        client = GoogleCalendarClient(mock_config, rate_limiter=rate_limiter)
+        batch_body = (
+            "--b\r\nContent-Type: application/http\r\nContent-ID: <response-item1>\r\n\r\n"
+            "HTTP/1.1 403 Forbidden\r\nContent-Type: application/json\r\n\r\n"
+            '{"error": {"code": 403, "message": "Forbidden"}}\r\n'
+            "--b\r\nContent-Type: application/http\r\nContent-ID: <response-item0>\r\n\r\n"
+            "HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n\r\n"
+            f"{json.dumps({'items': [sample_event_dict]})}\r\n"
+            "--b--\r\n"
+        ).encode()
+        time_min = datetime(2026, 2, 5, tzinfo=timezone.utc)
+
+        with patch.object(
+            client, "_send_request", new_callable=AsyncMock
+        ) as mock_send:
+            mock_send.return_value = httpx.Response(
+                200, content=batch_body, headers={"Content-Type": "multipart/mixed; boundary=b"}
+            )
+
+            results = await client.batch_list_events(
+                ["primary", "private"], time_min=time_min, max_results=5
+            )
+
+            mock_send.assert_called_once()
+            args, kwargs = mock_send.call_args
+            assert args == ("POST", "https://www.googleapis.com/batch/calendar/v3")
+            assert (
+                b"GET /calendar/v3/calendars/private/events?maxResults=5&singleEvents=true"
+                b"&orderBy=startTime&timeMin=2026-02-05T00%3A00%3A00%2B00%3A00\r\n"
+            ) in kwargs["content"]
+
+        primary, private = results
+        assert primary[0] == "primary"
+        assert [event.id for event in primary[1]] == [sample_event_dict["id"]]
+        assert primary[2] is None
+        assert private[0] == "private"
+        assert private[1] == []
+        assert isinstance(private[2], GooglePermissionError)
+
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_batch_list_events_retries_rate_limited_sub_response(
+        self,
+        mock_config: GoogleCalendarConfig,
+        rate_limiter,
+        sample_event_dict: dict,
+    ) -> None:
+        """429のサブレスポンスがRetry-Afterに従って再送され、予定が取得できることを確認."""
+        client = GoogleCalendarClient(mock_config, rate_limiter=rate_limiter)
+        team_event = {**sample_event_dict, "id": "team-event"}
+        first_body = (
+            "--b\r\nContent-Type: application/http\r\nContent-ID: <response-item0>\r\n\r\n"
+            "HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n\r\n"
+            f"{json.dumps({'items': [sample_event_dict]})}\r\n"
+            "--b\r\nContent-Type: application/http\r\nContent-ID: <response-item1>\r\n\r\n"
+            "HTTP/1.1 429 Too Many Requests\r\nContent-Type: application/json\r\n"
+            "Retry-After: 2\r\n\r\n"
+            '{"error": {"code": 429, "message": "Rate Limit Exceeded"}}\r\n--b--\r\n'
+        ).encode()
+        retry_body = (
+            "--b\r\nContent-Type: application/http\r\nContent-ID: <response-item0>\r\n\r\n"
+            "HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n\r\n"
+            f"{json.dumps({'items': [team_event]})}\r\n--b--\r\n"
+        ).encode()
+        headers = {"Content-Type": "multipart/mixed; boundary=b"}
+
+        with patch.object(
+            client, "_send_request", new_callable=AsyncMock
+        ) as mock_send, patch(
+            "src.calendar_client.asyncio.sleep", new_callable=AsyncMock
+        ) as mock_sleep:
+            mock_send.side_effect = [
+                httpx.Response(200, content=first_body, headers=headers),
+                httpx.Response(200, content=retry_body, headers=headers),
+            ]
+
+            results = await client.batch_list_events(["primary", "team"], max_results=5)
+
+            # Retry-After（2秒）に±20%のジッターを加えた時間だけ待機する
+            mock_sleep.assert_awaited_once()
+            assert 1.6 <= mock_sleep.call_args.args[0] <= 2.4
+            first_call, retry_call = mock_send.call_args_list
+            assert first_call.kwargs["rate_limit_tokens"] == 2
+            assert retry_call.kwargs["rate_limit_tokens"] == 1
+            assert b"/calendars/team/events?" in retry_call.kwargs["content"]
+            assert b"/calendars/primary/events?" not in retry_call.kwargs["content"]
+
+        assert [(calendar_id, error) for calendar_id, _, error in results] == [
+            ("primary", None),
+            ("team", None),
+        ]
+        assert [event.id for event in results[1][1]] == ["team-event"]
+
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_batch_list_events_missing_sub_response(
+        self,
+        mock_config: GoogleCalendarConfig,
+        rate_limiter,
+        sample_event_dict: dict,
+    ) -> None:
+        """バッチレスポンスに含まれないカレンダーがDataParsingErrorとして返ることを確認."""
+        client = GoogleCalendarClient(mock_config, rate_limiter=rate_limiter)
+        batch_body = (
+            "--b\r\nContent-Type: application/http\r\nContent-ID: <response-item0>\r\n\r\n"
+            "HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n\r\n"
+            f"{json.dumps({'items': [sample_event_dict]})}\r\n--b--\r\n"
+        ).encode()
+
+        with patch.object(
+            client, "_send_request", new_callable=AsyncMock
+        ) as mock_send:
+            mock_send.return_value = httpx.Response(
+                200, content=batch_body, headers={"Content-Type": "multipart/mixed; boundary=b"}
+            )
+
+            results = await client.batch_list_events(["primary", "lost"])
+
+        assert results[0][2] is None
+        assert results[1][0] == "lost"
+        assert isinstance(results[1][2], DataParsingError)
+
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_batch_list_events_fetches_remaining_pages(
+        self,
+        mock_config: GoogleCalendarConfig,
+        rate_limiter,
+        sample_event_dict: dict,
+    ) -> None:
+        """先頭ページで件数が足りない場合のみ、次のページを個別に取得することを確認."""
+        client = GoogleCalendarClient(mock_config, rate_limiter=rate_limiter)
+        first_page = {"items": [sample_event_dict], "nextPageToken": "page2"}
+        batch_body = (
+            "--b\r\nContent-Type: application/http\r\nContent-ID: <response-item0>\r\n\r\n"
+            "HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n\r\n"
+            f"{json.dumps(first_page)}\r\n--b--\r\n"
+        ).encode()
+        second_event = {**sample_event_dict, "id": "event456def"}
+
+        with patch.object(
+            client, "_send_request", new_callable=AsyncMock
+        ) as mock_send, patch.object(
+            client, "_request", new_callable=AsyncMock
+        ) as mock_request:
+            mock_send.return_value = httpx.Response(
+                200, content=batch_body, headers={"Content-Type": "multipart/mixed; boundary=b"}
+            )
+            mock_request.return_value = {"items": [second_event]}
+
+            results = await client.batch_list_events(["primary"], max_results=2)
+
+            mock_request.assert_called_once()
+            endpoint = mock_request.call_args.args[1]
+            assert "maxResults=1" in endpoint
+            assert "pageToken=page2" in endpoint
+
+        assert [event.id for event in results[0][1]] == ["event123abc", "event456def"]
+
+        await client.close()
+
     @pytest.mark.asyncio
     async def test_create_event_success(
         self,
@@ -156,15 +962,19 @@ class TestGoogleCalendarClient:
         client = GoogleCalendarClient(mock_config, rate_limiter=rate_limiter)
 
         with patch.object(
-            client, "_request", new_callable=AsyncMock
+            client, "_send_request", new_callable=AsyncMock
         ) as mock_request:
-            mock_request.return_value = sample_event_dict
+            mock_request.return_value = httpx.Response(200, json=sample_event_dict)
 
             created_event = await client.create_event(event=sample_event)
 
             assert isinstance(created_event, CalendarEvent)
             assert created_event.id == "event123abc"
             mock_request.assert_called_once()
+            # シリアライズ済みのJSONバイト列がそのまま送信される
+            assert mock_request.call_args.kwargs["content"] == client._event_to_api_json(
+                sample_event
+            )
 
         await client.close()
 
@@ -183,9 +993,9 @@ class TestGoogleCalendarClient:
         updated_dict["summary"] = "更新されたミーティング"
 
         with patch.object(
-            client, "_request", new_callable=AsyncMock
+            client, "_send_request", new_callable=AsyncMock
         ) as mock_request:
-            mock_request.return_value = updated_dict
+            mock_request.return_value = httpx.Response(200, json=updated_dict)
 
             updates = {"summary": "更新されたミーティング"}
             updated_event = await client.update_event(
@@ -197,6 +1007,32 @@ class TestGoogleCalendarClient:
 
         await client.close()
 
+    @pytest.mark.asyncio
+    async def test_request_serializes_json_body(
+        self, mock_config: GoogleCalendarConfig, rate_limiter
+    ) -> None:
+        """JSONボディがシリアライズ済みのバイト列として送信・パースされることを確認."""
+        client = GoogleCalendarClient(mock_config, rate_limiter=rate_limiter)
+
+        with patch.object(
+            client, "_get_headers", new_callable=AsyncMock
+        ) as mock_get_headers, patch.object(
+            client.client, "request", new_callable=AsyncMock
+        ) as mock_request:
+            mock_get_headers.return_value = {"Authorization": "Bearer test-token"}
+            mock_request.return_value = httpx.Response(200, json={"id": "event123abc"})
+
+            result = await client._request(
+                "PATCH", "calendars/primary/events/event123abc", json_data={"summary": "会議"}
+            )
+
+            assert result == {"id": "event123abc"}
+            kwargs = mock_request.call_args.kwargs
+            assert json.loads(kwargs["content"]) == {"summary": "会議"}
+            assert "json" not in kwargs
+
+        await client.close()
+
     @pytest.mark.asyncio
     async def test_request_authentication_error(
         self, mock_config: GoogleCalendarConfig, rate_limiter
@@ -204,15 +1040,16 @@ class TestGoogleCalendarClient:
         """認証エラー（401）が正しく処理されることを確認."""
         client = GoogleCalendarClient(mock_config, rate_limiter=rate_limiter)
 
-        error_response = MagicMock()
-        error_response.status_code = 401
-        error_response.json.return_value = {
-            "error": {
-                "code": 401,
-                "message": "Invalid Credentials",
-                "status": "UNAUTHENTICATED",
-            }
-        }
+        error_response = httpx.Response(
+            401,
+            json={
+                "error": {
+                    "code": 401,
+                    "message": "Invalid Credentials",
+                    "status": "UNAUTHENTICATED",
+                }
+            },
+        )
 
         # _get_headersをモックして、トークン更新処理をスキップ
         with patch.object(
@@ -237,15 +1074,16 @@ class TestGoogleCalendarClient:
         """権限エラー（403）が正しく処理されることを確認."""
         client = GoogleCalendarClient(mock_config, rate_limiter=rate_limiter)
 
-        error_response = MagicMock()
-        error_response.status_code = 403
-        error_response.json.return_value = {
-            "error": {
-                "code": 403,
-                "message": "Forbidden",
-                "status": "PERMISSION_DENIED",
-            }
-        }
+        error_response = httpx.Response(
+            403,
+            json={
+                "error": {
+                    "code": 403,
+                    "message": "Forbidden",
+                    "status": "PERMISSION_DENIED",
+                }
+            },
+        )
 
         with patch.object(
             client, "_get_headers", new_callable=AsyncMock
@@ -267,15 +1105,16 @@ class TestGoogleCalendarClient:
         """リソース未検出エラー（404）が正しく処理されることを確認."""
         client = GoogleCalendarClient(mock_config, rate_limiter=rate_limiter)
 
-        error_response = MagicMock()
-        error_response.status_code = 404
-        error_response.json.return_value = {
-            "error": {
-                "code": 404,
-                "message": "Not Found",
-                "status": "NOT_FOUND",
-            }
-        }
+        error_response = httpx.Response(
+            404,
+            json={
+                "error": {
+                    "code": 404,
+                    "message": "Not Found",
+                    "status": "NOT_FOUND",
+                }
+            },
+        )
 
         with patch.object(
             client, "_get_headers", new_callable=AsyncMock
@@ -297,15 +1136,16 @@ class TestGoogleCalendarClient:
         """バリデーションエラー（400）が正しく処理されることを確認."""
         client = GoogleCalendarClient(mock_config, rate_limiter=rate_limiter)
 
-        error_response = MagicMock()
-        error_response.status_code = 400
-        error_response.json.return_value = {
-            "error": {
-                "code": 400,
-                "message": "Invalid request",
-                "status": "INVALID_ARGUMENT",
-            }
-        }
+        error_response = httpx.Response(
+            400,
+            json={
+                "error": {
+                    "code": 400,
+                    "message": "Invalid request",
+                    "status": "INVALID_ARGUMENT",
+                }
+            },
+        )
 
         with patch.object(
             client, "_get_headers", new_callable=AsyncMock
@@ -327,15 +1167,16 @@ class TestGoogleCalendarClient:
         """サーバーエラー（500）が正しく処理されることを確認."""
         client = GoogleCalendarClient(mock_config, rate_limiter=rate_limiter)
 
-        error_response = MagicMock()
-        error_response.status_code = 500
-        error_response.json.return_value = {
-            "error": {
-                "code": 500,
-                "message": "Internal Server Error",
-                "status": "INTERNAL",
-            }
-        }
+        error_response = httpx.Response(
+            500,
+            json={
+                "error": {
+                    "code": 500,
+                    "message": "Internal Server Error",
+                    "status": "INTERNAL",
+                }
+            },
+        )
 
         with patch.object(
             client, "_get_headers", new_callable=AsyncMock
@@ -351,6 +1192,35 @@ class TestGoogleCalendarClient:
 
         await client.close()
 
+    @pytest.mark.asyncio
+    async def test_request_server_error_retries_with_backoff(
+        self, mock_config: GoogleCalendarConfig, rate_limiter
+    ) -> None:
+        """サーバーエラー時にバックオフ待機を挟んでリトライすることを確認."""
+        client = GoogleCalendarClient(mock_config, rate_limiter=rate_limiter)
+
+        error_response = httpx.Response(503, json={"error": {"code": 503, "message": "Unavailable"}})
+        success_response = httpx.Response(200, json={"items": []})
+
+        with patch.object(
+            client, "_get_headers", new_callable=AsyncMock
+        ) as mock_get_headers, patch.object(
+            client.client, "request", new_callable=AsyncMock
+        ) as mock_request, patch(
+            "src.calendar_client.asyncio.sleep", new_callable=AsyncMock
+        ) as mock_sleep:
+            mock_get_headers.return_value = {"Authorization": "Bearer test-token"}
+            mock_request.side_effect = [error_response, success_response]
+
+            result = await client._request("GET", "calendars/primary/events", max_retries=3)
+
+            assert result == {"items": []}
+            assert mock_request.call_count == 2
+            mock_sleep.assert_awaited_once()
+            assert 0.05 <= mock_sleep.call_args.args[0] <= 0.1
+
+        await client.close()
+
     @pytest.mark.asyncio
     async def test_request_timeout_error(
         self, mock_config: GoogleCalendarConfig, rate_limiter
@@ -371,6 +1241,34 @@ class TestGoogleCalendarClient:
 
         await client.close()
 
+    @pytest.mark.asyncio
+    async def test_request_timeout_retry_releases_exception(
+        self, mock_config: GoogleCalendarConfig, rate_limiter
+    ) -> None:
+        """タイムアウト後のバックオフ待機が例外ハンドラーの外で行われることを確認."""
+        client = GoogleCalendarClient(mock_config, rate_limiter=rate_limiter)
+        handled_during_sleep = []
+
+        async def fake_sleep(delay: float) -> None:
+            handled_during_sleep.append(sys.exc_info()[1])
+
+        with patch.object(
+            client, "_get_headers", new_callable=AsyncMock
+        ) as mock_get_headers, patch.object(
+            client.client, "request", new_callable=AsyncMock
+        ) as mock_request, patch("src.calendar_client.asyncio.sleep", side_effect=fake_sleep):
+            mock_get_headers.return_value = {"Authorization": "Bearer test-token"}
+            mock_request.side_effect = [
+                httpx.TimeoutException("Request timeout"),
+                httpx.Response(200, json={"items": []}),
+            ]
+
+            result = await client._request("GET", "calendars/primary/events", max_retries=3)
+
+        assert result == {"items": []}
+        assert handled_during_sleep == [None]
+        await client.close()
+
     @pytest.mark.asyncio
     async def test_request_network_error(
         self, mock_config: GoogleCalendarConfig, rate_limiter
@@ -391,6 +1289,43 @@ class TestGoogleCalendarClient:
 
         await client.close()
 
+    @pytest.mark.asyncio
+    async def test_handle_error_response_unmapped_status(
+        self, mock_config: GoogleCalendarConfig, rate_limiter
+    ) -> None:
+        """対応表にないステータスコードと429が適切な例外になることを確認."""
+        client = GoogleCalendarClient(mock_config, rate_limiter=rate_limiter)
+
+        conflict = httpx.Response(409, json={"error": {"code": 409, "message": "Conflict"}})
+        with pytest.raises(GoogleServerError, match="APIエラー: Conflict"):
+            client._handle_error_response(conflict)
+
+        rate_limited = httpx.Response(
+            429,
+            json={"error": {"code": 429, "message": "Too Many Requests"}},
+            headers={"Retry-After": "7"},
+        )
+        with pytest.raises(GoogleRateLimitError) as exc_info:
+            client._handle_error_response(rate_limited)
+        assert exc_info.value.details["retry_after"] == 7
+
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_handle_error_response_non_json_body(
+        self, mock_config: GoogleCalendarConfig, rate_limiter
+    ) -> None:
+        """JSONでないエラーボディの場合は先頭部分を含むDataParsingErrorになることを確認."""
+        client = GoogleCalendarClient(mock_config, rate_limiter=rate_limiter)
+        html_error = httpx.Response(
+            502, content="<html>Bad Gateway ゲートウェイエラー</html>".encode()
+        )
+
+        with pytest.raises(DataParsingError, match="Bad Gateway ゲートウェイエラー"):
+            client._handle_error_response(html_error)
+
+        await client.close()
+
     @pytest.mark.asyncio
     async def test_parse_event_success(
         self,
@@ -426,6 +1361,42 @@ class TestGoogleCalendarClient:
 
         await client.close()
 
+    @pytest.mark.asyncio
+    async def test_parse_event_json_invalid_data(
+        self, mock_config: GoogleCalendarConfig, rate_limiter
+    ) -> None:
+        """不正なJSONバイト列の場合にDataParsingErrorが発生することを確認."""
+        client = GoogleCalendarClient(mock_config, rate_limiter=rate_limiter)
+
+        with pytest.raises(DataParsingError):
+            client._parse_event_json(b'{"id": "event123"}')
+
+        with pytest.raises(DataParsingError):
+            client._parse_event_json(b"not json")
+
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_event_to_api_json_matches_format(
+        self,
+        mock_config: GoogleCalendarConfig,
+        rate_limiter,
+        sample_event: CalendarEvent,
+    ) -> None:
+        """JSONバイト列への直接変換が辞書形式と同じ内容になることを確認."""
+        client = GoogleCalendarClient(mock_config, rate_limiter=rate_limiter)
+
+        api_json = client._event_to_api_json(sample_event)
+
+        expected = sample_event.model_dump(
+            mode="json", by_alias=True, exclude_none=True, exclude_unset=True
+        )
+        expected.pop("id", None)
+        assert json.loads(api_json) == expected
+        assert "id" not in json.loads(api_json)
+
+        await client.close()
+
     @pytest.mark.asyncio
     async def test_event_to_api_format(
         self,
@@ -444,3 +1415,30 @@ class TestGoogleCalendarClient:
         assert "start" in api_format
         assert "end" in api_format
         await client.close()
+
+
+class TestRetryDelay:
+    """リトライ待機時間の計算のテスト."""
+
+    def test_backoff_delay_has_jitter_and_cap(self) -> None:
+        """指数バックオフがジッター範囲内に収まり、上限を超えないことを確認."""
+        for attempt in range(4):
+            base = 0.1 * 2**attempt
+            delay = _backoff_delay(attempt)
+            assert base * 0.5 <= delay <= base
+
+        assert _backoff_delay(20) <= 30.0
+
+    def test_retry_after_header_with_jitter(self) -> None:
+        """Retry-Afterの秒数に±20%のジッターが加わることを確認."""
+        response = httpx.Response(429, headers={"Retry-After": "10"})
+        for _ in range(20):
+            assert 8.0 <= _retry_after_delay(response, 0) <= 12.0
+
+    def test_retry_after_fallback_to_backoff(self) -> None:
+        """Retry-Afterがない・秒数でない場合は指数バックオフになることを確認."""
+        missing = httpx.Response(429)
+        http_date = httpx.Response(429, headers={"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"})
+
+        assert 0.2 <= _retry_after_delay(missing, 2) <= 0.4
+        assert 0.2 <= _retry_after_delay(http_date, 2) <= 0.4
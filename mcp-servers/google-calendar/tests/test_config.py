@@ -6,7 +6,7 @@ GoogleCalendarConfigの設定読み込みとバリデーションをテストし
 import pytest
 from pydantic import ValidationError
 
-from src.config import GoogleCalendarConfig
+from src.config import GoogleCalendarConfig, get_config
 
 
 class TestGoogleCalendarConfig:
@@ -51,6 +51,18 @@ class TestGoogleCalendarConfig:
         assert creds["refresh_token"] == mock_config.google_refresh_token
         assert creds["token_uri"] == mock_config.google_token_uri
 
+    def test_get_token_cache_path(self) -> None:
+        """トークンキャッシュのパスがホームディレクトリ基準で展開されることを確認."""
+        config = GoogleCalendarConfig(
+            google_client_id="test-id",
+            google_client_secret="test-secret",
+            google_refresh_token="test-token",
+        )
+        cache_path = config.get_token_cache_path()
+        assert cache_path.is_absolute()
+        assert "~" not in str(cache_path)
+        assert cache_path.name == "google_token.json"
+
     def test_missing_required_fields(self) -> None:
         """必須フィールドが欠けている場合にエラーが発生することを確認."""
         # google_client_idが欠けている
@@ -118,3 +130,20 @@ class TestGoogleCalendarConfig:
         )
         # 設定が正常に作成されることを確認
         assert config.google_client_id == "test-id"
+
+
+class TestGetConfig:
+    """get_config関数のテスト."""
+
+    def test_returns_cached_instance(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """設定が1回だけ読み込まれ、同じインスタンスが返されることを確認."""
+        monkeypatch.setenv("GOOGLE_CLIENT_ID", "env-client-id")
+        monkeypatch.setenv("GOOGLE_CLIENT_SECRET", "env-client-secret")
+        monkeypatch.setenv("GOOGLE_REFRESH_TOKEN", "env-refresh-token")
+        get_config.cache_clear()
+        try:
+            config = get_config()
+            assert config.google_client_id == "env-client-id"
+            assert get_config() is config
+        finally:
+            get_config.cache_clear()
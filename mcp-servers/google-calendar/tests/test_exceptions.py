@@ -3,6 +3,9 @@
 カスタム例外クラスの動作をテストします。
 """
 
+import copy
+import pickle
+
 import pytest
 
 from src.exceptions import (
@@ -55,6 +58,34 @@ class TestGoogleCalendarMCPError:
         assert "ValueError" in error_str
         assert "Original error" in error_str
 
+    def test_slots_preserved_on_copy_and_pickle(self) -> None:
+        """スロットに保持した属性がcopy/pickleで引き継がれることを確認."""
+        original = ValueError("boom")
+        error = GooglePermissionError(
+            resource_type="calendar",
+            resource_id="cal-123",
+            details={"request_id": "req-1"},
+            original_error=original,
+        )
+
+        copied = copy.copy(error)
+        restored = pickle.loads(pickle.dumps(error))
+
+        for clone in (copied, restored):
+            assert type(clone) is GooglePermissionError
+            assert clone.message == error.message
+            assert clone.details == error.details
+            assert clone.status_code == 403
+            assert clone.error_code == "forbidden"
+        assert copied.original_error is original
+        assert str(restored.original_error) == "boom"
+
+    def test_arbitrary_attributes_still_allowed(self) -> None:
+        """スロット化後も任意の属性を追加できることを確認."""
+        error = GoogleRateLimitError(retry_after=10)
+        error.note = "added later"
+        assert error.note == "added later"
+
 
 class TestGoogleCalendarAPIError:
     """GoogleCalendarAPIErrorのテスト."""
@@ -77,6 +108,22 @@ class TestGoogleCalendarAPIError:
         assert error.status_code is None
         assert error.error_code is None
 
+    def test_caller_details_not_mutated(self) -> None:
+        """呼び出し元から渡した詳細情報の辞書が変更されないことを確認."""
+        shared = {"request_id": "req-1"}
+        first = GoogleRateLimitError(retry_after=30, details=shared)
+        second = GooglePermissionError(resource_type="calendar", details=shared)
+
+        assert shared == {"request_id": "req-1"}
+        assert first.details == {
+            "request_id": "req-1",
+            "retry_after": 30,
+            "status_code": 429,
+            "error_code": "rate_limited",
+        }
+        assert "retry_after" not in second.details
+        assert second.details["resource_type"] == "calendar"
+
 
 class TestGoogleAuthenticationError:
     """GoogleAuthenticationErrorのテスト."""
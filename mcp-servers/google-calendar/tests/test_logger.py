@@ -0,0 +1,300 @@
+"""Tests for logger module.
+
+構造化ログのフォーマットとリクエストトレーシングをテストします。
+"""
+
+import io
+import json
+import logging
+import sys
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from src.logger import ContextLogger, RequestLogger, StructuredFormatter, setup_logger
+
+
+def _make_record(created: float, msg: str = "hello", args: tuple = ()) -> logging.LogRecord:
+    """テスト用のログレコードを作成."""
+    record = logging.LogRecord(
+        name="test",
+        level=logging.INFO,
+        pathname=__file__,
+        lineno=1,
+        msg=msg,
+        args=args,
+        exc_info=None,
+    )
+    record.created = created
+    return record
+
+
+class TestStructuredFormatter:
+    """StructuredFormatterクラスのテスト."""
+
+    def test_timestamp_matches_datetime_isoformat(self) -> None:
+        """タイムスタンプがdatetimeによるISO 8601表記と一致することを確認."""
+        formatter = StructuredFormatter()
+
+        # 丸めで次の秒に繰り上がるケースも含める
+        for created in (1760000000.25, 1760000000.0, 1760000000.9999997):
+            assert formatter._format_timestamp(created) == datetime.fromtimestamp(
+                created
+            ).isoformat(timespec="microseconds")
+
+    def test_timestamp_cache_reused_within_same_second(self) -> None:
+        """同じ秒のログでは秒単位の文字列が再利用されることを確認."""
+        formatter = StructuredFormatter()
+
+        first = formatter._format_timestamp(1760000000.1)
+        cached = formatter._cached_timestamp
+        second = formatter._format_timestamp(1760000000.9)
+
+        assert formatter._cached_timestamp is cached
+        assert first[:19] == second[:19]
+        assert first.endswith(".100000")
+        assert second.endswith(".900000")
+
+        formatter._format_timestamp(1760000001.0)
+        assert formatter._cached_timestamp[0] == 1760000001
+
+    def test_plain_and_json_use_same_timestamp(self) -> None:
+        """通常形式とJSON形式で同じタイムスタンプが出力されることを確認."""
+        record = _make_record(1760000000.5)
+        plain = StructuredFormatter(use_json=False).format(record)
+        payload = json.loads(StructuredFormatter(use_json=True).format(record))
+
+        assert plain.startswith(payload["timestamp"] + " - test - INFO - hello")
+
+    def test_json_output_keeps_non_ascii_and_extra_fields(self) -> None:
+        """JSON形式で日本語がエスケープされず、追加フィールドが出力されることを確認."""
+        record = _make_record(1760000000.5, msg="予定を取得しました")
+        record.extra_fields = {"calendar_id": "primary", "count": 3, 1: "non-str key"}
+
+        output = StructuredFormatter(use_json=True).format(record)
+        payload = json.loads(output)
+
+        assert "予定を取得しました" in output
+        assert payload["message"] == "予定を取得しました"
+        assert payload["calendar_id"] == "primary"
+        assert payload["count"] == 3
+        assert payload["1"] == "non-str key"
+
+    def test_json_output_stringifies_unknown_types(self) -> None:
+        """シリアライズできない値が文字列化されて出力されることを確認."""
+        record = _make_record(1760000000.5)
+        record.extra_fields = {"error": ValueError("boom")}
+
+        payload = json.loads(StructuredFormatter(use_json=True).format(record))
+
+        assert payload["error"] == "boom"
+
+    def test_message_formatting_with_and_without_args(self) -> None:
+        """引数の有無にかかわらずメッセージが正しく整形されることを確認."""
+        formatter = StructuredFormatter(use_json=True)
+
+        with_args = _make_record(1760000000.5, msg="Retrying in %.1f seconds", args=(1.5,))
+        no_args = _make_record(1760000000.5, msg="100% done")
+        non_str = _make_record(1760000000.5, msg=ValueError("boom"))
+
+        assert json.loads(formatter.format(with_args))["message"] == "Retrying in 1.5 seconds"
+        assert json.loads(formatter.format(no_args))["message"] == "100% done"
+        assert json.loads(formatter.format(non_str))["message"] == "boom"
+
+    def test_exception_text_formatted_once(self) -> None:
+        """同じレコードを複数のフォーマッターで出力しても例外の整形が1回であることを確認."""
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            record = _make_record(1760000000.5)
+            record.exc_info = sys.exc_info()
+
+        plain_formatter = StructuredFormatter(use_json=False)
+        json_formatter = StructuredFormatter(use_json=True)
+        with patch.object(
+            StructuredFormatter, "formatException", autospec=True, return_value="Traceback: boom"
+        ) as mock_format_exception:
+            plain = plain_formatter.format(record)
+            payload = json.loads(json_formatter.format(record))
+
+        mock_format_exception.assert_called_once()
+        assert plain.endswith("\nTraceback: boom")
+        assert payload["exception"] == "Traceback: boom"
+
+
+class TestContextLogger:
+    """ContextLoggerクラスのテスト."""
+
+    def test_process_without_extra_reuses_context(self) -> None:
+        """追加フィールドがない場合はコンテキストの辞書がそのまま使われることを確認."""
+        context = {"request_id": "req-123"}
+        adapter = ContextLogger(logging.getLogger("test"), context)
+
+        _, kwargs = adapter.process("message", {})
+
+        assert kwargs["extra"]["extra_fields"] is context
+
+    def test_process_merges_call_fields(self) -> None:
+        """呼び出しごとの追加フィールドがコンテキストより優先してマージされることを確認."""
+        context = {"request_id": "req-123", "user": "a"}
+        adapter = ContextLogger(logging.getLogger("test"), context)
+
+        _, kwargs = adapter.process(
+            "message", {"extra": {"extra_fields": {"user": "b", "count": 1}}}
+        )
+
+        assert kwargs["extra"]["extra_fields"] == {"request_id": "req-123", "user": "b", "count": 1}
+        assert context == {"request_id": "req-123", "user": "a"}
+
+
+class TestRequestLogger:
+    """RequestLoggerクラスのテスト."""
+
+    def test_mask_sensitive_headers(self) -> None:
+        """機密ヘッダーのみが大文字小文字を区別せずにマスクされることを確認."""
+        request_logger = RequestLogger(logging.getLogger("test"))
+
+        masked = request_logger._mask_sensitive_headers(
+            {
+                "Authorization": "Bearer secret-token",
+                "X-Goog-Api-Key": "abc",
+                "Content-Type": "application/json",
+            }
+        )
+
+        assert masked == {
+            "Authorization": "Bear...",
+            "X-Goog-Api-Key": "***",
+            "Content-Type": "application/json",
+        }
+
+    def test_log_request_skipped_when_debug_disabled(self) -> None:
+        """DEBUGが無効な場合はヘッダーのマスクやログ出力を行わないことを確認."""
+        base_logger = logging.getLogger("test.request.disabled")
+        base_logger.setLevel(logging.INFO)
+        request_logger = RequestLogger(base_logger)
+
+        with patch.object(
+            request_logger, "_mask_sensitive_headers"
+        ) as mock_mask, patch.object(base_logger, "debug") as mock_debug:
+            start = request_logger.log_request(
+                "GET", "https://example.com", headers={"Authorization": "Bearer x"}
+            )
+
+        assert isinstance(start, float)
+        mock_mask.assert_not_called()
+        mock_debug.assert_not_called()
+
+    def test_log_response_respects_level(self) -> None:
+        """ログレベルが有効な場合のみレスポンスが記録されることを確認."""
+        base_logger = logging.getLogger("test.response.level")
+        base_logger.setLevel(logging.WARNING)
+        request_logger = RequestLogger(base_logger)
+
+        with patch.object(base_logger, "log") as mock_log:
+            start = request_logger.log_request("GET", "https://example.com")
+            request_logger.log_response(start, 200, body={"items": []})
+            mock_log.assert_not_called()
+
+            request_logger.log_response(start, 503)
+            mock_log.assert_called_once()
+            assert mock_log.call_args.args[0] == logging.ERROR
+
+    def test_request_and_response_messages(self, caplog: pytest.LogCaptureFixture) -> None:
+        """リクエスト・レスポンスのメッセージが出力時に整形されることを確認."""
+        base_logger = logging.getLogger("test.request.messages")
+        base_logger.setLevel(logging.DEBUG)
+        request_logger = RequestLogger(base_logger)
+
+        with caplog.at_level(logging.DEBUG, logger="test.request.messages"):
+            start = request_logger.log_request("GET", "https://example.com/events")
+            request_logger.log_response(start, 200)
+
+        assert [record.getMessage() for record in caplog.records] == [
+            "Request: GET https://example.com/events",
+            f"Response: 200 ({caplog.records[1].args[1]:.0f}ms)",
+        ]
+        assert caplog.records[0].args == ("GET", "https://example.com/events")
+
+    def test_truncate_body_short_dict_returned_as_is(self) -> None:
+        """短い辞書はそのまま返されることを確認."""
+        request_logger = RequestLogger(logging.getLogger("test"))
+        body = {"summary": "会議", "attendees": ["a@example.com"]}
+
+        assert request_logger._truncate_body(body) is body
+
+    def test_truncate_body_counts_characters_not_bytes(self) -> None:
+        """マルチバイト文字を含むボディが文字数で判定・切り詰めされることを確認."""
+        request_logger = RequestLogger(logging.getLogger("test"))
+        # JSONで14文字（UTF-8では30バイト超）
+        short = {"s": "会議会議会議会議"}
+        long = {"s": "会" * 200}
+
+        assert request_logger._truncate_body(short, max_length=20) is short
+        truncated = request_logger._truncate_body(long, max_length=20)
+        assert truncated == '{"s":"' + "会" * 14 + "..."
+
+    def test_truncate_body_long_dict_truncated(self) -> None:
+        """長い辞書はJSON文字列に変換して切り詰められることを確認."""
+        request_logger = RequestLogger(logging.getLogger("test"))
+        body = {f"key{i}": "x" * 50 for i in range(20)}
+
+        truncated = request_logger._truncate_body(body, max_length=100)
+
+        assert isinstance(truncated, str)
+        assert len(truncated) == 103
+        assert truncated.startswith('{"key0":"xxx')
+        assert truncated.endswith("...")
+
+    def test_log_response_level_by_status_and_elapsed(self) -> None:
+        """ステータスコード、エラー、実行時間に応じたログレベルを確認."""
+        base_logger = logging.getLogger("test.response.table")
+        base_logger.setLevel(logging.DEBUG)
+        request_logger = RequestLogger(base_logger)
+
+        cases = [
+            (200, 0.0, None, logging.DEBUG),
+            (200, 6.0, None, logging.WARNING),
+            (404, 0.0, None, logging.WARNING),
+            (503, 0.0, None, logging.ERROR),
+            (200, 0.0, RuntimeError("boom"), logging.ERROR),
+        ]
+        for status_code, elapsed, error, expected in cases:
+            with patch("src.logger.time.monotonic", return_value=100.0 + elapsed), patch.object(
+                base_logger, "log"
+            ) as mock_log:
+                request_logger.log_response(100.0, status_code, error=error)
+
+            assert mock_log.call_args.args[0] == expected
+
+
+class TestSetupLogger:
+    """setup_logger関数のテスト."""
+
+    def test_repeated_calls_reuse_handler(self) -> None:
+        """同じ設定で呼び出した場合はハンドラーが再利用されることを確認."""
+        stream = io.StringIO()
+        logger = setup_logger("test.setup.reuse", stream=stream)
+        handler = logger.handlers[0]
+
+        assert setup_logger("test.setup.reuse", stream=stream) is logger
+        assert logger.handlers == [handler]
+
+    def test_changed_settings_replace_own_handler_only(self) -> None:
+        """設定変更時は自身のハンドラーのみ置き換え、利用者のハンドラーは残すことを確認."""
+        stream = io.StringIO()
+        logger = setup_logger("test.setup.replace", stream=stream)
+        old_handler = logger.handlers[0]
+        user_handler = logging.NullHandler()
+        logger.addHandler(user_handler)
+
+        setup_logger("test.setup.replace", level="DEBUG", use_json=True, stream=stream)
+
+        assert old_handler not in logger.handlers
+        assert user_handler in logger.handlers
+        assert len(logger.handlers) == 2
+        assert logger.level == logging.DEBUG
+
+        logger.info("hello")
+        assert json.loads(stream.getvalue().splitlines()[-1])["message"] == "hello"
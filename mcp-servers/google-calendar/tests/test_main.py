@@ -3,8 +3,8 @@
 MCPツールハンドラーのヘルパー関数をテストします。
 """
 
-from datetime import datetime
-from unittest.mock import MagicMock
+from datetime import date, datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
 import sys
 
 import pytest
@@ -16,13 +16,19 @@ sys.modules['mcp.server.stdio'] = MagicMock()
 sys.modules['mcp.types'] = MagicMock()
 
 from src.main import (
+    format_calendar_summary,
     format_event_detail,
     format_event_summary,
     format_event_time,
     get_event_date,
+    handle_get_events,
+    handle_get_events_from_multiple_calendars,
+    handle_update_event,
     parse_datetime,
+    run,
 )
-from src.models import CalendarEvent, EventDateTime
+from src.exceptions import GooglePermissionError
+from src.models import Calendar, CalendarEvent, EventDateTime
 
 
 class TestParseDatetime:
@@ -46,6 +52,16 @@ class TestParseDatetime:
         assert dt.month == 2
         assert dt.day == 5
         assert dt.hour == 5
+        assert dt.utcoffset() == timedelta(0)
+
+    def test_parse_result_cached(self) -> None:
+        """同じ文字列のパース結果がキャッシュから返されることを確認."""
+        parse_datetime.cache_clear()
+        first = parse_datetime("2026-02-05T14:00:00+09:00")
+        second = parse_datetime("2026-02-05T14:00:00+09:00")
+
+        assert first is second
+        assert parse_datetime.cache_info().hits == 1
 
     def test_parse_invalid_format(self) -> None:
         """不正な形式の日時でValueErrorが発生することを確認."""
@@ -66,20 +82,224 @@ class TestGetEventDate:
 
     def test_get_date_from_all_day_event(self) -> None:
         """終日イベントから日付を取得できることを確認."""
+        now = datetime.now(timezone.utc)
         event = CalendarEvent(
             id="allday",
             start=EventDateTime(date="2026-02-10"),
             end=EventDateTime(date="2026-02-11"),
             status="confirmed",
             html_link="https://example.com",
-            created=datetime.utcnow(),
-            updated=datetime.utcnow(),
+            created=now,
+            updated=now,
         )
         event_date = get_event_date(event)
         assert event_date.year == 2026
         assert event_date.month == 2
         assert event_date.day == 10
 
+    def test_get_date_falls_back_to_today(self) -> None:
+        """開始日時・日付がない場合は今日の日付を返すことを確認."""
+        now = datetime.now(timezone.utc)
+        event = CalendarEvent(
+            id="nodate",
+            start=EventDateTime(),
+            end=EventDateTime(),
+            status="confirmed",
+            html_link="https://example.com",
+            created=now,
+            updated=now,
+        )
+        event_date = get_event_date(event)
+        assert type(event_date) is date
+        assert event_date == date.today()
+
+
+class TestHandleGetEvents:
+    """handle_get_events関数のテスト."""
+
+    @staticmethod
+    def _event(event_id: str, start: datetime) -> CalendarEvent:
+        """指定日時に開始するテスト用イベントを作成."""
+        return CalendarEvent(
+            id=event_id,
+            summary=event_id,
+            start=EventDateTime(date_time=start),
+            end=EventDateTime(date_time=start + timedelta(hours=1)),
+            status="confirmed",
+            html_link="https://example.com",
+            created=start,
+            updated=start,
+        )
+
+    @pytest.mark.asyncio
+    async def test_events_grouped_by_day(self, mock_config) -> None:
+        """イベントが今日・今週・それ以降に分類されて出力されることを確認."""
+        now = datetime.now().replace(hour=12, minute=0, second=0, microsecond=0)
+        events = [
+            self._event("past", now - timedelta(days=2)),
+            self._event("today", now),
+            self._event("this-week", now + timedelta(days=3)),
+            self._event("later", now + timedelta(days=30)),
+        ]
+        client = MagicMock()
+        client.list_events = AsyncMock(return_value=events)
+
+        with patch("src.main.calendar_client", client, create=True), patch(
+            "src.main.config", mock_config, create=True
+        ), patch("src.main.TextContent", side_effect=lambda **kwargs: kwargs):
+            result = await handle_get_events({})
+
+        text = result[0]["text"]
+        today_section, rest = text.split("【今週の予定】")
+        week_section, later_section = rest.split("【それ以降の予定】")
+        assert "today" in today_section
+        assert "this-week" in week_section
+        assert "past" in later_section
+        assert "later" in later_section
+
+
+class TestHandleGetEventsFromMultipleCalendars:
+    """handle_get_events_from_multiple_calendars関数のテスト."""
+
+    @pytest.mark.asyncio
+    async def test_batch_results_and_errors(self, mock_config) -> None:
+        """バッチで取得した予定とカレンダーごとのエラーが出力されることを確認."""
+        now = datetime.now().replace(hour=12, minute=0, second=0, microsecond=0)
+        event = TestHandleGetEvents._event("team-meeting", now)
+        client = MagicMock()
+        client.list_calendars = AsyncMock(
+            return_value=[
+                Calendar(id="team", summary="チーム", accessRole="writer"),
+                Calendar(id="private", summary="非公開", accessRole="reader"),
+            ]
+        )
+        client.batch_list_events = AsyncMock(
+            return_value=[
+                ("team", [event], None),
+                ("private", [], GooglePermissionError(message="権限エラー: Forbidden")),
+            ]
+        )
+
+        with patch("src.main.calendar_client", client, create=True), patch(
+            "src.main.config", mock_config, create=True
+        ), patch("src.main.TextContent", side_effect=lambda **kwargs: kwargs):
+            result = await handle_get_events_from_multiple_calendars(
+                {"max_results_per_calendar": 3}
+            )
+
+        client.batch_list_events.assert_called_once()
+        args, kwargs = client.batch_list_events.call_args
+        assert args == (["team", "private"],)
+        assert kwargs["max_results"] == 3
+        assert kwargs["fields"].startswith("items(")
+
+        text = result[0]["text"]
+        assert "（1/2カレンダー、全1件）" in text
+        assert "team-meeting" in text
+        assert "⚠️ 非公開: 権限エラー: Forbidden" in text
+
+    @pytest.mark.asyncio
+    async def test_events_sorted_across_calendars(self, mock_config) -> None:
+        """複数カレンダーの予定が日付順に並べ替えられて分類されることを確認."""
+        now = datetime.now().replace(hour=12, minute=0, second=0, microsecond=0)
+        client = MagicMock()
+        client.list_calendars = AsyncMock(return_value=[])
+        client.batch_list_events = AsyncMock(
+            return_value=[
+                ("a", [TestHandleGetEvents._event("later", now + timedelta(days=30))], None),
+                ("b", [TestHandleGetEvents._event("past", now - timedelta(days=2))], None),
+                ("c", [TestHandleGetEvents._event("today", now)], None),
+                ("d", [TestHandleGetEvents._event("week-end", now + timedelta(days=7))], None),
+                ("e", [TestHandleGetEvents._event("this-week", now + timedelta(days=1))], None),
+            ]
+        )
+
+        with patch("src.main.calendar_client", client, create=True), patch(
+            "src.main.config", mock_config, create=True
+        ), patch("src.main.TextContent", side_effect=lambda **kwargs: kwargs):
+            result = await handle_get_events_from_multiple_calendars(
+                {"calendar_ids": ["a", "b", "c", "d", "e"]}
+            )
+
+        text = result[0]["text"]
+        today_section, rest = text.split("【今週の予定】")
+        week_section, later_section = rest.split("【それ以降の予定】")
+        client.list_calendars.assert_called_once()
+        assert "📅 today [c]" in today_section
+        # 今週の範囲は7日後まで（境界を含む）
+        assert week_section.index("this-week [e]") < week_section.index("week-end [d]")
+        assert later_section.index("past [b]") < later_section.index("later [a]")
+
+
+    @pytest.mark.asyncio
+    async def test_skip_calendar_names(self, mock_config) -> None:
+        """IDが指定され名前が不要な場合はカレンダー一覧を取得しないことを確認."""
+        now = datetime.now().replace(hour=12, minute=0, second=0, microsecond=0)
+        client = MagicMock()
+        client.list_calendars = AsyncMock()
+        client.batch_list_events = AsyncMock(
+            return_value=[("team", [TestHandleGetEvents._event("standup", now)], None)]
+        )
+
+        with patch("src.main.calendar_client", client, create=True), patch(
+            "src.main.config", mock_config, create=True
+        ), patch("src.main.TextContent", side_effect=lambda **kwargs: kwargs):
+            result = await handle_get_events_from_multiple_calendars(
+                {"calendar_ids": ["team"], "include_calendar_names": False}
+            )
+
+        client.list_calendars.assert_not_called()
+        assert "📅 standup [team]" in result[0]["text"]
+
+
+class TestHandleUpdateEvent:
+    """handle_update_event関数のテスト."""
+
+    @pytest.mark.asyncio
+    async def test_updates_built_from_given_fields(
+        self, mock_config, sample_event: CalendarEvent
+    ) -> None:
+        """指定されたフィールドのみが更新データに含まれることを確認."""
+        client = MagicMock()
+        client.update_event = AsyncMock(return_value=sample_event)
+
+        with patch("src.main.calendar_client", client, create=True), patch(
+            "src.main.config", mock_config, create=True
+        ), patch("src.main.TextContent", side_effect=lambda **kwargs: kwargs):
+            result = await handle_update_event(
+                {
+                    "event_id": "event123",
+                    "summary": "",
+                    "start_time": "2026-02-05T10:00:00+09:00",
+                    "location": "",
+                }
+            )
+
+        assert result[0]["text"].startswith("予定を更新しました。")
+        updates = client.update_event.call_args.kwargs["updates"]
+        # 空のタイトルは無視し、空の場所は削除として送信する
+        assert updates == {
+            "start": {
+                "dateTime": "2026-02-05T10:00:00+09:00",
+                "timeZone": mock_config.google_calendar_timezone,
+            },
+            "location": "",
+        }
+
+    @pytest.mark.asyncio
+    async def test_no_updates(self, mock_config) -> None:
+        """更新内容がない場合はエラーメッセージを返すことを確認."""
+        client = MagicMock()
+        client.update_event = AsyncMock()
+
+        with patch("src.main.calendar_client", client, create=True), patch(
+            "src.main.config", mock_config, create=True
+        ), patch("src.main.TextContent", side_effect=lambda **kwargs: kwargs):
+            result = await handle_update_event({"event_id": "event123", "summary": ""})
+
+        assert result[0]["text"] == "エラー: 更新する内容が指定されていません。"
+        client.update_event.assert_not_called()
+
 
 class TestFormatEventTime:
     """format_event_time関数のテスト."""
@@ -105,6 +325,50 @@ class TestFormatEventTime:
         formatted = format_event_time(event_dt)
         assert "日時不明" in formatted
 
+    def test_same_instant_different_offsets(self) -> None:
+        """同じ時刻でもタイムゾーンが異なれば、それぞれの現地時刻で表示されることを確認."""
+        tokyo = datetime(2026, 2, 5, 14, 30, tzinfo=timezone(timedelta(hours=9)))
+        utc = tokyo.astimezone(timezone.utc)
+
+        assert format_event_time(EventDateTime(date_time=tokyo)) == "2026-02-05 14:30"
+        assert format_event_time(EventDateTime(date_time=utc)) == "2026-02-05 05:30"
+
+    def test_seconds_are_truncated(self) -> None:
+        """秒・マイクロ秒は切り捨てられ、UTCオフセットは表示されないことを確認."""
+        event_dt = EventDateTime(
+            date_time=datetime(2026, 2, 5, 9, 5, 59, 999999, tzinfo=timezone(timedelta(hours=-5)))
+        )
+        assert format_event_time(event_dt) == "2026-02-05 09:05"
+
+
+class TestFormatCalendarSummary:
+    """format_calendar_summary関数のテスト."""
+
+    def test_format_primary_calendar(self) -> None:
+        """プライマリカレンダーの概要が全項目付きでフォーマットされることを確認."""
+        calendar = Calendar(
+            id="primary@example.com",
+            summary="メイン",
+            primary=True,
+            timeZone="Asia/Tokyo",
+            accessRole="owner",
+            description="あ" * 60,
+        )
+        assert format_calendar_summary(calendar) == (
+            "⭐ 📅 メイン\n"
+            "   - ID: primary@example.com\n"
+            "   - アクセス権限: オーナー\n"
+            "   - タイムゾーン: Asia/Tokyo\n"
+            f"   - 説明: {'あ' * 50}...\n"
+        )
+
+    def test_format_minimal_calendar(self) -> None:
+        """省略可能な項目がないカレンダーでは該当行が出力されないことを確認."""
+        calendar = Calendar(id="shared", summary="共有", accessRole="customRole")
+        assert format_calendar_summary(calendar) == (
+            "📅 共有\n   - ID: shared\n   - アクセス権限: customRole\n"
+        )
+
 
 class TestFormatEventSummary:
     """format_event_summary関数のテスト."""
@@ -118,14 +382,15 @@ class TestFormatEventSummary:
 
     def test_format_summary_without_title(self) -> None:
         """タイトルがないイベントの概要をフォーマットできることを確認."""
+        now = datetime.now(timezone.utc)
         event = CalendarEvent(
             id="notitle",
             start=EventDateTime(date="2026-02-10"),
             end=EventDateTime(date="2026-02-11"),
             status="confirmed",
             html_link="https://example.com",
-            created=datetime.utcnow(),
-            updated=datetime.utcnow(),
+            created=now,
+            updated=now,
         )
         summary = format_event_summary(event)
         assert "タイトルなし" in summary
@@ -145,15 +410,40 @@ class TestFormatEventDetail:
 
     def test_format_detail_minimal_event(self) -> None:
         """最小限のフィールドを持つイベント詳細をフォーマットできることを確認."""
+        now = datetime.now(timezone.utc)
         event = CalendarEvent(
             id="minimal",
             start=EventDateTime(date="2026-02-10"),
             end=EventDateTime(date="2026-02-11"),
             status="confirmed",
             html_link="https://example.com",
-            created=datetime.utcnow(),
-            updated=datetime.utcnow(),
+            created=now,
+            updated=now,
         )
         detail = format_event_detail(event)
         assert "タイトルなし" in detail
         assert "confirmed" in detail
+
+
+class TestRun:
+    """run関数のテスト."""
+
+    def test_run_uses_uvloop_when_available(self) -> None:
+        """uvloopが利用可能な場合はuvloop.runで起動することを確認."""
+        fake_uvloop = MagicMock()
+        with patch.dict(sys.modules, {"uvloop": fake_uvloop}), patch(
+            "src.main.main", new=MagicMock(return_value="main-coro")
+        ), patch("src.main.asyncio.run") as mock_asyncio_run:
+            run()
+
+        fake_uvloop.run.assert_called_once_with("main-coro")
+        mock_asyncio_run.assert_not_called()
+
+    def test_run_falls_back_to_asyncio(self) -> None:
+        """uvloopがない場合は標準のasyncio.runで起動することを確認."""
+        with patch.dict(sys.modules, {"uvloop": None}), patch(
+            "src.main.main", new=MagicMock(return_value="main-coro")
+        ), patch("src.main.asyncio.run") as mock_asyncio_run:
+            run()
+
+        mock_asyncio_run.assert_called_once_with("main-coro")
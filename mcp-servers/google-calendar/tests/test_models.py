@@ -3,7 +3,7 @@
 Pydanticモデルのバリデーションとシリアライゼーションをテストします。
 """
 
-from datetime import datetime
+from datetime import date, datetime
 
 import pytest
 from pydantic import ValidationError
@@ -198,6 +198,23 @@ class TestCalendarEvent:
         assert "hangout_link" not in dumped
         assert "recurrence" in dumped  # default_factory=listなので含まれる
 
+    def test_start_date(self, sample_event: CalendarEvent) -> None:
+        """開始日が時刻指定・終日イベントの両方で取得でき、キャッシュされることを確認."""
+        assert sample_event.start_date == date(2026, 2, 5)
+
+        all_day = CalendarEvent(
+            id="all-day",
+            start=EventDateTime(date="2026-02-10"),
+            end=EventDateTime(date="2026-02-11"),
+            status=CalendarEventStatus.CONFIRMED,
+            html_link="https://example.com",
+            created=datetime(2026, 2, 1, 10, 0, 0),
+            updated=datetime(2026, 2, 1, 10, 0, 0),
+        )
+        assert all_day.start_date == date(2026, 2, 10)
+        assert all_day.start_date is all_day.start_date
+        assert "start_date" not in all_day.model_dump()
+
 
 class TestGoogleCalendarError:
     """GoogleCalendarErrorモデルのテスト."""
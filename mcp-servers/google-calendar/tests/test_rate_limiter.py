@@ -0,0 +1,82 @@
+"""Tests for rate_limiter module.
+
+Token Bucketアルゴリズムの動作を検証します。
+"""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.rate_limiter import RateLimiter
+
+
+class TestRateLimiter:
+    """RateLimiterクラスのテスト."""
+
+    @pytest.mark.asyncio
+    async def test_context_manager_fast_path(self) -> None:
+        """トークンが残っている場合はacquireを経由せずに消費されることを確認."""
+        limiter = RateLimiter(tokens_per_second=1.0, capacity=5)
+
+        with patch.object(limiter, "acquire", new_callable=AsyncMock) as mock_acquire:
+            async with limiter:
+                pass
+
+            mock_acquire.assert_not_called()
+
+        assert 3.5 <= limiter.get_available_tokens() <= 4.5
+
+    @pytest.mark.asyncio
+    async def test_context_manager_falls_back_when_empty(self) -> None:
+        """トークンが不足している場合は待機付きのacquireにフォールバックすることを確認."""
+        limiter = RateLimiter(tokens_per_second=20.0, capacity=2)
+        limiter.tokens = 0.0
+        limiter.last_update = time.monotonic()
+
+        start = time.monotonic()
+        async with limiter:
+            pass
+        elapsed = time.monotonic() - start
+
+        # 1トークンの補充に約0.05秒かかる
+        assert elapsed >= 0.04
+        assert limiter.get_available_tokens() < 1.0
+
+    @pytest.mark.asyncio
+    async def test_context_manager_respects_waiters(self) -> None:
+        """acquireで待機中のコルーチンがいる場合は高速パスを使わないことを確認."""
+        limiter = RateLimiter(tokens_per_second=1.0, capacity=5)
+
+        async with limiter._lock:
+            with patch.object(limiter, "acquire", new_callable=AsyncMock) as mock_acquire:
+                async with limiter:
+                    pass
+
+                mock_acquire.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_context_manager_does_not_barge_woken_waiter(self) -> None:
+        """起こされた待機中のコルーチンより先に新しい呼び出し元がトークンを取らないことを確認."""
+        limiter = RateLimiter(tokens_per_second=100.0, capacity=1)
+        limiter.tokens = 0.0
+        limiter.last_update = time.monotonic()
+        order: list[str] = []
+
+        async def first() -> None:
+            async with limiter:
+                order.append("first")
+            # firstの待機が終わってロックが解放された直後（secondは起こされたがまだ未実行）、
+            # トークンが補充された状態で再び取得しようとする
+            time.sleep(0.02)
+            async with limiter:
+                order.append("first-again")
+
+        async def second() -> None:
+            async with limiter:
+                order.append("second")
+
+        await asyncio.gather(first(), second())
+
+        assert order == ["first", "second", "first-again"]